@@ -0,0 +1,58 @@
+"""add_payment_search
+
+Revision ID: 0386bb39b208
+Revises: 8524781c775a
+Create Date: 2026-10-16 23:24:08.312799
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0386bb39b208"
+down_revision: Union[str, None] = "8524781c775a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "payments",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(receiver, '') || ' ' || "
+                "coalesce(description, '') || ' ' || coalesce(document_type, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_payments_search_vector",
+        "payments",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.create_index(
+        "ix_payments_receiver_trgm",
+        "payments",
+        ["receiver"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"receiver": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_receiver_trgm", table_name="payments")
+    op.drop_index("ix_payments_search_vector", table_name="payments")
+    op.drop_column("payments", "search_vector")
@@ -0,0 +1,34 @@
+"""add_properties_owner_id_index
+
+Revision ID: 0f7735097051
+Revises: cc8cbd38cf15
+Create Date: 2026-10-17 02:11:46.305128
+
+Indexes properties.owner_id for the ownership checks and owner-scoped
+property lookups. Built concurrently so it does not block writes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0f7735097051"
+down_revision: Union[str, None] = "cc8cbd38cf15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_properties_owner_id",
+            "properties",
+            ["owner_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_properties_owner_id", table_name="properties")
@@ -0,0 +1,158 @@
+"""add_payment_analytics
+
+Revision ID: 1542e4fb6ada
+Revises: 0386bb39b208
+Create Date: 2026-10-16 23:28:07.673396
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1542e4fb6ada"
+down_revision: Union[str, None] = "0386bb39b208"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payment_analytics",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("due_date", sa.Date(), nullable=False),
+        sa.Column("property_id", sa.Integer(), nullable=False),
+        sa.Column("document_type", sa.String(), nullable=False),
+        sa.Column("payment_count", sa.Integer(), nullable=False),
+        sa.Column("paid_count", sa.Integer(), nullable=False),
+        sa.Column("amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("paid_amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["property_id"], ["properties.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint(
+            "owner_id", "due_date", "property_id", "document_type"
+        ),
+    )
+    op.create_table(
+        "payment_analytics_dirty_months",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("property_id", sa.Integer(), nullable=False),
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint("owner_id", "property_id", "month"),
+    )
+
+    # Queue the months of the old and new rows of every payment write. One
+    # statement level trigger per event, as transition tables require; keys
+    # are inserted in order so concurrent writers lock them in the same order.
+    op.execute(
+        """
+        CREATE FUNCTION mark_payment_analytics_dirty() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO payment_analytics_dirty_months (owner_id, property_id, month)
+                SELECT DISTINCT owner_id, property_id, date_trunc('month', due_date)::date
+                FROM new_payments
+                WHERE owner_id IS NOT NULL AND property_id IS NOT NULL
+                ORDER BY 1, 2, 3
+                ON CONFLICT DO NOTHING;
+            ELSIF TG_OP = 'DELETE' THEN
+                INSERT INTO payment_analytics_dirty_months (owner_id, property_id, month)
+                SELECT DISTINCT owner_id, property_id, date_trunc('month', due_date)::date
+                FROM old_payments
+                WHERE owner_id IS NOT NULL AND property_id IS NOT NULL
+                ORDER BY 1, 2, 3
+                ON CONFLICT DO NOTHING;
+            ELSE
+                INSERT INTO payment_analytics_dirty_months (owner_id, property_id, month)
+                SELECT DISTINCT
+                    changed.owner_id,
+                    changed.property_id,
+                    date_trunc('month', changed.due_date)::date
+                FROM old_payments AS o
+                JOIN new_payments AS n ON n.id = o.id
+                CROSS JOIN LATERAL (
+                    VALUES
+                        (o.owner_id, o.property_id, o.due_date),
+                        (n.owner_id, n.property_id, n.due_date)
+                ) AS changed (owner_id, property_id, due_date)
+                WHERE (
+                    o.owner_id, o.property_id, o.due_date,
+                    o.document_type, o.gross_value, o.is_paid
+                ) IS DISTINCT FROM (
+                    n.owner_id, n.property_id, n.due_date,
+                    n.document_type, n.gross_value, n.is_paid
+                )
+                AND changed.owner_id IS NOT NULL
+                AND changed.property_id IS NOT NULL
+                ORDER BY 1, 2, 3
+                ON CONFLICT DO NOTHING;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER payments_analytics_insert AFTER INSERT ON payments
+        REFERENCING NEW TABLE AS new_payments
+        FOR EACH STATEMENT EXECUTE FUNCTION mark_payment_analytics_dirty()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER payments_analytics_update AFTER UPDATE ON payments
+        REFERENCING OLD TABLE AS old_payments NEW TABLE AS new_payments
+        FOR EACH STATEMENT EXECUTE FUNCTION mark_payment_analytics_dirty()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER payments_analytics_delete AFTER DELETE ON payments
+        REFERENCING OLD TABLE AS old_payments
+        FOR EACH STATEMENT EXECUTE FUNCTION mark_payment_analytics_dirty()
+        """
+    )
+
+    # Seed the rollup from the existing payments
+    op.execute(
+        """
+        INSERT INTO payment_analytics (
+            owner_id, due_date, property_id, document_type,
+            payment_count, paid_count, amount, paid_amount
+        )
+        SELECT
+            owner_id,
+            due_date,
+            property_id,
+            document_type,
+            count(*),
+            count(*) FILTER (WHERE is_paid),
+            sum(gross_value::numeric(14, 2)),
+            coalesce(sum(gross_value::numeric(14, 2)) FILTER (WHERE is_paid), 0)
+        FROM payments
+        WHERE owner_id IS NOT NULL AND property_id IS NOT NULL
+        GROUP BY owner_id, due_date, property_id, document_type
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER payments_analytics_delete ON payments")
+    op.execute("DROP TRIGGER payments_analytics_update ON payments")
+    op.execute("DROP TRIGGER payments_analytics_insert ON payments")
+    op.execute("DROP FUNCTION mark_payment_analytics_dirty()")
+    op.drop_table("payment_analytics_dirty_months")
+    op.drop_table("payment_analytics")
@@ -0,0 +1,97 @@
+"""add_payment_owner_and_property
+
+Revision ID: 6e62862371c6
+Revises: aeb1b9ad9bdb
+Create Date: 2026-10-16 16:02:33.781240
+
+Adds denormalized payments.owner_id and payments.property_id. The backfill
+runs in autocommitted batches of payment IDs with a short pause between
+them, so it does not hold long locks on a live database. The composite
+index is built concurrently for the same reason.
+"""
+
+import time
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6e62862371c6"
+down_revision: Union[str, None] = "aeb1b9ad9bdb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Payment IDs updated per backfill batch
+BATCH_SIZE = 5000
+# Pause between batches, in seconds
+BATCH_PAUSE = 0.2
+
+
+def upgrade() -> None:
+    op.add_column("payments", sa.Column("property_id", sa.Integer(), nullable=True))
+    op.add_column("payments", sa.Column("owner_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "payments_property_id_fkey",
+        "payments",
+        "properties",
+        ["property_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+    op.create_foreign_key(
+        "payments_owner_id_fkey",
+        "payments",
+        "users",
+        ["owner_id"],
+        ["id"],
+        ondelete="SET NULL",
+    )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        max_id = bind.execute(sa.text("SELECT max(id) FROM payments")).scalar() or 0
+
+        for start in range(0, max_id + 1, BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    """
+                    UPDATE payments
+                    SET property_id = units.property_id,
+                        owner_id = properties.owner_id
+                    FROM leases
+                    JOIN units ON leases.unit_id = units.id
+                    JOIN properties ON units.property_id = properties.id
+                    WHERE payments.lease_id = leases.id
+                      AND payments.id >= :start
+                      AND payments.id < :end
+                    """
+                ),
+                {"start": start, "end": start + BATCH_SIZE},
+            )
+            time.sleep(BATCH_PAUSE)
+
+        op.create_index(
+            "ix_payments_property_id",
+            "payments",
+            ["property_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_payments_owner_id_is_paid_due_date",
+            "payments",
+            ["owner_id", "is_paid", "due_date"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_owner_id_is_paid_due_date", table_name="payments")
+    op.drop_index("ix_payments_property_id", table_name="payments")
+    op.drop_constraint("payments_owner_id_fkey", "payments", type_="foreignkey")
+    op.drop_constraint("payments_property_id_fkey", "payments", type_="foreignkey")
+    op.drop_column("payments", "owner_id")
+    op.drop_column("payments", "property_id")
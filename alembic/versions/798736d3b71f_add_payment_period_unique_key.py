@@ -0,0 +1,55 @@
+"""add_payment_period_unique_key
+
+Revision ID: 798736d3b71f
+Revises: d65eb9de8a38
+Create Date: 2026-10-16 10:03:17.554102
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "798736d3b71f"
+down_revision: Union[str, None] = "d65eb9de8a38"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT count(*) FROM (
+                    SELECT 1 FROM payments
+                    WHERE lease_id IS NOT NULL
+                    GROUP BY lease_id, due_date, document_type
+                    HAVING count(*) > 1
+                ) AS duplicated
+                """
+            )
+        )
+        .scalar()
+    )
+    if duplicates:
+        raise RuntimeError(
+            f"Found {duplicates} duplicated (lease_id, due_date, document_type) "
+            "payment groups. Remove the duplicates before running this migration."
+        )
+
+    op.create_unique_constraint(
+        "uq_payment_lease_due_date_document_type",
+        "payments",
+        ["lease_id", "due_date", "document_type"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "uq_payment_lease_due_date_document_type", "payments", type_="unique"
+    )
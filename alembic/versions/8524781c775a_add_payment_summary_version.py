@@ -0,0 +1,41 @@
+"""add_payment_summary_version
+
+Revision ID: 8524781c775a
+Revises: 6e62862371c6
+Create Date: 2026-10-17 09:42:18.604731
+
+Numbers every payment summary write from a sequence. Caches of aging
+reports use the sum of these numbers as version: the latest updated_at is
+the start time of the writing transaction, so a transaction committing
+after a later-started one would leave it unchanged.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8524781c775a"
+down_revision: Union[str, None] = "6e62862371c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence("payment_summaries_version_seq")))
+    op.add_column(
+        "payment_summaries",
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('payment_summaries_version_seq')"),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("payment_summaries", "version")
+    op.execute(sa.schema.DropSequence(sa.Sequence("payment_summaries_version_seq")))
@@ -0,0 +1,103 @@
+"""add_payment_summaries
+
+Revision ID: 9fda88ab4ae2
+Revises: 798736d3b71f
+Create Date: 2026-10-16 14:36:08.402117
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9fda88ab4ae2"
+down_revision: Union[str, None] = "798736d3b71f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payment_summaries",
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("property_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "as_of_date",
+            sa.Date(),
+            server_default=sa.text("CURRENT_DATE"),
+            nullable=False,
+        ),
+        sa.Column("total_payments", sa.Integer(), nullable=False),
+        sa.Column("paid_count", sa.Integer(), nullable=False),
+        sa.Column("pending_count", sa.Integer(), nullable=False),
+        sa.Column("overdue_count", sa.Integer(), nullable=False),
+        sa.Column("total_amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("paid_amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("pending_amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column("overdue_amount", sa.Numeric(14, 2), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(
+            ["property_id"], ["properties.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("owner_id", "property_id"),
+    )
+
+    # Seed the summaries from the existing payments
+    op.execute(
+        """
+        INSERT INTO payment_summaries (
+            owner_id, property_id, as_of_date,
+            total_payments, paid_count, pending_count, overdue_count,
+            total_amount, paid_amount, pending_amount, overdue_amount
+        )
+        SELECT
+            properties.owner_id,
+            units.property_id,
+            CURRENT_DATE,
+            count(*),
+            count(*) FILTER (WHERE payments.is_paid),
+            count(*) FILTER (
+                WHERE NOT payments.is_paid AND payments.due_date >= CURRENT_DATE
+            ),
+            count(*) FILTER (
+                WHERE NOT payments.is_paid AND payments.due_date < CURRENT_DATE
+            ),
+            coalesce(sum(payments.gross_value::numeric(14, 2)), 0),
+            coalesce(
+                sum(payments.gross_value::numeric(14, 2))
+                FILTER (WHERE payments.is_paid),
+                0
+            ),
+            coalesce(
+                sum(payments.gross_value::numeric(14, 2)) FILTER (
+                    WHERE NOT payments.is_paid AND payments.due_date >= CURRENT_DATE
+                ),
+                0
+            ),
+            coalesce(
+                sum(payments.gross_value::numeric(14, 2)) FILTER (
+                    WHERE NOT payments.is_paid AND payments.due_date < CURRENT_DATE
+                ),
+                0
+            )
+        FROM payments
+        JOIN leases ON payments.lease_id = leases.id
+        JOIN units ON leases.unit_id = units.id
+        JOIN properties ON units.property_id = properties.id
+        WHERE properties.owner_id IS NOT NULL
+        GROUP BY properties.owner_id, units.property_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("payment_summaries")
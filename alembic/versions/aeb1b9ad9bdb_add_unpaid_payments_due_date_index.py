@@ -0,0 +1,33 @@
+"""add_unpaid_payments_due_date_index
+
+Revision ID: aeb1b9ad9bdb
+Revises: 9fda88ab4ae2
+Create Date: 2026-10-16 15:21:47.630915
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "aeb1b9ad9bdb"
+down_revision: Union[str, None] = "9fda88ab4ae2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_payments_unpaid_due_date",
+        "payments",
+        ["due_date", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_paid"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_unpaid_due_date", table_name="payments")
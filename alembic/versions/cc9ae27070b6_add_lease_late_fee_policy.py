@@ -0,0 +1,53 @@
+"""add_lease_late_fee_policy
+
+Revision ID: cc9ae27070b6
+Revises: 727c99296bfe
+Create Date: 2026-10-17 00:21:09.514207
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "cc9ae27070b6"
+down_revision: Union[str, None] = "727c99296bfe"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    late_fee_policy_enum = sa.Enum(
+        "NONE",
+        "STATUTORY_INTEREST",
+        "CONTRACTUAL_INTEREST",
+        "FLAT_FEE",
+        name="enumlatefeepolicy",
+    )
+    late_fee_policy_enum.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "leases",
+        sa.Column(
+            "late_fee_policy",
+            late_fee_policy_enum,
+            nullable=False,
+            server_default="STATUTORY_INTEREST",
+        ),
+    )
+    op.add_column("leases", sa.Column("interest_rate", sa.Float(), nullable=True))
+    op.add_column("leases", sa.Column("late_fee_amount", sa.Float(), nullable=True))
+    op.add_column(
+        "leases",
+        sa.Column("grace_days", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("leases", "grace_days")
+    op.drop_column("leases", "late_fee_amount")
+    op.drop_column("leases", "interest_rate")
+    op.drop_column("leases", "late_fee_policy")
+    sa.Enum(name="enumlatefeepolicy").drop(op.get_bind(), checkfirst=True)
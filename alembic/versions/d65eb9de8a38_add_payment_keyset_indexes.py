@@ -0,0 +1,37 @@
+"""add_payment_keyset_indexes
+
+Revision ID: d65eb9de8a38
+Revises: 7c63121eff9b
+Create Date: 2026-10-16 09:12:41.218304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d65eb9de8a38"
+down_revision: Union[str, None] = "7c63121eff9b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_payments_created_at_id",
+        "payments",
+        ["created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_payments_due_date_id",
+        "payments",
+        ["due_date", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payments_due_date_id", table_name="payments")
+    op.drop_index("ix_payments_created_at_id", table_name="payments")
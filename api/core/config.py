@@ -16,11 +16,47 @@ class Settings(BaseSettings):
     DATABASE_URL: str = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_NAME}"
     DEBUG: bool = True
 
-    JWT_SECRET: str = (
-        "b200e58d66b754c70d26dd488a2bce1e3d5ae5a64dfc80013948ea7199574a11"
-    )
-    JWT_ALGORITHM: str = "HS256"
-    JWT_EXPIRATION: int = 30
+    # Access tokens are signed with the newest private key in JWT_KEYS_DIR
+    # (RS256 or ES256) and verified with the JWKS, see api.core.signing_keys
+    JWT_ALGORITHM: str = "RS256"  # Algorithm of generated keys
+    JWT_KEYS_DIR: str = "keys/jwt"
+    JWT_KEY_GRACE_MINUTES: int = 60
+    JWT_KEYS_RELOAD_SECONDS: int = 60
+    # Minutes an access token is valid, clients renew it with the refresh token
+    JWT_EXPIRATION: int = 5
+    # Days a refresh token is valid, each refresh issues a new one
+    REFRESH_TOKEN_EXPIRATION_DAYS: int = 14
+    # Seconds a used refresh token is rejected without revoking its session,
+    # so concurrent refreshes from two tabs do not log the user out
+    REFRESH_TOKEN_REUSE_GRACE_SECONDS: int = 10
+    # Revoked sessions filter per process, see api.src.refresh_tokens.revocation
+    REVOCATION_REFRESH_SECONDS: int = 5
+    REVOCATION_REBUILD_SECONDS: int = 3600
+    REVOCATION_FILTER_ERROR_RATE: float = 0.001
+
+    # Password hashing, see api.core.passwords. Changing the scheme or cost
+    # rehashes each user's password on their next login. "argon2" (argon2id)
+    # needs the argon2-cffi package.
+    PASSWORD_HASH_SCHEME: str = "bcrypt"
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_COST: int = 65536
+    PASSWORD_ARGON2_PARALLELISM: int = 4
+    # Passwords hashed at once, further logins wait in a queue
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # Seconds a successful ownership check is reused per process, see
+    # api.src.ownership.service
+    OWNERSHIP_CACHE_SECONDS: int = 30
+
+    # Hours the outcome of a request with an Idempotency-Key is kept
+    IDEMPOTENCY_KEY_TTL_HOURS: int = 24
+    # Seconds a duplicate request waits for the first one to finish
+    IDEMPOTENCY_WAIT_SECONDS: int = 30
+
+    # Annual statutory interest for delay in percent (NBP reference rate
+    # + 5.5 pp), charged on overdue rent of leases with the default policy
+    STATUTORY_INTEREST_RATE: float = 11.25
 
     model_config = SettingsConfigDict(
         env_file=".env",
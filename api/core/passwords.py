@@ -0,0 +1,177 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, TypeVar
+
+from passlib.context import CryptContext
+from passlib.hash import argon2
+
+from api.core.config import settings
+
+T = TypeVar("T")
+
+PASSWORD_SCHEMES = ("bcrypt", "argon2")
+
+
+def build_password_context(
+    scheme: str = "bcrypt",
+    bcrypt_rounds: int = 12,
+    argon2_time_cost: int = 3,
+    argon2_memory_cost: int = 65536,
+    argon2_parallelism: int = 4,
+) -> CryptContext:
+    """Build the password hashing policy.
+
+    New hashes use ``scheme`` with exactly the given cost. Hashes of the
+    other scheme or with a different cost still verify, but are reported
+    as outdated so they can be replaced on the next login.
+
+    Args:
+        scheme (str): ``bcrypt`` or ``argon2`` (argon2id, needs argon2-cffi)
+        bcrypt_rounds (int): bcrypt cost factor, log2 of the iterations
+        argon2_time_cost (int): argon2 iterations
+        argon2_memory_cost (int): argon2 memory in KiB
+        argon2_parallelism (int): argon2 lanes
+
+    Returns:
+        CryptContext: Context hashing and verifying passwords
+
+    Raises:
+        ValueError: If the scheme is unknown
+        RuntimeError: If argon2 is selected without its backend installed
+    """
+    if scheme not in PASSWORD_SCHEMES:
+        raise ValueError(f"Unknown password hash scheme: {scheme}")
+    if scheme == "argon2" and not argon2.has_backend():
+        raise RuntimeError("The argon2 password hash scheme requires argon2-cffi")
+
+    return CryptContext(
+        schemes=[scheme] + [other for other in PASSWORD_SCHEMES if other != scheme],
+        deprecated="auto",
+        bcrypt__default_rounds=bcrypt_rounds,
+        bcrypt__min_rounds=bcrypt_rounds,
+        bcrypt__max_rounds=bcrypt_rounds,
+        argon2__type="ID",
+        argon2__default_rounds=argon2_time_cost,
+        argon2__min_rounds=argon2_time_cost,
+        argon2__max_rounds=argon2_time_cost,
+        argon2__memory_cost=argon2_memory_cost,
+        argon2__parallelism=argon2_parallelism,
+    )
+
+
+@dataclass
+class PasswordHashMetrics:
+    """Counters of a PasswordHasher since it was created."""
+
+    workers: int
+    queue_depth: int = 0
+    in_progress: int = 0
+    hashes: int = 0
+    verifications: int = 0
+    rehashes: int = 0
+    hash_seconds_total: float = 0.0
+    hash_seconds_max: float = 0.0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords on a bounded thread pool.
+
+    bcrypt and argon2 take hundreds of milliseconds per call by design and
+    release the GIL while they run, so a few worker threads keep them off
+    the event loop without blocking other requests. Calls beyond the
+    number of workers queue up; the queue depth and the time spent waiting
+    and hashing are recorded in ``metrics``.
+    """
+
+    def __init__(self, context: CryptContext, workers: int = 4):
+        """Initialize PasswordHasher.
+
+        Args:
+            context (CryptContext): Password hashing policy
+            workers (int): Maximum number of passwords hashed at once
+        """
+        self.context = context
+        self.metrics = PasswordHashMetrics(workers=workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the current policy."""
+        self.metrics.hashes += 1
+        return await self._run(self.context.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if its hash is outdated.
+
+        Args:
+            password (str): Password to check
+            hashed_password (str): Stored hash
+
+        Returns:
+            tuple[bool, Optional[str]]: Whether the password matches, and a
+                new hash to store when the policy changed since it was hashed
+        """
+        self.metrics.verifications += 1
+        verified, new_hash = await self._run(
+            self.context.verify_and_update, password, hashed_password
+        )
+        if new_hash is not None:
+            self.metrics.rehashes += 1
+        return verified, new_hash
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        """Run a hashing call on the pool and record its metrics.
+
+        Metrics are only updated on the event loop thread; the pool runs
+        calls in order, so every call beyond the workers is queued.
+        """
+        metrics = self.metrics
+        queued_at = time.perf_counter()
+
+        def timed() -> tuple[T, float, float]:
+            started = time.perf_counter()
+            return func(*args), started - queued_at, time.perf_counter() - started
+
+        self._track(1)
+        try:
+            result, waited, took = await asyncio.get_running_loop().run_in_executor(
+                self._executor, timed
+            )
+        finally:
+            self._track(-1)
+
+        metrics.wait_seconds_total += waited
+        metrics.wait_seconds_max = max(metrics.wait_seconds_max, waited)
+        metrics.hash_seconds_total += took
+        metrics.hash_seconds_max = max(metrics.hash_seconds_max, took)
+        return result
+
+    def _track(self, change: int) -> None:
+        """Update the calls in progress and queued by ``change`` calls."""
+        metrics = self.metrics
+        pending = metrics.in_progress + metrics.queue_depth + change
+        metrics.in_progress = min(pending, metrics.workers)
+        metrics.queue_depth = pending - metrics.in_progress
+
+
+password_hasher = PasswordHasher(
+    build_password_context(
+        scheme=settings.PASSWORD_HASH_SCHEME,
+        bcrypt_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+        argon2_time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+        argon2_memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+        argon2_parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+    ),
+    workers=settings.PASSWORD_HASH_WORKERS,
+)
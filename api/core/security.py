@@ -1,44 +1,81 @@
-from datetime import datetime, timedelta
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.config import settings
-
-pwd_context = CryptContext(
-    schemes=["bcrypt"], deprecated="auto"
-)  # Context for password hashing
-
+from api.core.database import get_session
+from api.core.passwords import password_hasher
+from api.core.signing_keys import KeyRing
+from api.src.enums import EnumUserRoles
+from api.src.refresh_tokens.revocation import revoked_sessions
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="auth/login"
 )  # OAuth2 scheme for JWT token authentication
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+signing_keys = KeyRing(
+    Path(settings.JWT_KEYS_DIR),
+    algorithm=settings.JWT_ALGORITHM,
+    grace=timedelta(minutes=settings.JWT_KEY_GRACE_MINUTES),
+    reload_seconds=settings.JWT_KEYS_RELOAD_SECONDS,
+)  # Cached signing keys, also published as the JWKS
+
+
+async def verify_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password against its hash off the event loop.
 
+    Returns whether it matches and, if the hash does not follow the current
+    hashing policy, a new hash to store.
+    """
+    return await password_hasher.verify_and_update(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    """Generate password hash."""
-    return pwd_context.hash(password)
+
+async def get_password_hash(password: str) -> str:
+    """Generate password hash off the event loop."""
+    return await password_hasher.hash(password)
 
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
-    """Create JWT access token."""
+    """Create JWT access token with a unique ``jti``, signed by the current key."""
     to_encode = data.copy()
-    expire = datetime.utcnow() + (
-        expires_delta or timedelta(minutes=settings.JWT_EXPIRATION)
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=settings.JWT_EXPIRATION))
+    to_encode.update({"iat": now, "exp": expire, "jti": uuid.uuid4().hex})
+    key = signing_keys.current()
+    return jwt.encode(
+        to_encode, key.private_key, algorithm=key.algorithm, headers={"kid": key.kid}
     )
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    """Dependency to get current authenticated user."""
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user as carried in the access token.
+
+    Routes that need the full ``User`` depend on get_current_user_model.
+    """
+
+    id: int
+    role: EnumUserRoles
+    email: str
+    session_id: str
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> Principal:
+    """Dependency to get current authenticated user.
+
+    The principal is read from the token's claims. The only other check is
+    the per-process filter of revoked sessions, so a valid token needs no
+    database query.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
@@ -46,20 +83,30 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     )
 
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        key = signing_keys.get(jwt.get_unverified_header(token).get("kid"))
+        if key is None:
             raise credentials_exception
-    except JWTError:
+        payload = jwt.decode(token, key.public_key, algorithms=[key.algorithm])
+        principal = Principal(
+            id=int(payload["sub"]),
+            role=EnumUserRoles(payload["role"]),
+            email=payload["email"],
+            session_id=payload["sid"],
+        )
+    except (JWTError, KeyError, TypeError, ValueError):
         raise credentials_exception from JWTError
 
-    from api.core.database import get_session
+    if await revoked_sessions.is_revoked(principal.session_id):
+        raise credentials_exception
+
+    return principal
+
+
+async def get_current_user_model(
+    principal: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_session),
+):
+    """Dependency to load the full ``User`` of the authenticated principal."""
     from api.src.users.service import UserService
 
-    async for session in get_session():
-        user = await UserService(session).get_user(int(user_id))
-        if user is None:
-            raise credentials_exception
-        return user
+    return await UserService(session).get_user(principal.id)
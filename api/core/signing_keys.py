@@ -0,0 +1,282 @@
+"""Asymmetric keys signing the access tokens.
+
+Usage:
+    python -m api.core.signing_keys rotate    # sign with a new key from now on
+    python -m api.core.signing_keys list      # show the keys and their state
+    python -m api.core.signing_keys prune     # delete retired key files
+
+Each key is a PEM private key in ``JWT_KEYS_DIR`` named ``<kid>.pem``; the
+key ID starts with its creation time, so the newest key signs. A replaced
+key still verifies tokens and stays in the JWKS for ``JWT_KEY_GRACE_MINUTES``
+after its successor was created. API processes pick up a rotation within
+``JWT_KEYS_RELOAD_SECONDS``.
+"""
+
+import argparse
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+import ecdsa
+import rsa
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JWKError
+
+from api.core.config import settings
+from api.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+KID_TIME_FORMAT = "%Y%m%dT%H%M%SZ"
+
+SIGNING_ALGORITHMS = ("RS256", "ES256")
+
+# Unknown key IDs reload the keys at most this often, see KeyRing.get
+MIN_RELOAD_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Private key with its public half, as cached by a KeyRing."""
+
+    kid: str
+    algorithm: str
+    private_key: Key
+    public_key: Key
+    created_at: datetime
+    retires_at: Optional[datetime] = None  # None while the key signs
+
+    def to_jwk(self) -> dict:
+        """Public key in JWK format."""
+        return {**self.public_key.to_dict(), "kid": self.kid, "use": "sig"}
+
+
+def generate_key(algorithm: str, directory: Path) -> Path:
+    """Generate a signing key and write it to a new file.
+
+    Uses the pure Python backends python-jose depends on; a 2048 bit RSA
+    key takes a few seconds to generate.
+
+    Args:
+        algorithm (str): ``RS256`` or ``ES256``
+        directory (Path): Key directory
+
+    Returns:
+        Path: File of the new key
+
+    Raises:
+        ValueError: If the algorithm is not supported
+    """
+    if algorithm == "RS256":
+        pem = rsa.newkeys(2048)[1].save_pkcs1()
+    elif algorithm == "ES256":
+        pem = ecdsa.SigningKey.generate(curve=ecdsa.NIST256p).to_pem()
+    else:
+        raise ValueError(f"Unsupported signing algorithm: {algorithm}")
+
+    kid = f"{datetime.now(timezone.utc):{KID_TIME_FORMAT}}-{secrets.token_hex(4)}"
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{kid}.pem"
+    with open(path, "xb") as file:
+        file.write(pem)
+    path.chmod(0o600)
+    logger.info(f"Generated {algorithm} signing key {kid}")
+    return path
+
+
+def read_keys(directory: Path, grace: timedelta) -> list[SigningKey]:
+    """Read every key file, oldest first, with the time each key retires.
+
+    Args:
+        directory (Path): Key directory
+        grace (timedelta): Time a replaced key stays valid
+
+    Returns:
+        list[SigningKey]: Keys; the last one is the current signing key
+    """
+    keys = []
+    for path in sorted(directory.glob("*.pem")):
+        kid = path.stem
+        try:
+            created_at = datetime.strptime(kid.split("-")[0], KID_TIME_FORMAT).replace(
+                tzinfo=timezone.utc
+            )
+        except ValueError:
+            logger.warning(f"Skipping signing key with an invalid name: {path}")
+            continue
+        pem = path.read_text()
+        for algorithm in SIGNING_ALGORITHMS:
+            try:
+                private_key = jwk.construct(pem, algorithm)
+                break
+            except JWKError:
+                continue
+        else:
+            logger.warning(f"Skipping unsupported signing key: {path}")
+            continue
+        keys.append(
+            SigningKey(
+                kid, algorithm, private_key, private_key.public_key(), created_at
+            )
+        )
+
+    keys.sort(key=lambda key: key.created_at)
+    return [
+        SigningKey(
+            key.kid,
+            key.algorithm,
+            key.private_key,
+            key.public_key,
+            key.created_at,
+            retires_at=successor.created_at + grace,
+        )
+        for key, successor in zip(keys, keys[1:])
+    ] + keys[-1:]
+
+
+class KeyRing:
+    """Signing keys of a key directory, cached per process.
+
+    Keys are read on first use and again every ``reload_seconds``, or when
+    a token names a key this process has not seen, e.g. right after
+    another process rotated. If the directory has no key, one is
+    generated.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        algorithm: str,
+        grace: timedelta,
+        reload_seconds: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize KeyRing.
+
+        Args:
+            directory (Path): Key directory
+            algorithm (str): Algorithm of generated keys
+            grace (timedelta): Time a replaced key stays valid
+            reload_seconds (float): Seconds between reads of the directory
+            timer (Callable[[], float]): Clock used for reloads
+        """
+        self.directory = directory
+        self.algorithm = algorithm
+        self.grace = grace
+        self.reload_seconds = reload_seconds
+        self.timer = timer
+        self._keys: dict[str, SigningKey] = {}
+        self._current: Optional[SigningKey] = None
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> SigningKey:
+        """Key to sign new tokens with."""
+        self._reload_after(self.reload_seconds)
+        return self._current
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        """Key that may verify a token, None if unknown or retired.
+
+        Args:
+            kid (Optional[str]): ``kid`` header of the token
+
+        Returns:
+            Optional[SigningKey]: Key with that ID
+        """
+        self._reload_after(self.reload_seconds)
+        if kid not in self._keys:
+            self._reload_after(MIN_RELOAD_SECONDS)
+        key = self._keys.get(kid)
+        if key is None or (
+            key.retires_at is not None and key.retires_at <= datetime.now(timezone.utc)
+        ):
+            return None
+        return key
+
+    def jwks(self) -> dict:
+        """Public keys that verify tokens, as a JSON Web Key Set."""
+        self._reload_after(self.reload_seconds)
+        now = datetime.now(timezone.utc)
+        return {
+            "keys": [
+                key.to_jwk()
+                for key in self._keys.values()
+                if key.retires_at is None or key.retires_at > now
+            ]
+        }
+
+    def _reload_after(self, seconds: float) -> None:
+        if self._loaded_at is not None and self.timer() - self._loaded_at < seconds:
+            return
+
+        with self._lock:
+            if (
+                self._loaded_at is not None
+                and self.timer() - self._loaded_at < seconds
+            ):
+                return
+            keys = (
+                read_keys(self.directory, self.grace)
+                if self.directory.exists()
+                else []
+            )
+            if not keys:
+                logger.warning(f"No signing key in {self.directory}, generating one")
+                generate_key(self.algorithm, self.directory)
+                keys = read_keys(self.directory, self.grace)
+
+            now = datetime.now(timezone.utc)
+            self._keys = {
+                key.kid: key
+                for key in keys
+                if key.retires_at is None or key.retires_at > now
+            }
+            self._current = keys[-1]
+            self._loaded_at = self.timer()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Manage the JWT signing keys.")
+    parser.add_argument("command", choices=["rotate", "list", "prune"])
+    parser.add_argument(
+        "--algorithm",
+        choices=SIGNING_ALGORITHMS,
+        default=settings.JWT_ALGORITHM,
+        help="Algorithm of the new key (rotate only)",
+    )
+    return parser.parse_args()
+
+
+def main(args: argparse.Namespace) -> None:
+    directory = Path(settings.JWT_KEYS_DIR)
+    grace = timedelta(minutes=settings.JWT_KEY_GRACE_MINUTES)
+
+    if args.command == "rotate":
+        path = generate_key(args.algorithm, directory)
+        print(f"Signing with {path.stem} from now on")
+        return
+
+    now = datetime.now(timezone.utc)
+    for key in read_keys(directory, grace) if directory.exists() else []:
+        retired = key.retires_at is not None and key.retires_at <= now
+        if args.command == "prune":
+            if retired:
+                (directory / f"{key.kid}.pem").unlink()
+                print(f"Deleted {key.kid}")
+        elif key.retires_at is None:
+            print(f"{key.kid}  {key.algorithm}  signing")
+        else:
+            state = "retired" if retired else "valid until"
+            print(
+                f"{key.kid}  {key.algorithm}  {state} {key.retires_at:%Y-%m-%d %H:%M}"
+            )
+
+
+if __name__ == "__main__":
+    main(parse_args())
@@ -1,13 +1,24 @@
-from fastapi import FastAPI
+from dataclasses import asdict
+
+from fastapi import Depends, FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from api.core.config import settings
 from api.core.logging import get_logger, setup_logging
+from api.core.passwords import password_hasher
+from api.core.security import Principal, get_current_user, signing_keys
+from api.src.billing.routes import router as billing_router
+from api.src.cash_flow.routes import router as cash_flow_router
+from api.src.enums import EnumUserRoles
 from api.src.files.routes import router as files_router
+from api.src.late_fees.routes import router as late_fees_router
 from api.src.leases.routes import router as leases_router
+from api.src.payment_analytics.routes import router as payment_analytics_router
 from api.src.payments.routes import router as payments_router
 from api.src.profile_pictures.routes import router as profile_pictures_router
 from api.src.properties.routes import router as properties_router
+from api.src.reconciliation.routes import router as reconciliation_router
 from api.src.tenants.routes import router as tenants_router
 from api.src.units.routes import router as units_router
 from api.src.users.auth_routes import router as auth_router
@@ -45,6 +56,11 @@ app.include_router(files_router)
 app.include_router(profile_pictures_router)
 app.include_router(tenants_router)
 app.include_router(payments_router)
+app.include_router(billing_router)
+app.include_router(reconciliation_router)
+app.include_router(payment_analytics_router)
+app.include_router(cash_flow_router)
+app.include_router(late_fees_router)
 
 
 @app.get("/health")
@@ -52,6 +68,26 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/.well-known/jwks.json")
+async def jwks():
+    """Public keys verifying access tokens, for services checking them locally."""
+    return JSONResponse(
+        signing_keys.jwks(), headers={"Cache-Control": "public, max-age=300"}
+    )
+
+
+@app.get("/metrics/password-hashing")
+async def password_hashing_metrics(
+    current_user: Principal = Depends(get_current_user),
+):
+    """Queue depth and latency of password hashing, for admins only."""
+    if current_user.role != EnumUserRoles.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+    return asdict(password_hasher.metrics)
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -0,0 +1,46 @@
+"""Run billing from the command line.
+
+Usage:
+    python -m api.src.billing.cli [--period-start YYYY-MM-DD]
+        [--period-end YYYY-MM-DD] [--document-type TYPE] [--owner-id ID] [--dry-run]
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from api.core.database import async_session
+from api.src.billing.schemas import BillingRunCreate
+from api.src.billing.service import BillingService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate missing payments for every active lease."
+    )
+    parser.add_argument("--period-start", type=date.fromisoformat, default=None)
+    parser.add_argument("--period-end", type=date.fromisoformat, default=None)
+    parser.add_argument("--document-type", default="Rent Invoice")
+    parser.add_argument(
+        "--owner-id", type=int, default=None, help="Only bill this owner's properties"
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Compute missing payments only"
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    run_data = BillingRunCreate(
+        period_start=args.period_start,
+        period_end=args.period_end,
+        document_type=args.document_type,
+        dry_run=args.dry_run,
+    )
+    async with async_session() as session:
+        result = await BillingService(session).run(run_data, owner_id=args.owner_id)
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
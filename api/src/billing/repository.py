@@ -0,0 +1,152 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Row, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.leases.models import Lease
+from api.src.payment_summaries.repository import (
+    PaymentFigures,
+    PaymentSummaryRepository,
+)
+from api.src.payments.models import Payment
+from api.src.properties.models import Property
+from api.src.units.models import Unit
+from api.src.users.models import User
+
+logger = get_logger(__name__)
+
+# Rows per INSERT statement, keeps bind parameters well below the asyncpg limit
+INSERT_BATCH_SIZE = 1000
+
+
+class BillingRepository:
+    """Repository for set-based billing run queries."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize BillingRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.summaries = PaymentSummaryRepository(session)
+
+    async def get_active_leases(
+        self,
+        period_start: date,
+        period_end: date,
+        after_id: int = 0,
+        limit: int = 1000,
+        owner_id: Optional[int] = None,
+    ) -> list[Row]:
+        """Get a batch of active leases overlapping the billing period.
+
+        Only the columns needed to build payments are selected, ordered by
+        lease ID so callers can page with ``after_id``.
+
+        Args:
+            period_start (date): First due date of the billing period
+            period_end (date): Last due date of the billing period
+            after_id (int): Only return leases with a greater ID
+            limit (int): Maximum number of leases to return
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            list[Row]: Rows with id, start_date, end_date, monthly_rent,
+                property_id, owner_id, first_name and last_name
+        """
+        stmt = (
+            select(
+                Lease.id,
+                Lease.start_date,
+                Lease.end_date,
+                Unit.monthly_rent,
+                Unit.property_id,
+                Property.owner_id,
+                User.first_name,
+                User.last_name,
+            )
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .join(User, Lease.tenant_id == User.id)
+            .where(
+                Lease.is_active,
+                Lease.id > after_id,
+                Lease.start_date <= period_end,
+                or_(Lease.end_date.is_(None), Lease.end_date >= period_start),
+            )
+            .order_by(Lease.id)
+            .limit(limit)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Property.owner_id == owner_id)
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_billed_periods(
+        self,
+        lease_ids: list[int],
+        document_type: str,
+        period_start: date,
+        period_end: date,
+    ) -> set[tuple[int, date]]:
+        """Get (lease_id, due_date) pairs that already have a payment.
+
+        Args:
+            lease_ids (list[int]): Leases to check
+            document_type (str): Document type of the payments
+            period_start (date): First due date of the billing period
+            period_end (date): Last due date of the billing period
+
+        Returns:
+            set[tuple[int, date]]: Already billed lease periods
+        """
+        if not lease_ids:
+            return set()
+
+        stmt = select(Payment.lease_id, Payment.due_date).where(
+            Payment.lease_id.in_(lease_ids),
+            Payment.document_type == document_type,
+            Payment.due_date.between(period_start, period_end),
+        )
+        result = await self.session.execute(stmt)
+        return {(row.lease_id, row.due_date) for row in result}
+
+    async def insert_missing_payments(self, payments: list[dict]) -> int:
+        """Insert payments, skipping periods that were billed concurrently.
+
+        Uses multi-row INSERT ... ON CONFLICT DO NOTHING on the
+        (lease_id, due_date, document_type) unique key, so repeated runs
+        never create duplicates. Payment summaries are updated for the rows
+        actually inserted. The caller is responsible for committing.
+
+        Args:
+            payments (list[dict]): Payment column values
+
+        Returns:
+            int: Number of payments actually inserted
+        """
+        inserted = 0
+        for start in range(0, len(payments), INSERT_BATCH_SIZE):
+            stmt = (
+                pg_insert(Payment)
+                .values(payments[start : start + INSERT_BATCH_SIZE])
+                .on_conflict_do_nothing(
+                    constraint="uq_payment_lease_due_date_document_type"
+                )
+                .returning(
+                    Payment.lease_id,
+                    Payment.is_paid,
+                    Payment.due_date,
+                    Payment.gross_value,
+                )
+            )
+            result = await self.session.execute(stmt)
+            rows = [PaymentFigures(*row) for row in result]
+            await self.summaries.apply(added=rows)
+            inserted += len(rows)
+        return inserted
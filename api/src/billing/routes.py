@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.database import get_session
+from api.core.logging import get_logger
+from api.core.security import Principal, get_current_user
+from api.src.billing.schemas import BillingRunCreate, BillingRunResponse
+from api.src.billing.service import BillingService
+from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.utils.access_verify import is_owner_or_admin
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/billing", tags=["billing"])
+
+
+def get_billing_service(
+    session: AsyncSession = Depends(get_session),
+) -> BillingService:
+    """Get billing service instance."""
+    return BillingService(session)
+
+
+@router.post("/runs", response_model=BillingRunResponse)
+async def create_billing_run(
+    run_data: BillingRunCreate,
+    service: BillingService = Depends(get_billing_service),
+    current_user: Principal = Depends(get_current_user),
+) -> BillingRunResponse:
+    """Generate missing payments for every active lease in the billing period.
+
+    Admins bill the whole portfolio, owners only their own properties.
+    Repeating a run never creates duplicate payments.
+    Requires: ADMIN or OWNER role
+    """
+    is_owner_or_admin(current_user)
+
+    logger.info(
+        f"Starting billing run {run_data.period_start}..{run_data.period_end} "
+        f"by user {current_user.id}"
+    )
+    owner_id = current_user.id if current_user.role == EnumUserRoles.OWNER else None
+    return await service.run(run_data, owner_id=owner_id)
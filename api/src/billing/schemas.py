@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class BillingRunCreate(BaseModel):
+    """Schema for starting a billing run over active leases."""
+
+    period_start: Optional[date] = Field(
+        None,
+        description="First due date to bill (defaults to the first day of the current month)",
+    )
+    period_end: Optional[date] = Field(
+        None,
+        description="Last due date to bill (defaults to the end of next month)",
+    )
+    document_type: str = Field(
+        "Rent Invoice", description="Document type of the generated payments"
+    )
+    dry_run: bool = Field(
+        False, description="Only compute the missing payments, write nothing"
+    )
+
+    @model_validator(mode="after")
+    def validate_period(self):
+        if (
+            self.period_start
+            and self.period_end
+            and self.period_start > self.period_end
+        ):
+            raise ValueError("period_start must not be after period_end")
+        return self
+
+
+class BillingRunResponse(BaseModel):
+    """Summary of a completed billing run."""
+
+    period_start: date
+    period_end: date
+    document_type: str
+    dry_run: bool
+    leases_scanned: int
+    payments_created: int
+    periods_already_billed: int
+    duration_ms: int
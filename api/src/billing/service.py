@@ -0,0 +1,136 @@
+import calendar
+from datetime import date
+from time import perf_counter
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.billing.repository import BillingRepository
+from api.src.billing.schemas import BillingRunCreate, BillingRunResponse
+from api.src.payments.schedule import compute_schedules
+
+logger = get_logger(__name__)
+
+# Leases processed (and committed) per batch
+LEASE_BATCH_SIZE = 1000
+
+
+def _add_months(value: date, months: int, day: int) -> date:
+    """Return ``day`` of the month ``months`` after ``value``, clamped to month end."""
+    month_index = value.year * 12 + value.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    return date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+class BillingService:
+    """Service generating missing periodic payments for active leases."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize BillingService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = BillingRepository(session)
+
+    async def run(
+        self, run_data: BillingRunCreate, owner_id: Optional[int] = None
+    ) -> BillingRunResponse:
+        """Create missing monthly payments for every active lease.
+
+        Leases are scanned in ID order in batches. For each batch the expected
+        due dates (on the lease start day, clamped to month end) are compared
+        with already billed periods and only the missing payments are inserted
+        and committed. Runs are idempotent and can be safely repeated.
+
+        Args:
+            run_data (BillingRunCreate): Billing period and options
+            owner_id (Optional[int]): Restrict the run to properties of this owner
+
+        Returns:
+            BillingRunResponse: Summary of scanned leases and created payments
+        """
+        started = perf_counter()
+        today = date.today()
+        period_start = run_data.period_start or today.replace(day=1)
+        period_end = run_data.period_end or _add_months(today, 1, 31)
+
+        leases_scanned = 0
+        payments_created = 0
+        periods_already_billed = 0
+        after_id = 0
+
+        while True:
+            leases = await self.repository.get_active_leases(
+                period_start,
+                period_end,
+                after_id=after_id,
+                limit=LEASE_BATCH_SIZE,
+                owner_id=owner_id,
+            )
+            if not leases:
+                break
+            after_id = leases[-1].id
+            leases_scanned += len(leases)
+
+            billed = await self.repository.get_billed_periods(
+                [lease.id for lease in leases],
+                run_data.document_type,
+                period_start,
+                period_end,
+            )
+
+            schedule = compute_schedules(
+                [max(lease.start_date, period_start) for lease in leases],
+                [min(lease.end_date or period_end, period_end) for lease in leases],
+                [lease.start_date.day for lease in leases],
+                period_amounts=[lease.monthly_rent for lease in leases],
+            )
+
+            missing = []
+            for row, due_date, amount in schedule.to_list():
+                lease = leases[row]
+                if (lease.id, due_date) in billed:
+                    periods_already_billed += 1
+                    continue
+                missing.append(
+                    {
+                        "document_type": run_data.document_type,
+                        "gross_value": amount,
+                        "due_date": due_date,
+                        "receiver": f"{lease.first_name} {lease.last_name}",
+                        "description": f"Rent for {due_date:%B %Y}",
+                        "is_paid": False,
+                        "lease_id": lease.id,
+                        "property_id": lease.property_id,
+                        "owner_id": lease.owner_id,
+                    }
+                )
+
+            if run_data.dry_run:
+                payments_created += len(missing)
+                continue
+
+            inserted = await self.repository.insert_missing_payments(missing)
+            await self.session.commit()
+            payments_created += inserted
+            periods_already_billed += len(missing) - inserted
+
+        duration_ms = int((perf_counter() - started) * 1000)
+        logger.info(
+            f"Billing run {period_start}..{period_end}: scanned {leases_scanned} "
+            f"leases, created {payments_created} payments in {duration_ms} ms"
+        )
+        return BillingRunResponse(
+            period_start=period_start,
+            period_end=period_end,
+            document_type=run_data.document_type,
+            dry_run=run_data.dry_run,
+            leases_scanned=leases_scanned,
+            payments_created=payments_created,
+            periods_already_billed=periods_already_billed,
+            duration_ms=duration_ms,
+        )
@@ -0,0 +1 @@
+# Cash flow module
@@ -0,0 +1,174 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import Date, DateTime, Row, cast, func, not_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.leases.models import Lease
+from api.src.payment_summaries.repository import PaymentSummaryRepository
+from api.src.payments.models import Payment
+from api.src.properties.models import Property
+from api.src.units.models import Unit
+
+logger = get_logger(__name__)
+
+
+class CashFlowRepository:
+    """Repository for the set-based inputs of the cash flow forecast."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize CashFlowRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.summaries = PaymentSummaryRepository(session)
+
+    async def get_lease_months(
+        self,
+        start_date: date,
+        as_of_date: date,
+        end_date: date,
+        owner_id: Optional[int] = None,
+    ) -> list[Row]:
+        """Get the payments of the forecast window per lease and month.
+
+        Args:
+            start_date (date): First day of the first forecast month
+            as_of_date (date): Only unpaid payments due on or after this day
+                count as scheduled income
+            end_date (date): Last day of the last forecast month
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            list[Row]: Rows with lease_id and tenant_id (both None for
+                payments without a lease), month, unpaid_amount, unpaid_count
+                and payment_count
+        """
+        scheduled = not_(Payment.is_paid) & (Payment.due_date >= as_of_date)
+        month = cast(
+            func.date_trunc("month", cast(Payment.due_date, DateTime)), Date
+        ).label("month")
+        stmt = (
+            select(
+                Payment.lease_id,
+                Lease.tenant_id,
+                month,
+                func.coalesce(
+                    func.sum(Payment.gross_value).filter(scheduled), 0
+                ).label("unpaid_amount"),
+                func.count().filter(scheduled).label("unpaid_count"),
+                func.count().label("payment_count"),
+            )
+            .outerjoin(Lease, Payment.lease_id == Lease.id)
+            .where(Payment.due_date.between(start_date, end_date))
+            .group_by(Payment.lease_id, Lease.tenant_id, month)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Payment.owner_id == owner_id)
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_active_leases(
+        self, start_date: date, end_date: date, owner_id: Optional[int] = None
+    ) -> list[Row]:
+        """Get every active lease overlapping the forecast window.
+
+        Args:
+            start_date (date): First day of the window
+            end_date (date): Last day of the window
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            list[Row]: Rows with id, tenant_id, start_date, end_date and
+                monthly_rent
+        """
+        stmt = (
+            select(
+                Lease.id,
+                Lease.tenant_id,
+                Lease.start_date,
+                Lease.end_date,
+                Unit.monthly_rent,
+            )
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .where(
+                Lease.is_active,
+                Lease.start_date <= end_date,
+                or_(Lease.end_date.is_(None), Lease.end_date >= start_date),
+            )
+            .order_by(Lease.id)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Property.owner_id == owner_id)
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_tenant_arrears(
+        self, start_date: date, as_of_date: date, owner_id: Optional[int] = None
+    ) -> list[Row]:
+        """Get the amount due and the amount still unpaid per tenant.
+
+        Args:
+            start_date (date): First due date of the history
+            as_of_date (date): Only payments due before this day
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            list[Row]: Rows with tenant_id, due_amount and unpaid_amount
+        """
+        stmt = (
+            select(
+                Lease.tenant_id,
+                func.sum(Payment.gross_value).label("due_amount"),
+                func.coalesce(
+                    func.sum(Payment.gross_value).filter(not_(Payment.is_paid)), 0
+                ).label("unpaid_amount"),
+            )
+            .join(Lease, Payment.lease_id == Lease.id)
+            .where(
+                Payment.due_date >= start_date,
+                Payment.due_date < as_of_date,
+            )
+            .group_by(Lease.tenant_id)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Payment.owner_id == owner_id)
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_lease_version(
+        self, owner_id: Optional[int] = None
+    ) -> tuple[Optional[datetime], Optional[datetime], int]:
+        """Get a cheap version of an owner's leases and unit rents.
+
+        Creating, updating or deleting a lease or changing a unit's rent
+        changes the version.
+
+        Args:
+            owner_id (Optional[int]): Owner to check, all owners when omitted
+
+        Returns:
+            tuple[Optional[datetime], Optional[datetime], int]: Latest lease
+                change, latest unit change and number of leases
+        """
+        stmt = (
+            select(
+                func.max(func.coalesce(Lease.updated_at, Lease.created_at)),
+                func.max(func.coalesce(Unit.updated_at, Unit.created_at)),
+                func.count(Lease.id),
+            )
+            .select_from(Unit)
+            .join(Property, Unit.property_id == Property.id)
+            .outerjoin(Lease, Lease.unit_id == Unit.id)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Property.owner_id == owner_id)
+
+        return tuple((await self.session.execute(stmt)).one())
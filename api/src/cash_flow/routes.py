@@ -0,0 +1,54 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.database import get_session
+from api.core.logging import get_logger
+from api.core.security import Principal, get_current_user
+from api.src.cash_flow.schemas import CashFlowForecast
+from api.src.cash_flow.service import MAX_MONTHS, MIN_MONTHS, CashFlowService
+from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.utils.access_verify import is_owner_or_admin
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/cash-flow", tags=["cash-flow"])
+
+
+def get_cash_flow_service(
+    session: AsyncSession = Depends(get_session),
+) -> CashFlowService:
+    """Get cash flow service instance."""
+    return CashFlowService(session)
+
+
+@router.get("/forecast", response_model=CashFlowForecast)
+async def get_cash_flow_forecast(
+    months: int = Query(
+        12,
+        ge=MIN_MONTHS,
+        le=MAX_MONTHS,
+        description="Months to project, including the current one",
+    ),
+    owner_id: Optional[int] = Query(
+        None, description="Filter by owner ID (admins only, owners see their own)"
+    ),
+    service: CashFlowService = Depends(get_cash_flow_service),
+    current_user: Principal = Depends(get_current_user),
+) -> CashFlowForecast:
+    """Project the expected rental income per month.
+
+    Unpaid payments that are not past due and the rent of active leases in
+    months without a payment are discounted by each tenant's share of
+    payments still unpaid over the last year.
+    Requires: ADMIN or OWNER role
+    """
+    is_owner_or_admin(current_user)
+
+    if current_user.role == EnumUserRoles.OWNER:
+        owner_id = current_user.id
+
+    logger.info(
+        f"Getting {months} month cash flow forecast for user {current_user.id}"
+    )
+    return await service.get_forecast(months=months, owner_id=owner_id)
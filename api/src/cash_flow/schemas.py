@@ -0,0 +1,45 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class CashFlowFigures(BaseModel):
+    """Projected income of a set of payments."""
+
+    scheduled_amount: float = Field(
+        0, description="Unpaid amount of existing payments"
+    )
+    implied_amount: float = Field(
+        0, description="Rent of active leases that has no payment yet"
+    )
+    gross_amount: float = Field(0, description="Scheduled and implied amount")
+    at_risk_amount: float = Field(
+        0, description="Part of the gross amount expected to be paid late"
+    )
+    expected_amount: float = Field(
+        0, description="Gross amount expected to be collected on time"
+    )
+    scheduled_count: int = 0
+    implied_count: int = 0
+
+
+class CashFlowMonth(CashFlowFigures):
+    """Projected income of the payments due within one month."""
+
+    month: date
+
+
+class CashFlowForecast(BaseModel):
+    """Monthly cash flow projection starting with the current month.
+
+    Payments already past due are not part of the projection.
+    """
+
+    as_of_date: date
+    months: int
+    late_rate: float = Field(
+        description="Share of the amount due over the last year still unpaid, "
+        "used for tenants without their own history"
+    )
+    totals: CashFlowFigures
+    series: list[CashFlowMonth]
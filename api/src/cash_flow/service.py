@@ -0,0 +1,260 @@
+from datetime import date, timedelta
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.cash_flow.repository import CashFlowRepository
+from api.src.cash_flow.schemas import CashFlowFigures, CashFlowForecast, CashFlowMonth
+from api.src.payments.schedule import compute_schedules
+from api.src.utils.cache import TTLCache
+
+logger = get_logger(__name__)
+
+# Forecasts per (owner, months), validated against payment and lease versions
+FORECAST_CACHE: TTLCache[tuple[int, int], tuple] = TTLCache(maxsize=1024, ttl=300)
+
+MIN_MONTHS = 3
+MAX_MONTHS = 24
+
+# Days of payment history the late rates are computed from
+LATE_RATE_HISTORY_DAYS = 365
+
+
+def implied_rent(
+    start_month: np.datetime64,
+    months: int,
+    as_of_date: date,
+    lease_ids: np.ndarray,
+    start_dates: np.ndarray,
+    end_dates: np.ndarray,
+    monthly_rents: np.ndarray,
+    billed: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the rent of active leases in months that have no payment yet.
+
+    Rent is due monthly on the day the lease started, like billing runs
+    generate it, from ``as_of_date`` until the lease or the forecast ends.
+
+    Args:
+        start_month (np.datetime64): First forecast month (``datetime64[M]``)
+        months (int): Number of forecast months
+        as_of_date (date): First day rent can still fall due
+        lease_ids (np.ndarray): Lease IDs
+        start_dates (np.ndarray): Lease start dates (``datetime64[D]``)
+        end_dates (np.ndarray): Lease end dates, NaT for ongoing leases
+        monthly_rents (np.ndarray): Rent of each lease's unit
+        billed (np.ndarray): ``lease_id * months + month offset`` of every
+            lease month that already has a payment
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Lease row, month offset
+            and amount of every implied payment
+    """
+    window_end = (start_month + np.timedelta64(months, "M")).astype(
+        "datetime64[D]"
+    ) - np.timedelta64(1, "D")
+    due_days = (start_dates - start_dates.astype("datetime64[M]")).astype(np.int64) + 1
+    schedule = compute_schedules(
+        np.maximum(start_dates, np.datetime64(as_of_date, "D")),
+        np.where(np.isnat(end_dates), window_end, np.minimum(end_dates, window_end)),
+        due_days,
+        period_amounts=monthly_rents,
+    )
+
+    offsets = (schedule.due_dates.astype("datetime64[M]") - start_month).astype(
+        np.int64
+    )
+    unbilled = ~np.isin(lease_ids[schedule.rows] * months + offsets, billed)
+    return schedule.rows[unbilled], offsets[unbilled], schedule.amounts[unbilled]
+
+
+def late_rates(
+    tenant_ids: np.ndarray,
+    history_tenant_ids: np.ndarray,
+    due_amounts: np.ndarray,
+    unpaid_amounts: np.ndarray,
+) -> tuple[np.ndarray, float]:
+    """Look up the late payment rate of every tenant.
+
+    A tenant's rate is the share of the amount that fell due in the history
+    window and is still unpaid. Tenants without history get the rate of
+    the whole portfolio.
+
+    Args:
+        tenant_ids (np.ndarray): Tenants to look up, 0 for payments without one
+        history_tenant_ids (np.ndarray): Tenants with payment history
+        due_amounts (np.ndarray): Amount due of each tenant with history
+        unpaid_amounts (np.ndarray): Amount still unpaid of each tenant
+
+    Returns:
+        tuple[np.ndarray, float]: Rate of every looked up tenant and the
+            portfolio rate
+    """
+    total_due = due_amounts.sum()
+    default = float(unpaid_amounts.sum() / total_due) if total_due > 0 else 0.0
+    if len(history_tenant_ids) == 0:
+        return np.full(len(tenant_ids), default), default
+
+    rates = np.clip(
+        np.divide(
+            unpaid_amounts,
+            due_amounts,
+            out=np.full(len(due_amounts), default),
+            where=due_amounts > 0,
+        ),
+        0,
+        1,
+    )
+    order = np.argsort(history_tenant_ids)
+    known, rates = history_tenant_ids[order], rates[order]
+    position = np.minimum(np.searchsorted(known, tenant_ids), len(known) - 1)
+    found = known[position] == tenant_ids
+    return np.where(found, rates[position], default), default
+
+
+class CashFlowService:
+    """Service projecting expected rental income per month."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize CashFlowService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = CashFlowRepository(session)
+
+    async def get_forecast(
+        self, months: int = 12, owner_id: Optional[int] = None
+    ) -> CashFlowForecast:
+        """Project the income of the current and the following months.
+
+        Combines unpaid payments that are not yet past due with the rent of
+        active leases in months without a payment, and discounts both by the
+        tenants' late payment rates. The whole portfolio is computed at once
+        with NumPy.
+
+        Forecasts are cached per owner. A cached forecast is reused only
+        while the owner's payment summaries and leases are unchanged and it
+        is from today. The forecast of all owners is not cached: it includes
+        payments without a lease, which have no summary to version them.
+
+        Args:
+            months (int): Number of months to project, including the current one
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            CashFlowForecast: Monthly projection with totals
+        """
+        today = date.today()
+        if owner_id is not None:
+            version = (
+                today,
+                await self.repository.summaries.get_version(owner_id=owner_id),
+                await self.repository.get_lease_version(owner_id=owner_id),
+            )
+            cached = FORECAST_CACHE.get((owner_id, months))
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+        start_month = np.datetime64(today, "M")
+        window_start = start_month.astype(date)
+        window_end = (start_month + np.timedelta64(months, "M")).astype(
+            date
+        ) - timedelta(days=1)
+
+        lease_months = await self.repository.get_lease_months(
+            window_start, today, window_end, owner_id=owner_id
+        )
+        leases = await self.repository.get_active_leases(
+            today, window_end, owner_id=owner_id
+        )
+        arrears = await self.repository.get_tenant_arrears(
+            today - timedelta(days=LATE_RATE_HISTORY_DAYS), today, owner_id=owner_id
+        )
+
+        # Existing payments, one entry per lease and month
+        scheduled_leases = np.array(
+            [row.lease_id or 0 for row in lease_months], dtype=np.int64
+        )
+        scheduled_tenants = np.array(
+            [row.tenant_id or 0 for row in lease_months], dtype=np.int64
+        )
+        scheduled_offsets = (
+            np.array([row.month for row in lease_months], dtype="datetime64[M]")
+            - start_month
+        ).astype(np.int64)
+        scheduled_amounts = np.array(
+            [row.unpaid_amount for row in lease_months], dtype=np.float64
+        )
+        scheduled_counts = np.array(
+            [row.unpaid_count for row in lease_months], dtype=np.int64
+        )
+        billed = (scheduled_leases * months + scheduled_offsets)[scheduled_leases > 0]
+
+        # Rent of active leases in months without a payment
+        lease_tenants = np.array([lease.tenant_id for lease in leases], dtype=np.int64)
+        implied_rows, implied_offsets, implied_amounts = implied_rent(
+            start_month,
+            months,
+            today,
+            np.array([lease.id for lease in leases], dtype=np.int64),
+            np.array([lease.start_date for lease in leases], dtype="datetime64[D]"),
+            np.array([lease.end_date for lease in leases], dtype="datetime64[D]"),
+            np.array([lease.monthly_rent for lease in leases], dtype=np.float64),
+            billed,
+        )
+
+        rates, late_rate = late_rates(
+            np.concatenate([scheduled_tenants, lease_tenants[implied_rows]]),
+            np.array([row.tenant_id for row in arrears], dtype=np.int64),
+            np.array([row.due_amount for row in arrears], dtype=np.float64),
+            np.array([row.unpaid_amount for row in arrears], dtype=np.float64),
+        )
+        offsets = np.concatenate([scheduled_offsets, implied_offsets])
+        amounts = np.concatenate([scheduled_amounts, implied_amounts])
+
+        def per_month(values: np.ndarray, month_offsets: np.ndarray) -> np.ndarray:
+            return np.bincount(month_offsets, weights=values, minlength=months)
+
+        columns = {
+            "scheduled_amount": per_month(scheduled_amounts, scheduled_offsets),
+            "implied_amount": per_month(implied_amounts, implied_offsets),
+            "gross_amount": per_month(amounts, offsets),
+            "at_risk_amount": per_month(amounts * rates, offsets),
+            "expected_amount": per_month(amounts * (1 - rates), offsets),
+            "scheduled_count": per_month(scheduled_counts, scheduled_offsets),
+            "implied_count": np.bincount(implied_offsets, minlength=months),
+        }
+        series = [
+            CashFlowMonth(
+                month=(start_month + np.timedelta64(offset, "M")).astype(date),
+                **self._figures(
+                    {field: column[offset] for field, column in columns.items()}
+                ),
+            )
+            for offset in range(months)
+        ]
+        totals = CashFlowFigures(
+            **self._figures({field: column.sum() for field, column in columns.items()})
+        )
+
+        forecast = CashFlowForecast(
+            as_of_date=today,
+            months=months,
+            late_rate=round(late_rate, 4),
+            totals=totals,
+            series=series,
+        )
+        if owner_id is not None:
+            FORECAST_CACHE.set((owner_id, months), (version, forecast))
+        return forecast
+
+    def _figures(self, values: dict) -> dict:
+        """Convert NumPy figures to floats rounded to cents and integer counts."""
+        return {
+            field: round(float(value), 2) if field.endswith("_amount") else int(value)
+            for field, value in values.items()
+        }
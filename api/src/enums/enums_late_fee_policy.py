@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class EnumLateFeePolicy(str, Enum):
+    NONE = "none"
+    STATUTORY_INTEREST = "statutory_interest"
+    CONTRACTUAL_INTEREST = "contractual_interest"
+    FLAT_FEE = "flat_fee"
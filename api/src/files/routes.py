@@ -4,10 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.files.schemas import FileCreate, FileResponse
 from api.src.files.service import FileService
-from api.src.users.models import User
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/files", tags=["files"])
@@ -21,7 +20,7 @@ def get_file_service(session: AsyncSession = Depends(get_session)) -> FileServic
 @router.get("/", response_model=list[FileResponse])
 async def get_all_files(
     service: FileService = Depends(get_file_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[FileResponse]:
     """Get all files."""
     logger.debug("Fetching all files")
@@ -38,7 +37,7 @@ async def get_all_files(
 async def get_file(
     file_id: int,
     service: FileService = Depends(get_file_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> FileResponse:
     """Get file by ID."""
     logger.debug(f"Fetching file {file_id}")
@@ -61,7 +60,7 @@ async def get_file(
 async def upload_file(
     file: UploadFile = File(...),
     service: FileService = Depends(get_file_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> FileResponse:
     """Upload a new file."""
     logger.debug(f"Uploading file: {file.filename}")
@@ -89,7 +88,7 @@ async def upload_file(
 async def download_file(
     file_id: int,
     service: FileService = Depends(get_file_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """Download file by ID."""
     logger.debug(f"Downloading file {file_id}")
@@ -119,7 +118,7 @@ async def download_file(
 async def delete_file(
     file_id: int,
     service: FileService = Depends(get_file_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> None:
     """Delete file by ID."""
     logger.debug(f"Deleting file {file_id}")
@@ -0,0 +1 @@
+# Idempotency module
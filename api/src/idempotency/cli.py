@@ -0,0 +1,31 @@
+"""Evict expired idempotency keys from the command line.
+
+Usage:
+    python -m api.src.idempotency.cli purge
+
+Expired keys are reused when a request sends them again, so purging only
+keeps the table small. Schedule it daily, e.g. via cron.
+"""
+
+import argparse
+import asyncio
+
+from api.core.database import async_session
+from api.src.idempotency.repository import IdempotencyRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Purge expired idempotency keys.")
+    parser.add_argument("command", choices=["purge"])
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with async_session() as session:
+        purged = await IdempotencyRepository(session).purge_expired()
+        await session.commit()
+        print(f"Purged {purged} expired keys")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,32 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    SmallInteger,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from api.core.database import Base
+
+
+class IdempotencyKey(Base):
+    """Stored outcome of a request sent with an ``Idempotency-Key`` header.
+
+    Keys are hashed together with the endpoint, so a row has a fixed size
+    apart from the response. ``status_code`` and ``response`` stay empty
+    while the first request is running; its transaction keeps the row
+    locked until they are written, so duplicates wait for it.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    key_hash = Column(LargeBinary(32), primary_key=True)  # SHA-256 of endpoint and key
+    request_hash = Column(LargeBinary(32), nullable=False)  # SHA-256 of the request
+    status_code = Column(SmallInteger, nullable=True)
+    response = Column(JSONB, nullable=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
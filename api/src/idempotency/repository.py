@@ -0,0 +1,117 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import delete, func, null, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.idempotency.models import IdempotencyKey
+
+logger = get_logger(__name__)
+
+
+class IdempotencyRepository:
+    """Repository for stored idempotent request outcomes."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize IdempotencyRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+
+    async def set_lock_timeout(self, milliseconds: int) -> None:
+        """Limit how long the current transaction waits for row locks."""
+        await self.session.execute(
+            select(func.set_config("lock_timeout", f"{milliseconds}ms", True))
+        )
+
+    async def claim(
+        self,
+        user_id: int,
+        key_hash: bytes,
+        request_hash: bytes,
+        expires_at: datetime,
+    ) -> bool:
+        """Insert a key, or take over an expired one.
+
+        Uses INSERT ... ON CONFLICT DO UPDATE ... WHERE expired, so when
+        another transaction holds the same key uncommitted this waits for it
+        to finish. The key stays locked until the caller commits or rolls
+        back.
+
+        Args:
+            user_id (int): User sending the request
+            key_hash (bytes): Hash of the endpoint and key
+            request_hash (bytes): Hash of the request
+            expires_at (datetime): Time the stored outcome may be evicted
+
+        Returns:
+            bool: True if the key was claimed, False if it is in use
+        """
+        stmt = pg_insert(IdempotencyKey).values(
+            user_id=user_id,
+            key_hash=key_hash,
+            request_hash=request_hash,
+            expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[IdempotencyKey.user_id, IdempotencyKey.key_hash],
+            set_={
+                "request_hash": stmt.excluded.request_hash,
+                "status_code": None,
+                "response": null(),
+                "expires_at": stmt.excluded.expires_at,
+            },
+            where=IdempotencyKey.expires_at <= func.now(),
+        ).returning(IdempotencyKey.user_id)
+        return (await self.session.execute(stmt)).first() is not None
+
+    async def get(self, user_id: int, key_hash: bytes) -> Optional[IdempotencyKey]:
+        """Get a stored key.
+
+        Args:
+            user_id (int): User that sent the request
+            key_hash (bytes): Hash of the endpoint and key
+
+        Returns:
+            Optional[IdempotencyKey]: Stored key or None
+        """
+        return await self.session.get(IdempotencyKey, (user_id, key_hash))
+
+    async def complete(
+        self, user_id: int, key_hash: bytes, status_code: int, response: Any
+    ) -> None:
+        """Store the outcome of a claimed key.
+
+        The caller is responsible for committing.
+
+        Args:
+            user_id (int): User that sent the request
+            key_hash (bytes): Hash of the endpoint and key
+            status_code (int): HTTP status code of the response
+            response (Any): JSON compatible response body
+        """
+        await self.session.execute(
+            update(IdempotencyKey)
+            .where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key_hash == key_hash,
+            )
+            .values(status_code=status_code, response=response)
+        )
+
+    async def purge_expired(self) -> int:
+        """Delete every expired key.
+
+        The caller is responsible for committing.
+
+        Returns:
+            int: Number of keys deleted
+        """
+        result = await self.session.execute(
+            delete(IdempotencyKey).where(IdempotencyKey.expires_at <= func.now())
+        )
+        return result.rowcount
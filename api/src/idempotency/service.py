@@ -0,0 +1,146 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import settings
+from api.core.exceptions import BusinessRuleViolationException, ConflictException
+from api.core.logging import get_logger
+from api.src.idempotency.repository import IdempotencyRepository
+
+logger = get_logger(__name__)
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# SQLSTATE of lock_not_available, raised when the lock timeout expires
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def _digest(*parts: str) -> bytes:
+    """SHA-256 of the parts, separated so they cannot run into each other."""
+    return hashlib.sha256("\0".join(parts).encode()).digest()
+
+
+def request_fingerprint(request: Any) -> bytes:
+    """Hash a request independently of key order and formatting."""
+    return _digest(
+        json.dumps(jsonable_encoder(request), sort_keys=True, separators=(",", ":"))
+    )
+
+
+class IdempotencyService:
+    """Service running requests at most once per ``Idempotency-Key``.
+
+    The key is claimed in a transaction of its own session, which stays
+    open until the outcome is stored. A duplicate request blocks on the
+    claimed row in Postgres and replays the stored response once the first
+    request commits, or runs itself if the first one failed. Outcomes are
+    kept for ``IDEMPOTENCY_KEY_TTL_HOURS``; expired keys are reused on the
+    next claim and can be purged with the cli.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize IdempotencyService.
+
+        Args:
+            session (AsyncSession): Session used only for the key, separate
+                from the session doing the request's writes
+        """
+        self.session = session
+        self.repository = IdempotencyRepository(session)
+
+    async def run(
+        self,
+        key: Optional[str],
+        user_id: int,
+        endpoint: str,
+        request: Any,
+        handler: Callable[[], Awaitable[Any]],
+        status_code: int = status.HTTP_200_OK,
+    ) -> Union[Any, JSONResponse]:
+        """Run a request handler once per key and replay its response after.
+
+        Requests without a key run unchanged. Only successful responses are
+        stored; when the handler raises the key is released, so the request
+        can be retried.
+
+        Args:
+            key (Optional[str]): Value of the Idempotency-Key header
+            user_id (int): User sending the request
+            endpoint (str): Name of the endpoint, keys are scoped to it
+            request (Any): JSON compatible request data, a retry must send
+                the same data
+            handler (Callable[[], Awaitable[Any]]): Runs the request
+            status_code (int): Status code of the handler's response
+
+        Returns:
+            Union[Any, JSONResponse]: The handler's result, or the stored
+                response of an earlier request with the same key
+
+        Raises:
+            ConflictException: If the first request with the key is still
+                running after the wait timeout
+            BusinessRuleViolationException: If the key was used for a
+                different request
+        """
+        if key is None:
+            return await handler()
+
+        key_hash = _digest(endpoint, key)
+        request_hash = request_fingerprint(request)
+        expires_at = datetime.now(timezone.utc) + timedelta(
+            hours=settings.IDEMPOTENCY_KEY_TTL_HOURS
+        )
+
+        try:
+            await self.repository.set_lock_timeout(
+                settings.IDEMPOTENCY_WAIT_SECONDS * 1000
+            )
+            claimed = await self.repository.claim(
+                user_id, key_hash, request_hash, expires_at
+            )
+        except DBAPIError as e:
+            await self.session.rollback()
+            if getattr(e.orig, "sqlstate", None) == LOCK_NOT_AVAILABLE:
+                raise ConflictException(
+                    "A request with this Idempotency-Key is still being processed"
+                ) from e
+            raise
+
+        if not claimed:
+            stored = await self.repository.get(user_id, key_hash)
+            await self.session.rollback()
+            if stored is None or stored.status_code is None:
+                raise ConflictException(
+                    "A request with this Idempotency-Key is still being processed"
+                )
+            if stored.request_hash != request_hash:
+                raise BusinessRuleViolationException(
+                    "Idempotency-Key was already used for a different request"
+                )
+
+            logger.info(f"Replaying {endpoint} response for user {user_id}")
+            return JSONResponse(
+                content=stored.response,
+                status_code=stored.status_code,
+                headers={REPLAYED_HEADER: "true"},
+            )
+
+        try:
+            result = await handler()
+        except BaseException:
+            await self.session.rollback()
+            raise
+
+        await self.repository.complete(
+            user_id, key_hash, status_code, jsonable_encoder(result)
+        )
+        await self.session.commit()
+        return result
@@ -0,0 +1 @@
+# Late fees module
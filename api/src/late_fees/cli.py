@@ -0,0 +1,47 @@
+"""Charge late fees from the command line.
+
+Usage:
+    python -m api.src.late_fees.cli [--period YYYY-MM-DD] [--owner-id ID] [--dry-run]
+
+Charges the previous month by default; schedule it monthly, e.g. via cron
+on the first day of the month.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+
+from api.core.database import async_session
+from api.src.late_fees.schemas import LateFeeRunCreate
+from api.src.late_fees.service import LateFeeService
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Charge late fees on every unpaid payment past due."
+    )
+    parser.add_argument(
+        "--period",
+        type=date.fromisoformat,
+        default=None,
+        help="Any day of the month to charge",
+    )
+    parser.add_argument(
+        "--owner-id",
+        type=int,
+        default=None,
+        help="Only charge this owner's properties",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Compute fees only")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    run_data = LateFeeRunCreate(period=args.period, dry_run=args.dry_run)
+    async with async_session() as session:
+        result = await LateFeeService(session).run(run_data, owner_id=args.owner_id)
+    print(result.model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
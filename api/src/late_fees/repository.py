@@ -0,0 +1,117 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Row, not_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.billing.repository import BillingRepository
+from api.src.enums.enums_late_fee_policy import EnumLateFeePolicy
+from api.src.leases.models import Lease
+from api.src.payments.models import Payment
+from api.src.properties.models import Property
+from api.src.units.models import Unit
+from api.src.users.models import User
+
+logger = get_logger(__name__)
+
+# Leases per IN list, keeps bind parameters well below the asyncpg limit
+LOOKUP_BATCH_SIZE = 1000
+
+
+class LateFeeRepository:
+    """Repository for set-based late fee run queries."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize LateFeeRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.billing = BillingRepository(session)
+
+    async def get_overdue_payments(
+        self,
+        due_before: date,
+        fee_document_type: str,
+        owner_id: Optional[int] = None,
+    ) -> list[Row]:
+        """Get every unpaid lease payment due before a date.
+
+        Only the columns needed to compute fees are selected. Late fees
+        themselves are skipped, so no interest is charged on them.
+
+        Args:
+            due_before (date): Only payments due before this day
+            fee_document_type (str): Document type of late fee payments
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            list[Row]: Rows with lease_id, due_date, gross_value,
+                late_fee_policy, interest_rate, late_fee_amount and grace_days
+        """
+        stmt = (
+            select(
+                Payment.lease_id,
+                Payment.due_date,
+                Payment.gross_value,
+                Lease.late_fee_policy,
+                Lease.interest_rate,
+                Lease.late_fee_amount,
+                Lease.grace_days,
+            )
+            .join(Lease, Payment.lease_id == Lease.id)
+            .where(
+                not_(Payment.is_paid),
+                Payment.due_date < due_before,
+                Payment.document_type != fee_document_type,
+                Lease.late_fee_policy != EnumLateFeePolicy.NONE,
+            )
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Payment.owner_id == owner_id)
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def get_lease_payees(self, lease_ids: list[int]) -> list[Row]:
+        """Get the ownership and tenant name of leases to charge.
+
+        Args:
+            lease_ids (list[int]): Leases to look up
+
+        Returns:
+            list[Row]: Rows with id, property_id, owner_id, first_name and
+                last_name
+        """
+        rows = []
+        for start in range(0, len(lease_ids), LOOKUP_BATCH_SIZE):
+            stmt = (
+                select(
+                    Lease.id,
+                    Unit.property_id,
+                    Property.owner_id,
+                    User.first_name,
+                    User.last_name,
+                )
+                .join(Unit, Lease.unit_id == Unit.id)
+                .join(Property, Unit.property_id == Property.id)
+                .join(User, Lease.tenant_id == User.id)
+                .where(Lease.id.in_(lease_ids[start : start + LOOKUP_BATCH_SIZE]))
+            )
+            rows.extend((await self.session.execute(stmt)).all())
+        return rows
+
+    async def insert_fees(self, payments: list[dict]) -> int:
+        """Insert late fee payments, skipping periods that were already charged.
+
+        The caller is responsible for committing.
+
+        Args:
+            payments (list[dict]): Payment column values
+
+        Returns:
+            int: Number of payments actually inserted
+        """
+        return await self.billing.insert_missing_payments(payments)
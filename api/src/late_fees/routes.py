@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.database import get_session
+from api.core.logging import get_logger
+from api.core.security import Principal, get_current_user
+from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.late_fees.schemas import LateFeeRunCreate, LateFeeRunResponse
+from api.src.late_fees.service import LateFeeService
+from api.src.utils.access_verify import is_owner_or_admin
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/late-fees", tags=["late-fees"])
+
+
+def get_late_fee_service(
+    session: AsyncSession = Depends(get_session),
+) -> LateFeeService:
+    """Get late fee service instance."""
+    return LateFeeService(session)
+
+
+@router.post("/runs", response_model=LateFeeRunResponse)
+async def create_late_fee_run(
+    run_data: LateFeeRunCreate,
+    service: LateFeeService = Depends(get_late_fee_service),
+    current_user: Principal = Depends(get_current_user),
+) -> LateFeeRunResponse:
+    """Charge late fees of a month on every unpaid payment past due.
+
+    Admins charge the whole portfolio, owners only their own properties.
+    Repeating a run for the same month never charges twice.
+    Requires: ADMIN or OWNER role
+    """
+    is_owner_or_admin(current_user)
+
+    logger.info(f"Starting late fee run {run_data.period} by user {current_user.id}")
+    owner_id = current_user.id if current_user.role == EnumUserRoles.OWNER else None
+    return await service.run(run_data, owner_id=owner_id)
@@ -0,0 +1,29 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class LateFeeRunCreate(BaseModel):
+    """Schema for starting a late fee run over overdue payments."""
+
+    period: Optional[date] = Field(
+        None,
+        description="Any day of the month to charge (defaults to the previous month)",
+    )
+    dry_run: bool = Field(False, description="Only compute the fees, write nothing")
+
+
+class LateFeeRunResponse(BaseModel):
+    """Summary of a completed late fee run."""
+
+    period_start: date
+    period_end: date
+    due_date: date
+    dry_run: bool
+    payments_scanned: int
+    leases_charged: int
+    fees_created: int
+    periods_already_charged: int
+    total_amount: float
+    duration_ms: int
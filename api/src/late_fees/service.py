@@ -0,0 +1,204 @@
+import calendar
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import settings
+from api.core.exceptions import BusinessRuleViolationException
+from api.core.logging import get_logger
+from api.src.enums.enums_late_fee_policy import EnumLateFeePolicy
+from api.src.late_fees.repository import LateFeeRepository
+from api.src.late_fees.schemas import LateFeeRunCreate, LateFeeRunResponse
+
+logger = get_logger(__name__)
+
+LATE_FEE_DOCUMENT_TYPE = "Late Fee"
+
+# Days after the end of the charged month the late fee payment falls due
+FEE_DUE_DAYS = 14
+
+DAYS_PER_YEAR = 365
+
+
+def compute_late_fees(
+    period_start: date,
+    period_end: date,
+    due_dates: np.ndarray,
+    amounts: np.ndarray,
+    annual_rates: np.ndarray,
+    flat_fees: np.ndarray,
+    grace_days: np.ndarray,
+) -> np.ndarray:
+    """Compute the late fees many overdue payments accrue within a period.
+
+    The delay starts the day after the due date plus the grace days.
+    Interest accrues for every day of delay within the period at
+    ``annual_rates`` percent per 365 day year; flat fees are charged once,
+    in the period the delay starts.
+
+    Args:
+        period_start (date): First day of the period
+        period_end (date): Last day of the period
+        due_dates (np.ndarray): Due dates of the payments (``datetime64[D]``)
+        amounts (np.ndarray): Amounts of the payments
+        annual_rates (np.ndarray): Annual interest in percent, 0 for none
+        flat_fees (np.ndarray): Flat fee per payment, 0 for none
+        grace_days (np.ndarray): Days of delay without fees
+
+    Returns:
+        np.ndarray: Fee of every payment in cents, not rounded
+    """
+    start = np.datetime64(period_start, "D")
+    end = np.datetime64(period_end, "D")
+    delay_start = due_dates + (grace_days + 1).astype("timedelta64[D]")
+
+    days = np.maximum((end - np.maximum(delay_start, start)).astype(np.int64) + 1, 0)
+    interest_cents = amounts * annual_rates * days / DAYS_PER_YEAR
+    flat_cents = (
+        np.where((delay_start >= start) & (delay_start <= end), flat_fees, 0) * 100
+    )
+    return interest_cents + flat_cents
+
+
+class LateFeeService:
+    """Service charging late fees on overdue payments."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize LateFeeService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = LateFeeRepository(session)
+
+    async def run(
+        self, run_data: LateFeeRunCreate, owner_id: Optional[int] = None
+    ) -> LateFeeRunResponse:
+        """Charge the late fees of a month on every unpaid payment past due.
+
+        Fees of all overdue payments are computed at once with NumPy per the
+        lease's late fee policy and summed into one "Late Fee" payment per
+        lease, due a fixed number of days after the month. The payments are
+        written with bulk inserts on the (lease, due date, document type)
+        key, so a month is charged at most once and runs can be repeated.
+
+        Args:
+            run_data (LateFeeRunCreate): Month to charge and options
+            owner_id (Optional[int]): Restrict the run to properties of this owner
+
+        Returns:
+            LateFeeRunResponse: Summary of scanned payments and created fees
+
+        Raises:
+            BusinessRuleViolationException: If the month has not ended yet
+        """
+        started = perf_counter()
+        today = date.today()
+        period = run_data.period or today.replace(day=1) - timedelta(days=1)
+        period_start = period.replace(day=1)
+        period_end = period.replace(
+            day=calendar.monthrange(period.year, period.month)[1]
+        )
+        if period_end >= today:
+            raise BusinessRuleViolationException(
+                "Late fees can only be charged for months that have ended"
+            )
+        due_date = period_end + timedelta(days=FEE_DUE_DAYS)
+
+        overdue = await self.repository.get_overdue_payments(
+            period_end, LATE_FEE_DOCUMENT_TYPE, owner_id=owner_id
+        )
+
+        policies = np.array([row.late_fee_policy.value for row in overdue], dtype=str)
+        fee_cents = compute_late_fees(
+            period_start,
+            period_end,
+            np.array([row.due_date for row in overdue], dtype="datetime64[D]"),
+            np.array([row.gross_value for row in overdue], dtype=np.float64),
+            np.select(
+                [
+                    policies == EnumLateFeePolicy.STATUTORY_INTEREST.value,
+                    policies == EnumLateFeePolicy.CONTRACTUAL_INTEREST.value,
+                ],
+                [
+                    settings.STATUTORY_INTEREST_RATE,
+                    np.array([row.interest_rate or 0 for row in overdue], dtype=float),
+                ],
+                0.0,
+            ),
+            np.where(
+                policies == EnumLateFeePolicy.FLAT_FEE.value,
+                np.array([row.late_fee_amount or 0 for row in overdue], dtype=float),
+                0.0,
+            ),
+            np.array([row.grace_days for row in overdue], dtype=np.int64),
+        )
+
+        # One fee per lease, summed before rounding to cents
+        lease_ids, lease_index = np.unique(
+            np.array([row.lease_id for row in overdue], dtype=np.int64),
+            return_inverse=True,
+        )
+        lease_cents = np.rint(
+            np.bincount(lease_index, weights=fee_cents, minlength=len(lease_ids))
+        ).astype(np.int64)
+        lease_payments = np.bincount(
+            lease_index, weights=fee_cents > 0, minlength=len(lease_ids)
+        ).astype(np.int64)
+        charged = np.flatnonzero(lease_cents > 0)
+
+        payees = {
+            row.id: row
+            for row in await self.repository.get_lease_payees(
+                lease_ids[charged].tolist()
+            )
+        }
+        fees = []
+        for index in charged.tolist():
+            lease = payees.get(int(lease_ids[index]))
+            if lease is None:
+                continue
+            fees.append(
+                {
+                    "document_type": LATE_FEE_DOCUMENT_TYPE,
+                    "gross_value": int(lease_cents[index]) / 100,
+                    "due_date": due_date,
+                    "receiver": f"{lease.first_name} {lease.last_name}",
+                    "description": (
+                        f"Late fees for {period_start:%B %Y} on "
+                        f"{lease_payments[index]} overdue payment(s)"
+                    ),
+                    "is_paid": False,
+                    "lease_id": lease.id,
+                    "property_id": lease.property_id,
+                    "owner_id": lease.owner_id,
+                }
+            )
+
+        if run_data.dry_run:
+            fees_created = len(fees)
+        else:
+            fees_created = await self.repository.insert_fees(fees)
+            await self.session.commit()
+
+        duration_ms = int((perf_counter() - started) * 1000)
+        logger.info(
+            f"Late fee run {period_start:%Y-%m}: scanned {len(overdue)} overdue "
+            f"payments, created {fees_created} fees in {duration_ms} ms"
+        )
+        return LateFeeRunResponse(
+            period_start=period_start,
+            period_end=period_end,
+            due_date=due_date,
+            dry_run=run_data.dry_run,
+            payments_scanned=len(overdue),
+            leases_charged=len(fees),
+            fees_created=fees_created,
+            periods_already_charged=len(fees) - fees_created,
+            total_amount=round(sum(fee["gross_value"] for fee in fees), 2),
+            duration_ms=duration_ms,
+        )
@@ -3,14 +3,17 @@ from sqlalchemy import (
     Column,
     Date,
     DateTime,
+    Float,
     ForeignKey,
     Integer,
     UniqueConstraint,
     func,
 )
+from sqlalchemy import Enum as saEnum
 from sqlalchemy.orm import relationship
 
 from api.core.database import Base
+from api.src.enums.enums_late_fee_policy import EnumLateFeePolicy
 
 
 class Lease(Base):
@@ -31,6 +34,17 @@ class Lease(Base):
     end_date = Column(Date, nullable=True)  # null means ongoing
     is_active = Column(Boolean, default=True, nullable=False)
 
+    # Charges for overdue payments, see api.src.late_fees
+    late_fee_policy = Column(
+        saEnum(EnumLateFeePolicy, name="enumlatefeepolicy"),
+        default=EnumLateFeePolicy.STATUTORY_INTEREST,
+        server_default=EnumLateFeePolicy.STATUTORY_INTEREST.name,
+        nullable=False,
+    )
+    interest_rate = Column(Float, nullable=True)  # annual %, contractual interest
+    late_fee_amount = Column(Float, nullable=True)  # flat fee per overdue payment
+    grace_days = Column(Integer, default=0, server_default="0", nullable=False)
+
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
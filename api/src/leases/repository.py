@@ -97,6 +97,10 @@ class LeaseRepository:
             start_date=data.start_date,
             end_date=data.end_date,
             is_active=True,
+            late_fee_policy=data.late_fee_policy,
+            interest_rate=data.interest_rate,
+            late_fee_amount=data.late_fee_amount,
+            grace_days=data.grace_days,
         )
         self.session.add(lease)
         try:
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.enums import EnumUserRoles
 from api.src.leases.schemas import LeaseCreate, LeaseEnd, LeaseResponse
 from api.src.leases.service import LeaseService
-from api.src.users.models import User
+from api.src.ownership.service import OwnershipService, get_ownership_service
+from api.src.payments.schemas import LedgerResponse
+from api.src.payments.service import PaymentService
 from api.src.utils.access_verify import is_owner_or_admin
 
 logger = get_logger(__name__)
@@ -23,7 +28,8 @@ def get_lease_service(session: AsyncSession = Depends(get_session)) -> LeaseServ
 async def create_lease(
     lease_data: LeaseCreate,
     service: LeaseService = Depends(get_lease_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     """Create a new lease for a unit."""
     logger.debug(
@@ -32,21 +38,16 @@ async def create_lease(
         current_user.id,
     )
     # Only owner of the property (via unit) or admin can assign tenant
-    unit = await service.get_unit_by_id(lease_data.unit_id)
-    if not unit:
-        raise HTTPException(status_code=404, detail="Unit not found")
-
-    property_ = await service.get_property_by_id(unit.property_id)
-    if not property_:
-        raise HTTPException(status_code=404, detail="Property not found")
-
-    if not (
-        current_user.role == EnumUserRoles.ADMIN
-        or property_.owner_id == current_user.id
-    ):
-        raise HTTPException(
-            status_code=403, detail="Not authorized to assign tenant to this unit"
-        )
+    await ownership.authorize(
+        current_user,
+        "unit",
+        lease_data.unit_id,
+        detail="Not authorized to assign tenant to this unit",
+    )
+    if current_user.role == EnumUserRoles.ADMIN:
+        unit = await service.get_unit_by_id(lease_data.unit_id)
+        if not unit:
+            raise HTTPException(status_code=404, detail="Unit not found")
     return await service.create_lease(lease_data)
 
 
@@ -55,10 +56,14 @@ async def end_lease(
     lease_id: int,
     end_data: LeaseEnd,
     service: LeaseService = Depends(get_lease_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     """End an existing lease."""
     logger.debug("Ending lease lease_id=%s by user_id=%s", lease_id, current_user.id)
+    await ownership.authorize(
+        current_user, "lease", lease_id, detail="Not authorized to end this lease"
+    )
     return await service.end_lease(lease_id, end_data)
 
 
@@ -66,19 +71,23 @@ async def end_lease(
 async def activate_lease(
     lease_id: int,
     service: LeaseService = Depends(get_lease_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     """Activate an existing lease."""
     logger.debug(
         "Activating lease lease_id=%s by user_id=%s", lease_id, current_user.id
     )
+    await ownership.authorize(
+        current_user, "lease", lease_id, detail="Not authorized to activate this lease"
+    )
     return await service.activate_lease(lease_id)
 
 
 @router.get("/", response_model=list[LeaseResponse])
 async def get_all_leases(
     service: LeaseService = Depends(get_lease_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """Get all leases - admin only."""
     is_owner_or_admin(current_user)
@@ -99,20 +108,30 @@ async def get_all_leases(
 async def list_tenant_leases(
     tenant_id: int,
     service: LeaseService = Depends(get_lease_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     """List all leases for a tenant."""
     logger.debug(
         "Listing leases for tenant_id=%s by user_id=%s", tenant_id, current_user.id
     )
-    # tenant can see own; owner/admin can query their tenants (enforce outside)
+    # tenant can see own; owner/admin can query their tenants
+    if not (
+        current_user.role == EnumUserRoles.TENANT and tenant_id == current_user.id
+    ):
+        await ownership.authorize(
+            current_user,
+            "tenant",
+            tenant_id,
+            detail="Not authorized to view leases of this tenant",
+        )
     return await service.list_leases_for_tenant(tenant_id)
 
 
 @router.get("/owner", response_model=list[LeaseResponse])
 async def list_owner_leases(
     service: LeaseService = Depends(get_lease_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """List all leases for properties owned by the current user."""
     logger.debug("Listing leases for property owner user_id=%s", current_user.id)
@@ -129,3 +148,49 @@ async def list_owner_leases(
     logger.info(f"Found {len(leases)} leases for owner {current_user.id}")
 
     return leases
+
+
+@router.get("/{lease_id}/ledger", response_model=LedgerResponse)
+async def get_lease_ledger(
+    lease_id: int,
+    start_date: Optional[date] = Query(None, description="First due date"),
+    end_date: Optional[date] = Query(None, description="Last due date"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    include_total: bool = Query(
+        False, description="Also return the total number of matching entries"
+    ),
+    session: AsyncSession = Depends(get_session),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
+) -> LedgerResponse:
+    """Get charges, payments and the running balance of a lease.
+
+    Balances include every entry before start_date. Tenants only see their
+    own leases and owners leases on their own properties.
+    """
+    logger.debug(
+        "Getting ledger of lease_id=%s by user_id=%s", lease_id, current_user.id
+    )
+    tenant_id = None
+    if current_user.role == EnumUserRoles.TENANT:
+        tenant_id = current_user.id
+    else:
+        await ownership.authorize(
+            current_user,
+            "lease",
+            lease_id,
+            detail="Not authorized to view the ledger of this lease",
+        )
+
+    return await PaymentService(session).get_ledger(
+        lease_id=lease_id,
+        tenant_id=tenant_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
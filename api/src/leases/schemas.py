@@ -1,7 +1,9 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
+
+from api.src.enums.enums_late_fee_policy import EnumLateFeePolicy
 
 
 class LeaseBase(BaseModel):
@@ -12,7 +14,30 @@ class LeaseBase(BaseModel):
 
 
 class LeaseCreate(LeaseBase):
-    pass
+    late_fee_policy: EnumLateFeePolicy = EnumLateFeePolicy.STATUTORY_INTEREST
+    interest_rate: Optional[float] = Field(
+        None, gt=0, description="Annual interest in percent, for contractual interest"
+    )
+    late_fee_amount: Optional[float] = Field(
+        None, gt=0, description="Fee per overdue payment, for flat fees"
+    )
+    grace_days: int = Field(
+        0, ge=0, description="Days after the due date before late fees apply"
+    )
+
+    @model_validator(mode="after")
+    def validate_late_fee_policy(self):
+        if (
+            self.late_fee_policy == EnumLateFeePolicy.CONTRACTUAL_INTEREST
+            and self.interest_rate is None
+        ):
+            raise ValueError("interest_rate is required for contractual interest")
+        if (
+            self.late_fee_policy == EnumLateFeePolicy.FLAT_FEE
+            and self.late_fee_amount is None
+        ):
+            raise ValueError("late_fee_amount is required for flat late fees")
+        return self
 
 
 class LeaseUpdate(LeaseBase):
@@ -60,6 +85,10 @@ class LeaseResponse(LeaseBase):
     start_date: date
     end_date: Optional[date]
     is_active: bool
+    late_fee_policy: EnumLateFeePolicy = EnumLateFeePolicy.STATUTORY_INTEREST
+    interest_rate: Optional[float] = None
+    late_fee_amount: Optional[float] = None
+    grace_days: int = 0
 
     user: Optional[UserInfo] = None
     unit: Optional[UnitInfo] = None
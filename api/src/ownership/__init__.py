@@ -0,0 +1 @@
+# Ownership module
@@ -0,0 +1,84 @@
+from typing import Literal
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.src.leases.models import Lease
+from api.src.payments.models import Payment
+from api.src.properties.models import Property
+from api.src.units.models import Unit
+
+OwnedResource = Literal["property", "unit", "lease", "payment", "tenant"]
+
+
+class OwnershipRepository:
+    """Repository answering whether an owner owns a resource.
+
+    Each check is one ``EXISTS`` query following primary keys (or the
+    indexed ``leases.tenant_id`` and ``payments.owner_id``) up to the
+    property, so no row is loaded.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def owns(
+        self, resource: OwnedResource, owner_id: int, resource_id: int
+    ) -> bool:
+        """Check whether a resource belongs to a property of an owner.
+
+        A tenant belongs to an owner if they ever leased a unit on one of
+        the owner's properties.
+
+        Args:
+            resource (OwnedResource): Kind of resource
+            owner_id (int): Property owner ID
+            resource_id (int): ID of the property, unit, lease, payment or
+                tenant
+
+        Returns:
+            bool: True if the owner owns the resource, False if not or if it
+                does not exist
+        """
+        query = select(ownership_query(resource, owner_id, resource_id).exists())
+        return bool(await self.session.scalar(query))
+
+
+def ownership_query(
+    resource: OwnedResource, owner_id: int, resource_id: int
+) -> Select:
+    """Query selecting a row only if ``owner_id`` owns the resource.
+
+    Raises:
+        ValueError: If the kind of resource is unknown
+    """
+    if resource == "property":
+        return select(Property.id).where(
+            Property.id == resource_id, Property.owner_id == owner_id
+        )
+    if resource == "unit":
+        return (
+            select(Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .where(Unit.id == resource_id, Property.owner_id == owner_id)
+        )
+    if resource == "lease":
+        return (
+            select(Lease.id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .where(Lease.id == resource_id, Property.owner_id == owner_id)
+        )
+    if resource == "payment":
+        # owner_id is denormalized onto payments, see PaymentRepository
+        return select(Payment.id).where(
+            Payment.id == resource_id, Payment.owner_id == owner_id
+        )
+    if resource == "tenant":
+        return (
+            select(Lease.id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .where(Lease.tenant_id == resource_id, Property.owner_id == owner_id)
+        )
+    raise ValueError(f"Unknown owned resource: {resource}")
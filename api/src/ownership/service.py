@@ -0,0 +1,99 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import settings
+from api.core.database import get_session
+from api.core.exceptions import ForbiddenException
+from api.core.logging import get_logger
+from api.core.security import Principal
+from api.src.enums import EnumUserRoles
+from api.src.ownership.repository import OwnedResource, OwnershipRepository
+from api.src.utils.cache import TTLCache
+
+logger = get_logger(__name__)
+
+# Successful checks per (resource, owner, resource ID). Only grants are
+# cached, so a resource created a moment ago is never denied.
+OWNERSHIP_CACHE: TTLCache[tuple[str, int, int], bool] = TTLCache(
+    maxsize=4096, ttl=settings.OWNERSHIP_CACHE_SECONDS
+)
+
+
+def invalidate_ownership() -> None:
+    """Drop the cached grants of this process.
+
+    Call after committing a change that moves resources to another owner
+    or deletes them. Other processes keep their grants until they expire.
+    """
+    OWNERSHIP_CACHE.clear()
+
+
+class OwnershipService:
+    """Service resolving whether owners own properties and what is on them."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize OwnershipService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.repository = OwnershipRepository(session)
+
+    async def owns(
+        self, resource: OwnedResource, owner_id: int, resource_id: int
+    ) -> bool:
+        """Check whether an owner owns a resource, cached per process.
+
+        Args:
+            resource (OwnedResource): Kind of resource
+            owner_id (int): Property owner ID
+            resource_id (int): ID of the resource
+
+        Returns:
+            bool: True if the owner owns the resource
+        """
+        key = (resource, owner_id, resource_id)
+        if OWNERSHIP_CACHE.get(key):
+            return True
+        owned = await self.repository.owns(resource, owner_id, resource_id)
+        if owned:
+            OWNERSHIP_CACHE.set(key, True)
+        return owned
+
+    async def authorize(
+        self,
+        current_user: Principal,
+        resource: OwnedResource,
+        resource_id: int,
+        detail: str,
+    ) -> None:
+        """Allow admins, and owners of the resource.
+
+        Resources that do not exist are forbidden for owners, so they
+        cannot probe IDs of other owners.
+
+        Args:
+            current_user (Principal): Authenticated user
+            resource (OwnedResource): Kind of resource
+            resource_id (int): ID of the resource
+            detail (str): Error message when access is denied
+
+        Raises:
+            ForbiddenException: If the user is neither an admin nor the owner
+        """
+        if current_user.role == EnumUserRoles.ADMIN:
+            return
+        if current_user.role != EnumUserRoles.OWNER or not await self.owns(
+            resource, current_user.id, resource_id
+        ):
+            logger.warning(
+                f"Access denied for user {current_user.id} to {resource} {resource_id}"
+            )
+            raise ForbiddenException(detail=detail)
+
+
+def get_ownership_service(
+    session: AsyncSession = Depends(get_session),
+) -> OwnershipService:
+    """Dependency for getting ownership service instance."""
+    return OwnershipService(session)
@@ -0,0 +1 @@
+# Payment analytics module
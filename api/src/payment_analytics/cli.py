@@ -0,0 +1,47 @@
+"""Maintain the payment analytics rollup from the command line.
+
+Usage:
+    python -m api.src.payment_analytics.cli refresh [--owner-id ID]
+    python -m api.src.payment_analytics.cli rebuild [--owner-id ID]
+
+``refresh`` recomputes the months whose payments changed since the last
+refresh. The analytics endpoint refreshes on read as well; scheduling the
+refresh (e.g. via cron every few minutes) keeps those reads cheap after
+large imports. ``rebuild`` recomputes the whole rollup.
+"""
+
+import argparse
+import asyncio
+
+from api.core.database import async_session
+from api.src.payment_analytics.repository import PaymentAnalyticsRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Refresh or rebuild the payment analytics rollup."
+    )
+    parser.add_argument("command", choices=["refresh", "rebuild"])
+    parser.add_argument(
+        "--owner-id", type=int, default=None, help="Only process this owner"
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with async_session() as session:
+        repository = PaymentAnalyticsRepository(session)
+
+        if args.command == "refresh":
+            refreshed = await repository.refresh(owner_id=args.owner_id)
+            await session.commit()
+            print(f"Refreshed {refreshed} months")
+            return
+
+        rebuilt = await repository.rebuild(owner_id=args.owner_id)
+        await session.commit()
+        print(f"Rebuilt {rebuilt} analytics rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
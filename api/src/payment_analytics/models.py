@@ -0,0 +1,59 @@
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    String,
+    func,
+)
+
+from api.core.database import Base
+
+
+class PaymentAnalytics(Base):
+    """Daily payment totals per owner, property and document type.
+
+    A rollup of the payments table for the dashboard analytics. Months whose
+    payments changed are queued in ``payment_analytics_dirty_months`` by a
+    trigger on ``payments`` and recomputed by
+    PaymentAnalyticsRepository.refresh.
+    """
+
+    __tablename__ = "payment_analytics"
+
+    owner_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    due_date = Column(Date, primary_key=True)
+    property_id = Column(
+        Integer, ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True
+    )
+    document_type = Column(String, primary_key=True)
+
+    payment_count = Column(Integer, nullable=False, default=0)
+    paid_count = Column(Integer, nullable=False, default=0)
+    amount = Column(Numeric(14, 2), nullable=False, default=0)
+    paid_amount = Column(Numeric(14, 2), nullable=False, default=0)
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class PaymentAnalyticsDirtyMonth(Base):
+    """A month of an owner's property whose analytics are out of date.
+
+    Rows are inserted by the ``payments`` triggers for the old and new
+    values of every changed payment and consumed by the refresh.
+    """
+
+    __tablename__ = "payment_analytics_dirty_months"
+
+    owner_id = Column(Integer, primary_key=True)
+    property_id = Column(Integer, primary_key=True)
+    month = Column(Date, primary_key=True)
@@ -0,0 +1,276 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Integer,
+    Numeric,
+    Row,
+    case,
+    cast,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    tuple_,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.payment_analytics.models import (
+    PaymentAnalytics,
+    PaymentAnalyticsDirtyMonth,
+)
+from api.src.payment_analytics.schemas import AnalyticsPeriod
+from api.src.payments.models import Payment
+from api.src.properties.models import Property
+
+logger = get_logger(__name__)
+
+CELL_COLUMNS = (
+    "owner_id",
+    "due_date",
+    "property_id",
+    "document_type",
+    "payment_count",
+    "paid_count",
+    "amount",
+    "paid_amount",
+)
+
+# date_trunc field of each series period
+PERIOD_FIELDS = {
+    AnalyticsPeriod.DAILY: "day",
+    AnalyticsPeriod.WEEKLY: "week",
+    AnalyticsPeriod.MONTHLY: "month",
+}
+
+# Dirty months per VALUES list, keeps bind parameters well below the asyncpg limit
+REFRESH_BATCH_SIZE = 1000
+
+
+class PaymentAnalyticsRepository:
+    """Repository maintaining and querying the payment analytics rollup."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize PaymentAnalyticsRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+
+    def _cells(self):
+        """Rollup rows recomputed from payments, one per day, property and type."""
+        amount = cast(Payment.gross_value, Numeric(14, 2))
+        return (
+            select(
+                Payment.owner_id,
+                Payment.due_date,
+                Payment.property_id,
+                Payment.document_type,
+                func.count().label("payment_count"),
+                func.count().filter(Payment.is_paid).label("paid_count"),
+                func.sum(amount).label("amount"),
+                func.coalesce(func.sum(amount).filter(Payment.is_paid), 0).label(
+                    "paid_amount"
+                ),
+            )
+            .where(Payment.owner_id.isnot(None), Payment.property_id.isnot(None))
+            .group_by(
+                Payment.owner_id,
+                Payment.due_date,
+                Payment.property_id,
+                Payment.document_type,
+            )
+        )
+
+    async def refresh(self, owner_id: Optional[int] = None) -> int:
+        """Recompute the analytics of every month whose payments changed.
+
+        Dirty months are taken off the queue and their rollup rows replaced
+        with rows recomputed from payments, so the cost depends on the
+        number of changed months, not on the size of the payments table.
+        Months dirtied by concurrent writes stay queued for the next refresh.
+        The caller is responsible for committing.
+
+        Args:
+            owner_id (Optional[int]): Only refresh this owner's analytics
+
+        Returns:
+            int: Number of months recomputed
+        """
+        stmt = delete(PaymentAnalyticsDirtyMonth).returning(
+            PaymentAnalyticsDirtyMonth.owner_id,
+            PaymentAnalyticsDirtyMonth.property_id,
+            PaymentAnalyticsDirtyMonth.month,
+        )
+        if owner_id is not None:
+            stmt = stmt.where(PaymentAnalyticsDirtyMonth.owner_id == owner_id)
+        months = [tuple(row) for row in await self.session.execute(stmt)]
+
+        for start in range(0, len(months), REFRESH_BATCH_SIZE):
+            dirty = values(
+                column("owner_id", Integer),
+                column("property_id", Integer),
+                column("month", Date),
+                name="dirty",
+            ).data(months[start : start + REFRESH_BATCH_SIZE])
+            month_end = dirty.c.month + literal_column("interval '1 month'")
+
+            await self.session.execute(
+                delete(PaymentAnalytics).where(
+                    PaymentAnalytics.owner_id == dirty.c.owner_id,
+                    PaymentAnalytics.property_id == dirty.c.property_id,
+                    PaymentAnalytics.due_date >= dirty.c.month,
+                    PaymentAnalytics.due_date < month_end,
+                )
+            )
+            await self.session.execute(
+                pg_insert(PaymentAnalytics).from_select(
+                    CELL_COLUMNS,
+                    self._cells().join(
+                        dirty,
+                        (Payment.owner_id == dirty.c.owner_id)
+                        & (Payment.property_id == dirty.c.property_id)
+                        & (Payment.due_date >= dirty.c.month)
+                        & (Payment.due_date < month_end),
+                    ),
+                )
+            )
+
+        if months:
+            logger.info(f"Refreshed payment analytics of {len(months)} months")
+        return len(months)
+
+    async def rebuild(self, owner_id: Optional[int] = None) -> int:
+        """Recompute the analytics from scratch.
+
+        The caller is responsible for committing.
+
+        Args:
+            owner_id (Optional[int]): Only rebuild this owner's analytics
+
+        Returns:
+            int: Number of rollup rows written
+        """
+        cells = self._cells()
+        delete_rows = delete(PaymentAnalytics)
+        delete_months = delete(PaymentAnalyticsDirtyMonth)
+        if owner_id is not None:
+            cells = cells.where(Payment.owner_id == owner_id)
+            delete_rows = delete_rows.where(PaymentAnalytics.owner_id == owner_id)
+            delete_months = delete_months.where(
+                PaymentAnalyticsDirtyMonth.owner_id == owner_id
+            )
+        await self.session.execute(delete_months)
+        await self.session.execute(delete_rows)
+
+        result = await self.session.execute(
+            pg_insert(PaymentAnalytics).from_select(CELL_COLUMNS, cells)
+        )
+        return result.rowcount
+
+    async def get_cube(
+        self,
+        start_date: date,
+        end_date: date,
+        previous_start_date: date,
+        period: AnalyticsPeriod,
+        owner_id: Optional[int] = None,
+        property_id: Optional[int] = None,
+        document_type: Optional[str] = None,
+    ) -> list[Row]:
+        """Aggregate the rollup for the selected and the previous period.
+
+        GROUPING SETS return the series buckets, the period totals and the
+        totals per property and per document type of both periods from a
+        single scan of the rollup.
+
+        Args:
+            start_date (date): First due date of the selected period
+            end_date (date): Last due date of the selected period
+            previous_start_date (date): First due date of the previous period,
+                which ends the day before start_date
+            period (AnalyticsPeriod): Width of the series buckets
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            property_id (Optional[int]): Restrict to a single property
+            document_type (Optional[str]): Restrict to a single document type
+
+        Returns:
+            list[Row]: Rows with ``level`` ("bucket", "total", "property" or
+                "document_type"), ``span`` ("current" or "previous"),
+                period_start, property_id, property_title, document_type and
+                the figures
+        """
+        field = literal_column(f"'{PERIOD_FIELDS[period]}'")
+        cells = select(
+            PaymentAnalytics,
+            case(
+                (PaymentAnalytics.due_date >= start_date, "current"),
+                else_="previous",
+            ).label("span"),
+            cast(
+                func.date_trunc(field, cast(PaymentAnalytics.due_date, DateTime)),
+                Date,
+            ).label("period_start"),
+        ).where(
+            PaymentAnalytics.due_date >= previous_start_date,
+            PaymentAnalytics.due_date <= end_date,
+        )
+        if owner_id is not None:
+            cells = cells.where(PaymentAnalytics.owner_id == owner_id)
+        if property_id is not None:
+            cells = cells.where(PaymentAnalytics.property_id == property_id)
+        if document_type is not None:
+            cells = cells.where(PaymentAnalytics.document_type == document_type)
+        cells = cells.subquery()
+
+        outstanding = cells.c.amount - cells.c.paid_amount
+        grouping = func.grouping(
+            cells.c.period_start, cells.c.property_id, cells.c.document_type
+        )
+        stmt = (
+            select(
+                case(
+                    (grouping == 3, "bucket"),
+                    (grouping == 5, "property"),
+                    (grouping == 6, "document_type"),
+                    else_="total",
+                ).label("level"),
+                cells.c.span,
+                cells.c.period_start,
+                cells.c.property_id,
+                Property.title.label("property_title"),
+                cells.c.document_type,
+                func.sum(cells.c.amount).label("amount"),
+                func.sum(cells.c.paid_amount).label("paid_amount"),
+                func.sum(outstanding).label("outstanding_amount"),
+                func.coalesce(
+                    func.sum(outstanding).filter(
+                        cells.c.due_date < func.current_date()
+                    ),
+                    0,
+                ).label("overdue_amount"),
+                func.sum(cells.c.payment_count).label("payment_count"),
+                func.sum(cells.c.paid_count).label("paid_count"),
+            )
+            .select_from(cells)
+            .outerjoin(Property, cells.c.property_id == Property.id)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(cells.c.span, cells.c.period_start),
+                    tuple_(cells.c.span),
+                    tuple_(cells.c.span, cells.c.property_id, Property.title),
+                    tuple_(cells.c.span, cells.c.document_type),
+                )
+            )
+            .order_by(grouping, cells.c.period_start, cells.c.property_id)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
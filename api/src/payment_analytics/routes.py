@@ -0,0 +1,69 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.database import get_session
+from api.core.logging import get_logger
+from api.core.security import Principal, get_current_user
+from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.payment_analytics.schemas import AnalyticsPeriod, PaymentAnalyticsResponse
+from api.src.payment_analytics.service import PaymentAnalyticsService
+from api.src.utils.access_verify import is_owner_or_admin
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+def get_payment_analytics_service(
+    session: AsyncSession = Depends(get_session),
+) -> PaymentAnalyticsService:
+    """Get payment analytics service instance."""
+    return PaymentAnalyticsService(session)
+
+
+@router.get("/payments", response_model=PaymentAnalyticsResponse)
+async def get_payment_analytics(
+    start_date: Optional[date] = Query(
+        None, description="First due date, defaults to 14 days before end_date"
+    ),
+    end_date: Optional[date] = Query(
+        None, description="Last due date, defaults to today"
+    ),
+    period: AnalyticsPeriod = Query(
+        AnalyticsPeriod.DAILY, description="Series buckets: daily, weekly, monthly"
+    ),
+    property_id: Optional[int] = Query(None, description="Filter by property ID"),
+    document_type: Optional[str] = Query(None, description="Filter by document type"),
+    owner_id: Optional[int] = Query(
+        None, description="Filter by owner ID (admins only, owners see their own)"
+    ),
+    service: PaymentAnalyticsService = Depends(get_payment_analytics_service),
+    current_user: Principal = Depends(get_current_user),
+) -> PaymentAnalyticsResponse:
+    """Get revenue and collection figures of the payments due in a date range.
+
+    Returns a gap-free series of charged and collected amounts per day, week
+    or month, plus totals per property and per document type. Every figure
+    is compared with the previous period of the same length.
+    Requires: ADMIN or OWNER role
+    """
+    is_owner_or_admin(current_user)
+
+    if current_user.role == EnumUserRoles.OWNER:
+        owner_id = current_user.id
+    end_date = end_date or date.today()
+    start_date = start_date or end_date - timedelta(days=14)
+
+    logger.info(
+        f"Getting payment analytics for user {current_user.id} from {start_date} to {end_date} ({period.value})"
+    )
+    return await service.get_analytics(
+        start_date,
+        end_date,
+        period=period,
+        owner_id=owner_id,
+        property_id=property_id,
+        document_type=document_type,
+    )
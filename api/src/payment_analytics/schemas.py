@@ -0,0 +1,80 @@
+from datetime import date
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class AnalyticsPeriod(str, Enum):
+    """Width of the buckets of an analytics series."""
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class AnalyticsFigures(BaseModel):
+    """Charged and collected amounts of a set of payments."""
+
+    amount: float = Field(0, description="Total amount due")
+    paid_amount: float = Field(0, description="Amount collected")
+    outstanding_amount: float = Field(0, description="Amount not collected yet")
+    overdue_amount: float = Field(0, description="Outstanding amount past due")
+    payment_count: int = 0
+    paid_count: int = 0
+
+
+class AnalyticsChange(BaseModel):
+    """Percent change against the previous period, null when it had nothing."""
+
+    amount: Optional[float] = None
+    paid_amount: Optional[float] = None
+    outstanding_amount: Optional[float] = None
+    overdue_amount: Optional[float] = None
+    payment_count: Optional[float] = None
+    paid_count: Optional[float] = None
+
+
+class AnalyticsBucket(AnalyticsFigures):
+    """Figures of the payments due within one bucket of the series."""
+
+    period_start: date
+
+
+class AnalyticsComparison(BaseModel):
+    """Figures of the selected and the previous period."""
+
+    current: AnalyticsFigures
+    previous: AnalyticsFigures
+    change: AnalyticsChange
+
+
+class PropertyAnalytics(AnalyticsComparison):
+    """Period figures of a single property."""
+
+    property_id: int
+    property_title: Optional[str]
+
+
+class DocumentTypeAnalytics(AnalyticsComparison):
+    """Period figures of a single document type."""
+
+    document_type: str
+
+
+class PaymentAnalyticsResponse(BaseModel):
+    """Dashboard analytics of payments due within a date range.
+
+    The previous period is the range of the same length right before
+    start_date.
+    """
+
+    period: AnalyticsPeriod
+    start_date: date
+    end_date: date
+    previous_start_date: date
+    previous_end_date: date
+    series: list[AnalyticsBucket]
+    totals: AnalyticsComparison
+    properties: list[PropertyAnalytics]
+    document_types: list[DocumentTypeAnalytics]
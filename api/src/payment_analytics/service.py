@@ -0,0 +1,193 @@
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.exceptions import BusinessRuleViolationException
+from api.core.logging import get_logger
+from api.src.payment_analytics.repository import PaymentAnalyticsRepository
+from api.src.payment_analytics.schemas import (
+    AnalyticsBucket,
+    AnalyticsChange,
+    AnalyticsComparison,
+    AnalyticsFigures,
+    AnalyticsPeriod,
+    DocumentTypeAnalytics,
+    PaymentAnalyticsResponse,
+    PropertyAnalytics,
+)
+
+logger = get_logger(__name__)
+
+# Longest date range a single request may cover
+MAX_RANGE_DAYS = 3 * 366
+
+
+def previous_range(start_date: date, end_date: date) -> tuple[date, date]:
+    """Get the range of the same length that ends the day before start_date."""
+    length = end_date - start_date + timedelta(days=1)
+    return start_date - length, start_date - timedelta(days=1)
+
+
+def bucket_starts(
+    start_date: date, end_date: date, period: AnalyticsPeriod
+) -> list[date]:
+    """Get the start of every bucket overlapping the range.
+
+    Weeks start on Monday and months on the first, matching ``date_trunc``.
+    """
+    if period == AnalyticsPeriod.DAILY:
+        current = start_date
+    elif period == AnalyticsPeriod.WEEKLY:
+        current = start_date - timedelta(days=start_date.weekday())
+    else:
+        current = start_date.replace(day=1)
+
+    starts = []
+    while current <= end_date:
+        starts.append(current)
+        if period == AnalyticsPeriod.DAILY:
+            current += timedelta(days=1)
+        elif period == AnalyticsPeriod.WEEKLY:
+            current += timedelta(weeks=1)
+        elif current.month == 12:
+            current = current.replace(year=current.year + 1, month=1)
+        else:
+            current = current.replace(month=current.month + 1)
+    return starts
+
+
+def percent_change(
+    current: AnalyticsFigures, previous: AnalyticsFigures
+) -> AnalyticsChange:
+    """Compare every figure with the previous period, in percent."""
+    change = {}
+    for field in AnalyticsChange.model_fields:
+        before = getattr(previous, field)
+        if before:
+            change[field] = round((getattr(current, field) - before) / before * 100, 1)
+    return AnalyticsChange(**change)
+
+
+class PaymentAnalyticsService:
+    """Service layer for the dashboard payment analytics."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize PaymentAnalyticsService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = PaymentAnalyticsRepository(session)
+
+    async def get_analytics(
+        self,
+        start_date: date,
+        end_date: date,
+        period: AnalyticsPeriod = AnalyticsPeriod.DAILY,
+        owner_id: Optional[int] = None,
+        property_id: Optional[int] = None,
+        document_type: Optional[str] = None,
+    ) -> PaymentAnalyticsResponse:
+        """Get the payment series and totals of a range with their changes.
+
+        Months changed since the last refresh are recomputed first, so the
+        figures always include every committed payment write.
+
+        Args:
+            start_date (date): First due date to include
+            end_date (date): Last due date to include
+            period (AnalyticsPeriod): Width of the series buckets
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            property_id (Optional[int]): Restrict to a single property
+            document_type (Optional[str]): Restrict to a single document type
+
+        Returns:
+            PaymentAnalyticsResponse: Series, totals and breakdowns
+
+        Raises:
+            BusinessRuleViolationException: If the date range is invalid
+        """
+        if start_date > end_date:
+            raise BusinessRuleViolationException(
+                "start_date must not be after end_date"
+            )
+        if (end_date - start_date).days >= MAX_RANGE_DAYS:
+            raise BusinessRuleViolationException(
+                f"Date range must be shorter than {MAX_RANGE_DAYS} days"
+            )
+
+        if await self.repository.refresh(owner_id=owner_id):
+            await self.session.commit()
+
+        previous_start_date, previous_end_date = previous_range(start_date, end_date)
+        rows = await self.repository.get_cube(
+            start_date,
+            end_date,
+            previous_start_date,
+            period,
+            owner_id=owner_id,
+            property_id=property_id,
+            document_type=document_type,
+        )
+
+        buckets = {}
+        totals = {}
+        properties: dict[int, dict] = {}
+        document_types: dict[str, dict] = {}
+        for row in rows:
+            figures = AnalyticsFigures.model_validate(row._mapping)
+            if row.level == "bucket":
+                if row.span == "current":
+                    buckets[row.period_start] = figures
+            elif row.level == "property":
+                entry = properties.setdefault(
+                    row.property_id, {"property_title": row.property_title}
+                )
+                entry[row.span] = figures
+            elif row.level == "document_type":
+                document_types.setdefault(row.document_type, {})[row.span] = figures
+            else:
+                totals[row.span] = figures
+
+        return PaymentAnalyticsResponse(
+            period=period,
+            start_date=start_date,
+            end_date=end_date,
+            previous_start_date=previous_start_date,
+            previous_end_date=previous_end_date,
+            series=[
+                AnalyticsBucket(
+                    period_start=period_start,
+                    **buckets.get(period_start, AnalyticsFigures()).model_dump(),
+                )
+                for period_start in bucket_starts(start_date, end_date, period)
+            ],
+            totals=self._compare(totals),
+            properties=[
+                PropertyAnalytics(
+                    property_id=property_id,
+                    property_title=entry["property_title"],
+                    **self._compare(entry).model_dump(),
+                )
+                for property_id, entry in properties.items()
+            ],
+            document_types=[
+                DocumentTypeAnalytics(
+                    document_type=document_type,
+                    **self._compare(entry).model_dump(),
+                )
+                for document_type, entry in sorted(document_types.items())
+            ],
+        )
+
+    def _compare(self, spans: dict) -> AnalyticsComparison:
+        """Build the comparison of the current and previous figures of a group."""
+        current = spans.get("current", AnalyticsFigures())
+        previous = spans.get("previous", AnalyticsFigures())
+        return AnalyticsComparison(
+            current=current,
+            previous=previous,
+            change=percent_change(current, previous),
+        )
@@ -0,0 +1 @@
+# Payment summaries module
@@ -0,0 +1,64 @@
+"""Maintain the payment summaries from the command line.
+
+Usage:
+    python -m api.src.payment_summaries.cli age [--owner-id ID]
+    python -m api.src.payment_summaries.cli verify [--owner-id ID]
+    python -m api.src.payment_summaries.cli rebuild [--owner-id ID]
+
+``age`` moves Pending payments that fell due into Overdue and should be
+scheduled daily (e.g. via cron shortly after midnight). ``verify`` reports
+drift between the summaries and the payments and exits with status 1 when
+there is any. ``rebuild`` reports the drift and recomputes the summaries.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from api.core.database import async_session
+from api.src.payment_summaries.repository import PaymentSummaryRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Age, verify or rebuild the per owner payment summaries."
+    )
+    parser.add_argument("command", choices=["age", "verify", "rebuild"])
+    parser.add_argument(
+        "--owner-id", type=int, default=None, help="Only process this owner"
+    )
+    return parser.parse_args()
+
+
+def print_drift(drift: list[dict]) -> None:
+    for entry in drift:
+        print(
+            f"owner {entry['owner_id']} property {entry['property_id']}: "
+            f"{entry['field']} stored {entry['stored']}, actual {entry['actual']}"
+        )
+    print(f"{len(drift)} drifted field(s)")
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with async_session() as session:
+        repository = PaymentSummaryRepository(session)
+
+        if args.command == "age":
+            aged = await repository.age(owner_id=args.owner_id)
+            await session.commit()
+            print(f"Aged {aged} summaries")
+            return 0
+
+        drift = await repository.verify(owner_id=args.owner_id)
+        print_drift(drift)
+        if args.command == "verify":
+            return 1 if drift else 0
+
+        rebuilt = await repository.rebuild(owner_id=args.owner_id)
+        await session.commit()
+        print(f"Rebuilt {rebuilt} summaries")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
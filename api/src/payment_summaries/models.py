@@ -0,0 +1,55 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Integer,
+    Numeric,
+    Sequence,
+    func,
+)
+
+from api.core.database import Base
+
+# Numbers every written summary row, see PaymentSummaryRepository.get_version
+VERSION_SEQUENCE = Sequence("payment_summaries_version_seq", metadata=Base.metadata)
+
+
+class PaymentSummary(Base):
+    """Pre-aggregated payment counts and amounts per owner and property.
+
+    Maintained by PaymentSummaryRepository in the same transaction as every
+    payment write. Pending and overdue buckets are relative to ``as_of_date``
+    and are moved forward by the aging job.
+    """
+
+    __tablename__ = "payment_summaries"
+
+    owner_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    property_id = Column(
+        Integer, ForeignKey("properties.id", ondelete="CASCADE"), primary_key=True
+    )
+    as_of_date = Column(Date, nullable=False, server_default=func.current_date())
+
+    total_payments = Column(Integer, nullable=False, default=0)
+    paid_count = Column(Integer, nullable=False, default=0)
+    pending_count = Column(Integer, nullable=False, default=0)
+    overdue_count = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    paid_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    pending_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    overdue_amount = Column(Numeric(14, 2), nullable=False, default=0)
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    # Drawn from VERSION_SEQUENCE whenever the row is written
+    version = Column(
+        BigInteger, nullable=False, server_default=VERSION_SEQUENCE.next_value()
+    )
@@ -0,0 +1,391 @@
+from datetime import date
+from typing import NamedTuple, Optional, Sequence
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    Float,
+    Integer,
+    Numeric,
+    cast,
+    column,
+    delete,
+    func,
+    literal_column,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.leases.models import Lease
+from api.src.payment_summaries.models import VERSION_SEQUENCE, PaymentSummary
+from api.src.payments.models import Payment
+from api.src.properties.models import Property
+from api.src.units.models import Unit
+
+logger = get_logger(__name__)
+
+COUNT_FIELDS = ("total_payments", "paid_count", "pending_count", "overdue_count")
+AMOUNT_FIELDS = ("total_amount", "paid_amount", "pending_amount", "overdue_amount")
+SUMMARY_FIELDS = COUNT_FIELDS + AMOUNT_FIELDS
+
+# Payments per VALUES list, keeps bind parameters well below the asyncpg limit
+DELTA_BATCH_SIZE = 1000
+
+
+class PaymentFigures(NamedTuple):
+    """The payment columns a summary depends on."""
+
+    lease_id: Optional[int]
+    is_paid: bool
+    due_date: date
+    gross_value: float
+
+    @classmethod
+    def from_payment(cls, payment: Payment) -> "PaymentFigures":
+        return cls(
+            payment.lease_id,
+            bool(payment.is_paid),
+            payment.due_date,
+            payment.gross_value,
+        )
+
+
+def _summary_columns(is_paid, due_date, gross_value, weight, as_of_date) -> list:
+    """Aggregate expressions for every summary field, in SUMMARY_FIELDS order.
+
+    ``weight`` is 1 for payments being counted and -1 for payments being
+    removed; pending and overdue are split on ``as_of_date``.
+    """
+    amount = cast(gross_value, Numeric(14, 2)) * weight
+    pending = ~is_paid & (due_date >= as_of_date)
+    overdue = ~is_paid & (due_date < as_of_date)
+    return [
+        func.coalesce(func.sum(weight), 0).label("total_payments"),
+        func.coalesce(func.sum(weight).filter(is_paid), 0).label("paid_count"),
+        func.coalesce(func.sum(weight).filter(pending), 0).label("pending_count"),
+        func.coalesce(func.sum(weight).filter(overdue), 0).label("overdue_count"),
+        func.coalesce(func.sum(amount), 0).label("total_amount"),
+        func.coalesce(func.sum(amount).filter(is_paid), 0).label("paid_amount"),
+        func.coalesce(func.sum(amount).filter(pending), 0).label("pending_amount"),
+        func.coalesce(func.sum(amount).filter(overdue), 0).label("overdue_amount"),
+    ]
+
+
+class PaymentSummaryRepository:
+    """Repository maintaining the per owner and property payment summaries."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize PaymentSummaryRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+
+    async def apply(
+        self,
+        added: Sequence[PaymentFigures] = (),
+        removed: Sequence[PaymentFigures] = (),
+    ) -> None:
+        """Add and remove payments from the summaries of their properties.
+
+        Must run in the same transaction as the payment write; the caller is
+        responsible for committing. Affected summary rows are locked first so
+        the deltas are classified against the same ``as_of_date`` they are
+        applied to, even if the aging job runs concurrently. Payments without
+        a lease, or whose property has no owner, are not summarized.
+
+        Args:
+            added (Sequence[PaymentFigures]): Payments created or new states
+            removed (Sequence[PaymentFigures]): Payments deleted or old states
+        """
+        rows = [(*payment, 1) for payment in added if payment.lease_id is not None]
+        rows += [(*payment, -1) for payment in removed if payment.lease_id is not None]
+        if not rows:
+            return
+
+        lease_ids = {row[0] for row in rows}
+        await self.session.execute(
+            select(PaymentSummary.property_id)
+            .where(
+                PaymentSummary.property_id.in_(
+                    select(Unit.property_id)
+                    .join(Lease, Lease.unit_id == Unit.id)
+                    .where(Lease.id.in_(lease_ids))
+                )
+            )
+            .with_for_update()
+        )
+
+        for start in range(0, len(rows), DELTA_BATCH_SIZE):
+            await self.session.execute(
+                self._upsert_deltas(rows[start : start + DELTA_BATCH_SIZE])
+            )
+
+    def _upsert_deltas(self, rows: list[tuple]):
+        """Build the INSERT ... ON CONFLICT statement adding ``rows`` to summaries."""
+        deltas = values(
+            column("lease_id", Integer),
+            column("is_paid", Boolean),
+            column("due_date", Date),
+            column("gross_value", Float),
+            column("weight", Integer),
+            name="deltas",
+        ).data(rows)
+        as_of_date = func.coalesce(PaymentSummary.as_of_date, func.current_date())
+
+        summed = (
+            select(
+                Property.owner_id,
+                Unit.property_id,
+                func.min(as_of_date).label("as_of_date"),
+                *_summary_columns(
+                    deltas.c.is_paid,
+                    deltas.c.due_date,
+                    deltas.c.gross_value,
+                    deltas.c.weight,
+                    as_of_date,
+                ),
+            )
+            .select_from(deltas)
+            .join(Lease, Lease.id == deltas.c.lease_id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .outerjoin(
+                PaymentSummary,
+                (PaymentSummary.owner_id == Property.owner_id)
+                & (PaymentSummary.property_id == Unit.property_id),
+            )
+            .where(Property.owner_id.isnot(None))
+            .group_by(Property.owner_id, Unit.property_id)
+        )
+
+        stmt = pg_insert(PaymentSummary).from_select(
+            ["owner_id", "property_id", "as_of_date", *SUMMARY_FIELDS], summed
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[PaymentSummary.owner_id, PaymentSummary.property_id],
+            set_={
+                **{
+                    field: getattr(PaymentSummary, field)
+                    + getattr(stmt.excluded, field)
+                    for field in SUMMARY_FIELDS
+                },
+                "updated_at": func.now(),
+                "version": VERSION_SEQUENCE.next_value(),
+            },
+        )
+
+    async def age(self, owner_id: Optional[int] = None) -> int:
+        """Move unpaid payments that fell due since ``as_of_date`` into overdue.
+
+        The caller is responsible for committing.
+
+        Args:
+            owner_id (Optional[int]): Only age this owner's summaries
+
+        Returns:
+            int: Number of summary rows moved to today
+        """
+        stale = [PaymentSummary.as_of_date < func.current_date()]
+        if owner_id is not None:
+            stale.append(PaymentSummary.owner_id == owner_id)
+
+        amount = cast(Payment.gross_value, Numeric(14, 2))
+        moved = (
+            select(
+                PaymentSummary.owner_id,
+                PaymentSummary.property_id,
+                func.count().label("count"),
+                func.sum(amount).label("amount"),
+            )
+            .join(
+                Payment,
+                (Payment.owner_id == PaymentSummary.owner_id)
+                & (Payment.property_id == PaymentSummary.property_id),
+            )
+            .where(
+                *stale,
+                ~Payment.is_paid,
+                Payment.due_date >= PaymentSummary.as_of_date,
+                Payment.due_date < func.current_date(),
+            )
+            .group_by(PaymentSummary.owner_id, PaymentSummary.property_id)
+            .subquery()
+        )
+
+        await self.session.execute(
+            update(PaymentSummary)
+            .where(
+                PaymentSummary.owner_id == moved.c.owner_id,
+                PaymentSummary.property_id == moved.c.property_id,
+            )
+            .values(
+                pending_count=PaymentSummary.pending_count - moved.c.count,
+                overdue_count=PaymentSummary.overdue_count + moved.c.count,
+                pending_amount=PaymentSummary.pending_amount - moved.c.amount,
+                overdue_amount=PaymentSummary.overdue_amount + moved.c.amount,
+            )
+        )
+        result = await self.session.execute(
+            update(PaymentSummary)
+            .where(*stale)
+            .values(
+                as_of_date=func.current_date(),
+                updated_at=func.now(),
+                version=VERSION_SEQUENCE.next_value(),
+            )
+        )
+        return result.rowcount
+
+    async def get_totals(
+        self, owner_id: int, property_id: Optional[int] = None
+    ) -> Optional[dict]:
+        """Sum the summaries of an owner with a primary key lookup.
+
+        Args:
+            owner_id (int): Property owner ID
+            property_id (Optional[int]): Restrict to a single property
+
+        Returns:
+            Optional[dict]: Summed fields and ``as_of_date``, or None when some
+                summaries have not been aged to today yet
+        """
+        stmt = select(
+            *[
+                func.coalesce(func.sum(getattr(PaymentSummary, field)), 0).label(field)
+                for field in SUMMARY_FIELDS
+            ],
+            func.min(PaymentSummary.as_of_date).label("oldest"),
+            func.current_date().label("today"),
+        ).where(PaymentSummary.owner_id == owner_id)
+        if property_id is not None:
+            stmt = stmt.where(PaymentSummary.property_id == property_id)
+
+        totals = dict((await self.session.execute(stmt)).one()._mapping)
+        oldest, today = totals.pop("oldest"), totals.pop("today")
+        if oldest is not None and oldest < today:
+            return None
+        totals["as_of_date"] = today
+        return totals
+
+    async def get_version(self, owner_id: Optional[int] = None) -> tuple[int, int]:
+        """Get a version of an owner's summaries that changes on every write.
+
+        Every change to a payment's paid flag, due date or amount rewrites its
+        summary row with a new number from ``VERSION_SEQUENCE``, so this
+        doubles as a cheap version for caches of derived payment reports.
+        A row's new number is drawn while its lock is held and so exceeds the
+        number it replaces; unlike the latest ``updated_at``, the sum grows
+        with every commit, whatever order the writing transactions started in.
+
+        Args:
+            owner_id (Optional[int]): Owner to check, all owners when omitted
+
+        Returns:
+            tuple[int, int]: Number of summary rows and sum of their versions
+        """
+        stmt = select(func.count(), func.coalesce(func.sum(PaymentSummary.version), 0))
+        if owner_id is not None:
+            stmt = stmt.where(PaymentSummary.owner_id == owner_id)
+        return tuple((await self.session.execute(stmt)).one())
+
+    def _live_summaries(self, owner_id: Optional[int] = None):
+        """Summaries recomputed from payments, against each row's as_of_date."""
+        as_of_date = func.coalesce(PaymentSummary.as_of_date, func.current_date())
+        stmt = (
+            select(
+                Property.owner_id,
+                Unit.property_id,
+                func.min(as_of_date).label("as_of_date"),
+                *_summary_columns(
+                    Payment.is_paid,
+                    Payment.due_date,
+                    Payment.gross_value,
+                    literal_column("1"),
+                    as_of_date,
+                ),
+            )
+            .select_from(Payment)
+            .join(Lease, Payment.lease_id == Lease.id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .outerjoin(
+                PaymentSummary,
+                (PaymentSummary.owner_id == Property.owner_id)
+                & (PaymentSummary.property_id == Unit.property_id),
+            )
+            .where(Property.owner_id.isnot(None))
+            .group_by(Property.owner_id, Unit.property_id)
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Property.owner_id == owner_id)
+        return stmt
+
+    async def verify(self, owner_id: Optional[int] = None) -> list[dict]:
+        """Compare the summaries with totals recomputed from payments.
+
+        Args:
+            owner_id (Optional[int]): Only check this owner's summaries
+
+        Returns:
+            list[dict]: One entry per drifted field with owner_id, property_id,
+                field, stored and actual values
+        """
+        stored_stmt = select(PaymentSummary)
+        if owner_id is not None:
+            stored_stmt = stored_stmt.where(PaymentSummary.owner_id == owner_id)
+
+        stored = {
+            (summary.owner_id, summary.property_id): summary
+            for summary in (await self.session.execute(stored_stmt)).scalars()
+        }
+        actual = {
+            (row.owner_id, row.property_id): row
+            for row in await self.session.execute(self._live_summaries(owner_id))
+        }
+
+        drift = []
+        for key in sorted(stored.keys() | actual.keys()):
+            for field in SUMMARY_FIELDS:
+                stored_value = getattr(stored.get(key), field, None) or 0
+                actual_value = getattr(actual.get(key), field, None) or 0
+                if stored_value != actual_value:
+                    drift.append(
+                        {
+                            "owner_id": key[0],
+                            "property_id": key[1],
+                            "field": field,
+                            "stored": stored_value,
+                            "actual": actual_value,
+                        }
+                    )
+        return drift
+
+    async def rebuild(self, owner_id: Optional[int] = None) -> int:
+        """Recompute the summaries from scratch as of today.
+
+        The caller is responsible for committing.
+
+        Args:
+            owner_id (Optional[int]): Only rebuild this owner's summaries
+
+        Returns:
+            int: Number of summary rows written
+        """
+        delete_stmt = delete(PaymentSummary)
+        if owner_id is not None:
+            delete_stmt = delete_stmt.where(PaymentSummary.owner_id == owner_id)
+        await self.session.execute(delete_stmt)
+
+        result = await self.session.execute(
+            pg_insert(PaymentSummary).from_select(
+                ["owner_id", "property_id", "as_of_date", *SUMMARY_FIELDS],
+                self._live_summaries(owner_id),
+            )
+        )
+        return result.rowcount
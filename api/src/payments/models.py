@@ -3,24 +3,111 @@ from datetime import datetime
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    UniqueConstraint,
+    and_,
+    case,
     func,
+    not_,
+    or_,
+    text,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.sql import operators
 
 from api.core.database import Base
 
+# Text search configuration of the search vector: no stemming or stop words,
+# payments are mostly names and short labels in any language
+SEARCH_CONFIG = "simple"
+
+
+class PaymentStatusComparator(Comparator):
+    """SQL side of ``Payment.status``.
+
+    Used as a value (SELECT, ORDER BY) the status is a CASE expression over
+    ``is_paid`` and ``due_date``. Equality and IN comparisons are rewritten
+    into plain conditions on those columns so they can use indexes, e.g.
+    ``Payment.status == "Overdue"`` becomes
+    ``NOT is_paid AND due_date < CURRENT_DATE``.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        super().__init__(
+            case(
+                (cls.is_paid, "Paid"),
+                (cls.due_date < func.current_date(), "Overdue"),
+                else_="Pending",
+            )
+        )
+
+    def condition(self, status: str):
+        """Return the column condition matching a single status value."""
+        status = getattr(status, "value", status)
+        if status == "Paid":
+            return self.cls.is_paid
+        if status == "Overdue":
+            return and_(~self.cls.is_paid, self.cls.due_date < func.current_date())
+        if status == "Pending":
+            return and_(~self.cls.is_paid, self.cls.due_date >= func.current_date())
+        raise ValueError(f"Unknown payment status: {status}")
+
+    def operate(self, op, *other, **kwargs):
+        if op is operators.eq:
+            return self.condition(other[0])
+        if op is operators.ne:
+            return not_(self.condition(other[0]))
+        if op is operators.in_op:
+            return or_(*[self.condition(status) for status in other[0]])
+        return op(self.expression, *other, **kwargs)
+
 
 class Payment(Base):
     """Payment model representing payment records in the system."""
 
     __tablename__ = "payments"
+    __table_args__ = (
+        # Composite keys used for keyset pagination of payment lists
+        Index("ix_payments_created_at_id", "created_at", "id"),
+        Index("ix_payments_due_date_id", "due_date", "id"),
+        # Pending and overdue lookups only ever scan unpaid payments
+        Index(
+            "ix_payments_unpaid_due_date",
+            "due_date",
+            "id",
+            postgresql_where=text("NOT is_paid"),
+        ),
+        # Owner-scoped lists, overdue lookups and statistics
+        Index(
+            "ix_payments_owner_id_is_paid_due_date", "owner_id", "is_paid", "due_date"
+        ),
+        # Full-text search and trigram fallback for partial receiver names
+        Index("ix_payments_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_payments_receiver_trgm",
+            "receiver",
+            postgresql_using="gin",
+            postgresql_ops={"receiver": "gin_trgm_ops"},
+        ),
+        # One charge per lease, due date and document type (billing runs rely on it)
+        UniqueConstraint(
+            "lease_id",
+            "due_date",
+            "document_type",
+            name="uq_payment_lease_due_date_document_type",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
@@ -52,6 +139,32 @@ class Payment(Base):
         index=True,
     )
 
+    # Denormalized from lease -> unit -> property so owner-scoped queries need
+    # no joins. Kept in sync by PaymentRepository (see sync_ownership).
+    property_id = Column(
+        Integer,
+        ForeignKey("properties.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    owner_id = Column(
+        Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
+
+    # Generated search document over the searchable text columns; deferred so
+    # it is never loaded with payments
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                f"to_tsvector('{SEARCH_CONFIG}', coalesce(receiver, '') || ' ' || "
+                "coalesce(description, '') || ' ' || coalesce(document_type, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        )
+    )
+
     # Timestamps
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -62,7 +175,7 @@ class Payment(Base):
     lease = relationship("Lease", back_populates="payments")
     invoice_file = relationship("File", foreign_keys=[invoice_file_id])
 
-    @property
+    @hybrid_property
     def status(self) -> str:
         """Calculate payment status based on is_paid and due_date."""
         if self.is_paid:
@@ -73,3 +186,7 @@ class Payment(Base):
             return "Overdue"
         else:
             return "Pending"
+
+    @status.comparator
+    def status(cls) -> PaymentStatusComparator:
+        return PaymentStatusComparator(cls)
@@ -1,21 +1,152 @@
+import re
 from datetime import date
-from typing import Optional
-
-from sqlalchemy import select
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import (
+    Date,
+    Integer,
+    Numeric,
+    Row,
+    and_,
+    any_,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
 from api.core.exceptions import AlreadyExistsException, NotFoundException
 from api.core.logging import get_logger
+from api.src.files.models import File
 from api.src.leases.models import Lease
-from api.src.payments.models import Payment
-from api.src.payments.schemas import PaymentCreate, PaymentInvoiceUpdate, PaymentUpdate
+from api.src.ownership.service import invalidate_ownership
+from api.src.payment_summaries.repository import (
+    PaymentFigures,
+    PaymentSummaryRepository,
+)
+from api.src.payments.models import SEARCH_CONFIG, Payment
+from api.src.payments.schemas import (
+    PaymentCreate,
+    PaymentInvoiceUpdate,
+    PaymentSort,
+    PaymentStatus,
+    PaymentUpdate,
+)
 from api.src.properties.models import Property
 from api.src.units.models import Unit
+from api.src.users.models import User
+from api.src.utils.pagination import Keyset, Page, count_rows, paginate
 
 logger = get_logger(__name__)
 
+CREATED_AT_KEYSET = Keyset(
+    "created_at", (Payment.created_at, Payment.id), descending=True
+)
+DUE_DATE_KEYSET = Keyset("due_date", (Payment.due_date, Payment.id))
+STATUS = Payment.status.expression.label("status")
+
+SORT_KEYSETS = {
+    PaymentSort.NEWEST: CREATED_AT_KEYSET,
+    PaymentSort.OLDEST: Keyset("created_at_asc", (Payment.created_at, Payment.id)),
+    PaymentSort.DUE_DATE: DUE_DATE_KEYSET,
+    PaymentSort.DUE_DATE_DESC: Keyset(
+        "due_date_desc", (Payment.due_date, Payment.id), descending=True
+    ),
+    PaymentSort.AMOUNT: Keyset("gross_value", (Payment.gross_value, Payment.id)),
+    PaymentSort.AMOUNT_DESC: Keyset(
+        "gross_value_desc", (Payment.gross_value, Payment.id), descending=True
+    ),
+    PaymentSort.STATUS: Keyset("status", (STATUS, Payment.due_date, Payment.id)),
+}
+
+
+# Rows fetched per round trip when streaming exports
+EXPORT_BATCH_SIZE = 1000
+
+# Aging report buckets; a payment 31 days past due falls into days_31_60
+AGING_BUCKETS = ("days_0_30", "days_31_60", "days_61_90", "days_over_90")
+AGING_BUCKET_BOUNDS = [31, 61, 91]
+
+# Ledger amounts are summed as exact decimals
+LEDGER_AMOUNT = Numeric(14, 2)
+
+# (header, column) pairs of payment exports
+EXPORT_COLUMNS = [
+    ("ID", Payment.id),
+    ("Document type", Payment.document_type),
+    ("Amount", Payment.gross_value),
+    ("Due date", Payment.due_date),
+    ("Status", STATUS),
+    ("Receiver", Payment.receiver),
+    ("Description", Payment.description),
+    ("Property", Property.title),
+    ("Unit", Unit.name),
+    ("Tenant", (User.first_name + " " + User.last_name).label("tenant")),
+    ("Lease ID", Payment.lease_id),
+    ("Created at", Payment.created_at),
+]
+
+
+# Columns of compact payment lists, see PaymentCompactResponse
+COMPACT_COLUMNS = [
+    Payment.id,
+    Payment.document_type,
+    Payment.gross_value,
+    Payment.due_date,
+    Payment.receiver,
+    Payment.is_paid,
+    STATUS,
+    Payment.created_at,
+    Payment.lease_id,
+    Lease.tenant_id,
+    (User.first_name + " " + User.last_name).label("tenant_name"),
+    Unit.name.label("unit_name"),
+    Property.title.label("property_title"),
+    Payment.invoice_file_id,
+    File.filename.label("invoice_filename"),
+]
+
+
+def search_condition(query: str):
+    """WHERE condition matching payments against a free text search.
+
+    Every word of the query must be a prefix of a word in the receiver,
+    description or document type, answered from the GIN index on
+    ``search_vector``. Receivers containing the query anywhere also match,
+    answered from the trigram index, which finds partial names in the middle
+    of a word.
+
+    Args:
+        query (str): Search text
+
+    Returns:
+        ColumnElement: Search condition
+    """
+    query = query.strip()
+    escaped = re.sub(r"([/%_])", r"/\1", query)
+    conditions = [Payment.receiver.ilike(f"%{escaped}%", escape="/")]
+
+    words = re.findall(r"[^\W_]+", query.casefold())
+    if words:
+        tsquery = " & ".join(f"{word}:*" for word in words)
+        conditions.append(
+            Payment.search_vector.op("@@")(
+                func.to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), tsquery)
+            )
+        )
+    return or_(*conditions)
+
 
 class PaymentRepository:
     """Repository for payment data access operations."""
@@ -27,6 +158,7 @@ class PaymentRepository:
             session (AsyncSession): SQLAlchemy async session
         """
         self.session = session
+        self.summaries = PaymentSummaryRepository(session)
 
     def _get_payment_options(self):
         """Get selectinload options for payments with all relationships."""
@@ -41,9 +173,83 @@ class PaymentRepository:
             selectinload(Payment.invoice_file),
         ]
 
+    def _get_single_payment_options(self):
+        """Get joinedload options loading a payment and its relationships in one query.
+
+        The eager ``selectin`` collections of users and properties and the
+        invoice file contents are not needed by payment responses and are
+        skipped.
+        """
+        return [
+            joinedload(Payment.lease).options(
+                joinedload(Lease.user).lazyload("*"),
+                joinedload(Lease.unit).joinedload(Unit.property).lazyload("*"),
+            ),
+            joinedload(Payment.invoice_file).load_only(
+                File.id, File.filename, File.mimetype, File.size
+            ),
+        ]
+
+    def _ownership_values(self, lease_id: Optional[int]) -> dict:
+        """Column values deriving property_id and owner_id from ``lease_id``.
+
+        Scalar subqueries, so the ownership is resolved by the INSERT or
+        UPDATE statement itself instead of a separate query.
+        """
+        if lease_id is None:
+            return {"property_id": None, "owner_id": None}
+
+        lease_unit = (
+            select(Unit)
+            .join(Lease, Lease.unit_id == Unit.id)
+            .where(Lease.id == lease_id)
+        )
+        return {
+            "property_id": lease_unit.with_only_columns(
+                Unit.property_id
+            ).scalar_subquery(),
+            "owner_id": lease_unit.with_only_columns(Property.owner_id)
+            .join(Property, Unit.property_id == Property.id)
+            .scalar_subquery(),
+        }
+
+    def _list_query(self, compact: bool = False, join_lease: bool = False):
+        """Base query of payment lists, before filters and ordering.
+
+        The full view loads Payment entities with all relationships. The
+        compact view selects only ``COMPACT_COLUMNS`` in one joined query,
+        without building ORM objects.
+
+        Args:
+            compact (bool): Select compact rows instead of entities
+            join_lease (bool): Join the lease so filters can use its columns
+
+        Returns:
+            Select: Payment list query
+        """
+        if compact:
+            return (
+                select(*COMPACT_COLUMNS)
+                .select_from(Payment)
+                .outerjoin(Lease, Payment.lease_id == Lease.id)
+                .outerjoin(Unit, Lease.unit_id == Unit.id)
+                .outerjoin(Property, Payment.property_id == Property.id)
+                .outerjoin(User, Lease.tenant_id == User.id)
+                .outerjoin(File, Payment.invoice_file_id == File.id)
+            )
+
+        stmt = select(Payment).options(*self._get_payment_options())
+        if join_lease:
+            stmt = stmt.join(Lease, Payment.lease_id == Lease.id)
+        return stmt
+
     async def create(self, data: PaymentCreate) -> Payment:
         """Create a new payment.
 
+        The row is written with a single INSERT ... RETURNING statement that
+        derives property_id and owner_id from the lease, then reloaded once
+        with its relationships.
+
         Args:
             data (PaymentCreate): Payment creation data
 
@@ -53,30 +259,203 @@ class PaymentRepository:
         Raises:
             AlreadyExistsException: If payment creation fails due to constraints
         """
-        payment = Payment(**data.model_dump())
-        self.session.add(payment)
-
+        values = data.model_dump()
+        stmt = (
+            insert(Payment)
+            .values(**values, **self._ownership_values(data.lease_id))
+            .returning(Payment.id)
+        )
         try:
+            payment_id = (await self.session.execute(stmt)).scalar_one()
+            await self.summaries.apply(
+                added=[
+                    PaymentFigures(
+                        data.lease_id, False, data.due_date, data.gross_value
+                    )
+                ]
+            )
             await self.session.commit()
-            await self.session.refresh(payment)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise AlreadyExistsException("Payment creation failed") from e
+
+        logger.info(f"Created payment: {payment_id}")
+        return await self.get_by_id(payment_id)
+
+    async def bulk_create(self, payments: list[PaymentCreate]) -> list[int]:
+        """Create many payments in a single transaction.
+
+        Rows are written with multi-row INSERT ... RETURNING id statements
+        (batched by SQLAlchemy's insertmanyvalues) and committed once; no
+        relationships are reloaded.
+
+        Args:
+            payments (list[PaymentCreate]): Payment creation data
+
+        Returns:
+            list[int]: IDs of the created payments, in input order
 
-            # Load relationships
-            stmt = (
-                select(Payment)
-                .options(*self._get_payment_options())
-                .where(Payment.id == payment.id)
+        Raises:
+            AlreadyExistsException: If payment creation fails due to constraints
+        """
+        if not payments:
+            return []
+
+        ownership = await self.get_lease_ownership(
+            [payment.lease_id for payment in payments if payment.lease_id is not None]
+        )
+        rows = []
+        for payment in payments:
+            property_id, owner_id = ownership.get(payment.lease_id, (None, None))
+            rows.append(
+                {
+                    **payment.model_dump(),
+                    "property_id": property_id,
+                    "owner_id": owner_id,
+                }
             )
-            result = await self.session.execute(stmt)
-            payment = result.scalar_one()
 
-            logger.info(f"Created payment: {payment.id}")
-            return payment
+        stmt = insert(Payment).returning(Payment.id, sort_by_parameter_order=True)
+        try:
+            result = await self.session.execute(stmt, rows)
+            payment_ids = list(result.scalars().all())
+            await self.summaries.apply(
+                added=[
+                    PaymentFigures(
+                        payment.lease_id, False, payment.due_date, payment.gross_value
+                    )
+                    for payment in payments
+                ]
+            )
+            await self.session.commit()
         except IntegrityError as e:
             await self.session.rollback()
             raise AlreadyExistsException("Payment creation failed") from e
 
+        logger.info(f"Created {len(payment_ids)} payments in bulk")
+        return payment_ids
+
+    async def get_lease_ownership(
+        self, lease_ids: list[int]
+    ) -> dict[int, tuple[int, Optional[int]]]:
+        """Get the property and owner of each lease.
+
+        Args:
+            lease_ids (list[int]): Lease IDs
+
+        Returns:
+            dict[int, tuple[int, Optional[int]]]: (property_id, owner_id) by lease ID
+        """
+        if not lease_ids:
+            return {}
+
+        stmt = (
+            select(Lease.id, Unit.property_id, Property.owner_id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .where(Lease.id.in_(set(lease_ids)))
+        )
+        result = await self.session.execute(stmt)
+        return {row.id: (row.property_id, row.owner_id) for row in result}
+
+    async def sync_ownership(
+        self,
+        unit_ids: Optional[list[int]] = None,
+        property_ids: Optional[list[int]] = None,
+    ) -> int:
+        """Re-derive property_id and owner_id of payments from their leases.
+
+        Call after a unit moves to another property or a property changes
+        owner, in the same transaction. Summaries of every owner gaining or
+        losing payments are rebuilt. The caller is responsible for committing.
+
+        Args:
+            unit_ids (Optional[list[int]]): Units whose payments to update
+            property_ids (Optional[list[int]]): Properties whose payments to update
+
+        Returns:
+            int: Number of payments updated
+        """
+        leases = (
+            select(Lease.id, Unit.property_id, Property.owner_id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+        )
+        if unit_ids is not None:
+            leases = leases.where(Unit.id.in_(unit_ids))
+        if property_ids is not None:
+            leases = leases.where(Unit.property_id.in_(property_ids))
+        leases = leases.subquery()
+
+        changed = (
+            select(
+                Payment.id,
+                Payment.owner_id.label("old_owner_id"),
+                leases.c.property_id,
+                leases.c.owner_id,
+            )
+            .join(leases, Payment.lease_id == leases.c.id)
+            .where(
+                or_(
+                    Payment.property_id.is_distinct_from(leases.c.property_id),
+                    Payment.owner_id.is_distinct_from(leases.c.owner_id),
+                )
+            )
+            .subquery()
+        )
+        result = await self.session.execute(
+            update(Payment)
+            .where(Payment.id == changed.c.id)
+            .values(property_id=changed.c.property_id, owner_id=changed.c.owner_id)
+            .returning(changed.c.old_owner_id, changed.c.owner_id)
+        )
+        rows = result.all()
+
+        owner_ids = {owner_id for row in rows for owner_id in row if owner_id}
+        for owner_id in owner_ids:
+            await self.summaries.rebuild(owner_id)
+
+        logger.info(f"Synced ownership of {len(rows)} payments")
+        return len(rows)
+
+    async def clear_ownership(
+        self, unit_id: Optional[int] = None, property_id: Optional[int] = None
+    ) -> None:
+        """Detach payments of a unit or property that is about to be deleted.
+
+        Deleting a unit or property deletes its leases, which sets the
+        payments' lease_id to NULL. This removes those payments from the
+        summaries and clears their property_id and owner_id first so they
+        are no longer listed for the owner. The caller is responsible for
+        committing.
+
+        Args:
+            unit_id (Optional[int]): Unit about to be deleted
+            property_id (Optional[int]): Property about to be deleted
+        """
+        leases = select(Lease.id).join(Unit, Lease.unit_id == Unit.id)
+        if unit_id is not None:
+            leases = leases.where(Unit.id == unit_id)
+        if property_id is not None:
+            leases = leases.where(Unit.property_id == property_id)
+
+        result = await self.session.execute(
+            select(
+                Payment.lease_id,
+                Payment.is_paid,
+                Payment.due_date,
+                Payment.gross_value,
+            ).where(Payment.lease_id.in_(leases))
+        )
+        await self.summaries.apply(removed=[PaymentFigures(*row) for row in result])
+        await self.session.execute(
+            update(Payment)
+            .where(Payment.lease_id.in_(leases))
+            .values(property_id=None, owner_id=None)
+        )
+
     async def get_by_id(self, payment_id: int) -> Payment:
-        """Get payment by ID with relationships loaded.
+        """Get payment by ID with relationships loaded in a single query.
 
         Args:
             payment_id (int): Payment ID
@@ -89,130 +468,276 @@ class PaymentRepository:
         """
         stmt = (
             select(Payment)
-            .options(*self._get_payment_options())
+            .options(*self._get_single_payment_options())
             .where(Payment.id == payment_id)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
-        payment = result.scalar_one_or_none()
+        payment = result.unique().scalar_one_or_none()
 
         if not payment:
             raise NotFoundException(f"Payment {payment_id} not found")
 
         return payment
 
-    async def get_all(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> list[Payment]:
-        """Get all payments with relationships loaded.
+    def _filter_conditions(
+        self,
+        owner_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        lease_id: Optional[int] = None,
+        is_paid: Optional[bool] = None,
+        status: Optional[PaymentStatus] = None,
+        search: Optional[str] = None,
+    ) -> list:
+        """WHERE conditions for the payment list filters.
+
+        The tenant filter is on ``leases``, which the caller must join.
+        """
+        conditions = []
+        if owner_id is not None:
+            conditions.append(Payment.owner_id == owner_id)
+        if tenant_id is not None:
+            conditions.append(Lease.tenant_id == tenant_id)
+        if lease_id is not None:
+            conditions.append(Payment.lease_id == lease_id)
+        if is_paid is not None:
+            conditions.append(Payment.is_paid == is_paid)
+        if status is not None:
+            conditions.append(Payment.status == status)
+        if search:
+            conditions.append(search_condition(search))
+        return conditions
+
+    async def get_filtered(
+        self,
+        owner_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        lease_id: Optional[int] = None,
+        is_paid: Optional[bool] = None,
+        status: Optional[PaymentStatus] = None,
+        search: Optional[str] = None,
+        sort: PaymentSort = PaymentSort.NEWEST,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        compact: bool = False,
+    ) -> Page:
+        """Get payments matching all given filters in the requested order.
+
+        Filtering and sorting by status happen in SQL through the
+        ``Payment.status`` hybrid, so pages and totals are exact for every
+        combination of filters.
 
         Args:
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            tenant_id (Optional[int]): Restrict to leases of this tenant
+            lease_id (Optional[int]): Restrict to a single lease
+            is_paid (Optional[bool]): Filter by paid flag
+            status (Optional[PaymentStatus]): Filter by Paid, Pending or Overdue
+            search (Optional[str]): Free text search, see ``search_condition``
+            sort (PaymentSort): Sort order
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            compact (bool): Return compact rows instead of payments
 
         Returns:
-            list[Payment]: List of payments with relationships
+            Page: Page of matching payments with relationships, or compact rows
         """
-        stmt = (
-            select(Payment)
-            .options(*self._get_payment_options())
-            .order_by(Payment.created_at.desc())
+        stmt = self._list_query(compact, join_lease=tenant_id is not None).where(
+            *self._filter_conditions(
+                owner_id, tenant_id, lease_id, is_paid, status, search
+            )
         )
 
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        if offset is not None:
-            stmt = stmt.offset(offset)
-
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return await paginate(
+            self.session,
+            stmt,
+            SORT_KEYSETS[sort],
+            limit,
+            cursor,
+            include_total,
+            rows=compact,
+        )
 
-    async def get_by_lease_id(self, lease_id: int) -> list[Payment]:
-        """Get all payments for a specific lease.
+    async def stream_export_rows(
+        self,
+        owner_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        lease_id: Optional[int] = None,
+        is_paid: Optional[bool] = None,
+        status: Optional[PaymentStatus] = None,
+        search: Optional[str] = None,
+        sort: PaymentSort = PaymentSort.NEWEST,
+    ) -> AsyncIterator[Row]:
+        """Stream flat export rows for all payments matching the filters.
+
+        Rows are read through a server-side cursor ``EXPORT_BATCH_SIZE`` at a
+        time, so memory use does not grow with the number of payments. No ORM
+        objects are built.
 
         Args:
-            lease_id (int): Lease ID
-
-        Returns:
-            list[Payment]: List of payments for the lease
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            tenant_id (Optional[int]): Restrict to leases of this tenant
+            lease_id (Optional[int]): Restrict to a single lease
+            is_paid (Optional[bool]): Filter by paid flag
+            status (Optional[PaymentStatus]): Filter by Paid, Pending or Overdue
+            search (Optional[str]): Free text search, see ``search_condition``
+            sort (PaymentSort): Sort order
+
+        Yields:
+            Row: Values in ``EXPORT_COLUMNS`` order
         """
         stmt = (
-            select(Payment)
-            .options(*self._get_payment_options())
-            .where(Payment.lease_id == lease_id)
-            .order_by(Payment.created_at.desc())
+            select(*(column for _, column in EXPORT_COLUMNS))
+            .select_from(Payment)
+            .outerjoin(Lease, Payment.lease_id == Lease.id)
+            .outerjoin(Unit, Lease.unit_id == Unit.id)
+            .outerjoin(Property, Unit.property_id == Property.id)
+            .outerjoin(User, Lease.tenant_id == User.id)
+            .where(
+                *self._filter_conditions(
+                    owner_id, tenant_id, lease_id, is_paid, status, search
+                )
+            )
+            .order_by(*SORT_KEYSETS[sort].order_by())
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
 
-    async def get_by_tenant_id(self, tenant_id: int) -> list[Payment]:
-        """Get all payments for a specific tenant.
+        result = await self.session.stream(stmt)
+        async for partition in result.partitions():
+            for row in partition:
+                yield row
+
+    async def get_by_lease_id(
+        self,
+        lease_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        compact: bool = False,
+    ) -> Page:
+        """Get payments for a specific lease.
 
         Args:
-            tenant_id (int): Tenant ID
+            lease_id (int): Lease ID
+            limit (Optional[int]): Maximum number of results
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            compact (bool): Return compact rows instead of payments
 
         Returns:
-            list[Payment]: List of payments for the tenant
+            Page: Page of payments (or compact rows) for the lease, newest first
         """
-        stmt = (
-            select(Payment)
-            .join(Payment.lease)
-            .options()
-            .where(Payment.lease.tenant_id == tenant_id)
-            .order_by(Payment.created_at.desc())
+        stmt = self._list_query(compact).where(Payment.lease_id == lease_id)
+        return await paginate(
+            self.session,
+            stmt,
+            CREATED_AT_KEYSET,
+            limit,
+            cursor,
+            include_total,
+            rows=compact,
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
 
-    async def get_by_status(
-        self, is_paid: bool, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> list[Payment]:
-        """Get payments by payment status.
+    async def get_by_tenant_id(
+        self,
+        tenant_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        compact: bool = False,
+    ) -> Page:
+        """Get payments for a specific tenant.
 
         Args:
-            is_paid (bool): Payment status
+            tenant_id (int): Tenant ID
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            compact (bool): Return compact rows instead of payments
 
         Returns:
-            list[Payment]: List of payments with the specified status
+            Page: Page of payments (or compact rows) for the tenant, newest first
         """
-        stmt = (
-            select(Payment)
-            .options()
-            .where(Payment.is_paid == is_paid)
-            .order_by(Payment.created_at.desc())
+        stmt = self._list_query(compact, join_lease=True).where(
+            Lease.tenant_id == tenant_id
+        )
+        return await paginate(
+            self.session,
+            stmt,
+            CREATED_AT_KEYSET,
+            limit,
+            cursor,
+            include_total,
+            rows=compact,
         )
-
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        if offset is not None:
-            stmt = stmt.offset(offset)
-
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
 
     async def get_overdue_payments(
-        self, as_of_date: Optional[date] = None
-    ) -> list[Payment]:
+        self,
+        as_of_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        compact: bool = False,
+    ) -> Page:
         """Get overdue payments (unpaid and past due date).
 
         Args:
             as_of_date (Optional[date]): Date to check against (defaults to today)
+            limit (Optional[int]): Maximum number of results
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            compact (bool): Return compact rows instead of payments
 
         Returns:
-            list[Payment]: List of overdue payments
+            Page: Page of overdue payments (or compact rows), oldest due date first
         """
         if as_of_date is None:
             as_of_date = date.today()
 
-        stmt = (
-            select(Payment)
-            .options()
-            .where(~Payment.is_paid, Payment.due_date < as_of_date)
-            .order_by(Payment.due_date.asc())
+        stmt = self._list_query(compact).where(
+            ~Payment.is_paid, Payment.due_date < as_of_date
         )
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return await paginate(
+            self.session,
+            stmt,
+            DUE_DATE_KEYSET,
+            limit,
+            cursor,
+            include_total,
+            rows=compact,
+        )
+
+    async def _update_one(self, payment_id: int, values: dict) -> Payment:
+        """Update a payment with a single UPDATE ... RETURNING statement.
+
+        Summaries are adjusted from the returned old and new values, then
+        the payment is reloaded once with its relationships.
+
+        Args:
+            payment_id (int): Payment ID
+            values (dict): Column values to set
+
+        Returns:
+            Payment: Updated payment with relationships
+
+        Raises:
+            NotFoundException: If payment not found
+            AlreadyExistsException: If the lease already has a payment of the
+                same document type due on that date
+        """
+        try:
+            updated = await self.bulk_update([payment_id], values)
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise AlreadyExistsException(
+                "Lease already has a payment of this type due on that date"
+            ) from e
+        if not updated:
+            raise NotFoundException(f"Payment {payment_id} not found")
+        await self.session.commit()
+        return await self.get_by_id(payment_id)
 
     async def update(self, payment_id: int, data: PaymentUpdate) -> Payment:
         """Update payment information.
@@ -226,23 +751,22 @@ class PaymentRepository:
 
         Raises:
             NotFoundException: If payment not found
+            AlreadyExistsException: If the lease already has a payment of the
+                same document type due on that date
         """
-        payment = await self.get_by_id(payment_id)
         update_data = data.model_dump(exclude_unset=True)
 
         if not update_data:
-            return payment
+            return await self.get_by_id(payment_id)
 
-        for field, value in update_data.items():
-            setattr(payment, field, value)
-
-        await self.session.commit()
-        await self.session.refresh(payment)
+        if "lease_id" in update_data:
+            update_data.update(self._ownership_values(update_data["lease_id"]))
 
-        # Reload with relationships
-        updated_payment = await self.get_by_id(payment_id)
+        payment = await self._update_one(payment_id, update_data)
+        if "lease_id" in update_data:
+            invalidate_ownership()
         logger.info(f"Updated payment: {payment_id}")
-        return updated_payment
+        return payment
 
     async def mark_as_paid(self, payment_id: int) -> Payment:
         """Mark payment as paid.
@@ -256,15 +780,9 @@ class PaymentRepository:
         Raises:
             NotFoundException: If payment not found
         """
-        payment = await self.get_by_id(payment_id)
-        payment.is_paid = True
-
-        await self.session.commit()
-        await self.session.refresh(payment)
-
-        updated_payment = await self.get_by_id(payment_id)
+        payment = await self._update_one(payment_id, {"is_paid": True})
         logger.info(f"Marked payment as paid: {payment_id}")
-        return updated_payment
+        return payment
 
     async def mark_as_unpaid(self, payment_id: int) -> Payment:
         """Mark payment as unpaid.
@@ -278,15 +796,9 @@ class PaymentRepository:
         Raises:
             NotFoundException: If payment not found
         """
-        payment = await self.get_by_id(payment_id)
-        payment.is_paid = False
-
-        await self.session.commit()
-        await self.session.refresh(payment)
-
-        updated_payment = await self.get_by_id(payment_id)
+        payment = await self._update_one(payment_id, {"is_paid": False})
         logger.info(f"Marked payment as unpaid: {payment_id}")
-        return updated_payment
+        return payment
 
     async def attach_invoice(
         self, payment_id: int, invoice_data: PaymentInvoiceUpdate
@@ -303,18 +815,14 @@ class PaymentRepository:
         Raises:
             NotFoundException: If payment not found
         """
-        payment = await self.get_by_id(payment_id)
-        payment.invoice_file_id = invoice_data.invoice_file_id
-
-        await self.session.commit()
-        await self.session.refresh(payment)
-
-        updated_payment = await self.get_by_id(payment_id)
+        payment = await self._update_one(
+            payment_id, {"invoice_file_id": invoice_data.invoice_file_id}
+        )
         logger.info(f"Attached invoice to payment: {payment_id}")
-        return updated_payment
+        return payment
 
     async def delete(self, payment_id: int) -> None:
-        """Delete a payment.
+        """Delete a payment with a single DELETE ... RETURNING statement.
 
         Args:
             payment_id (int): Payment ID
@@ -322,183 +830,373 @@ class PaymentRepository:
         Raises:
             NotFoundException: If payment not found
         """
-        payment = await self.get_by_id(payment_id)
-
-        await self.session.delete(payment)
+        if not await self.bulk_delete([payment_id]):
+            raise NotFoundException(f"Payment {payment_id} not found")
         await self.session.commit()
 
         logger.info(f"Deleted payment: {payment_id}")
 
-    async def count_total(self) -> int:
-        """Get total count of payments.
+    def _scoped_ids(self, payment_ids: list[int], owner_id: Optional[int]) -> list:
+        """WHERE conditions matching ``payment_ids`` the caller may change."""
+        conditions = [Payment.id == any_(literal(payment_ids, ARRAY(Integer)))]
+        if owner_id is not None:
+            conditions.append(Payment.owner_id == owner_id)
+        return conditions
 
-        Returns:
-            int: Total number of payments
-        """
-        stmt = select(Payment.id)
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+    async def bulk_update(
+        self, payment_ids: list[int], values: dict, owner_id: Optional[int] = None
+    ) -> list[int]:
+        """Update many payments with a single UPDATE ... RETURNING statement.
 
-    async def count_by_status(self, is_paid: bool) -> int:
-        """Get count of payments by status.
+        Authorization is part of the statement: when ``owner_id`` is given,
+        only payments on that owner's properties are updated. Summaries are
+        adjusted for every changed payment. The caller is responsible for
+        committing.
 
         Args:
-            is_paid (bool): Payment status
+            payment_ids (list[int]): Payments to update
+            values (dict): Column values to set
+            owner_id (Optional[int]): Restrict to payments of this owner
 
         Returns:
-            int: Number of payments with the specified status
+            list[int]: IDs of the payments that were updated
         """
-        stmt = select(Payment.id).where(Payment.is_paid == is_paid)
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        old = (
+            select(
+                Payment.id,
+                Payment.lease_id,
+                Payment.is_paid,
+                Payment.due_date,
+                Payment.gross_value,
+            )
+            .where(*self._scoped_ids(payment_ids, owner_id))
+            .with_for_update()
+            .subquery()
+        )
+        result = await self.session.execute(
+            update(Payment)
+            .where(Payment.id == old.c.id)
+            .values(**values)
+            .returning(
+                Payment.id,
+                old.c.lease_id,
+                old.c.is_paid,
+                old.c.due_date,
+                old.c.gross_value,
+                Payment.lease_id,
+                Payment.is_paid,
+                Payment.due_date,
+                Payment.gross_value,
+            )
+            .execution_options(synchronize_session=False)
+        )
 
-    async def get_by_property_owner(
-        self, owner_id: int, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> list[Payment]:
-        """Get all payments for properties owned by a specific owner.
+        updated, added, removed = [], [], []
+        for row in result:
+            before, after = PaymentFigures(*row[1:5]), PaymentFigures(*row[5:9])
+            updated.append(row[0])
+            if before != after:
+                removed.append(before)
+                added.append(after)
+        await self.summaries.apply(added=added, removed=removed)
+        return updated
+
+    async def bulk_delete(
+        self, payment_ids: list[int], owner_id: Optional[int] = None
+    ) -> list[int]:
+        """Delete many payments with a single DELETE ... RETURNING statement.
 
         Args:
-            owner_id (int): Property owner ID
-            limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            payment_ids (list[int]): Payments to delete
+            owner_id (Optional[int]): Restrict to payments of this owner
 
         Returns:
-            list[Payment]: List of payments for the owner's properties
+            list[int]: IDs of the payments that were deleted
         """
-        from api.src.leases.models import Lease
-        from api.src.properties.models import Property
-        from api.src.units.models import Unit
-
-        stmt = (
-            select(Payment)
-            .join(Payment.lease)
-            .join(Lease.unit)
-            .join(Unit.property)
-            .options()
-            .where(Property.owner_id == owner_id)
-            .order_by(Payment.created_at.desc())
+        result = await self.session.execute(
+            delete(Payment)
+            .where(*self._scoped_ids(payment_ids, owner_id))
+            .returning(
+                Payment.id,
+                Payment.lease_id,
+                Payment.is_paid,
+                Payment.due_date,
+                Payment.gross_value,
+            )
+            .execution_options(synchronize_session=False)
         )
+        rows = result.all()
+        await self.summaries.apply(removed=[PaymentFigures(*row[1:]) for row in rows])
+        return [row[0] for row in rows]
 
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        if offset is not None:
-            stmt = stmt.offset(offset)
-
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
-
-    async def get_by_property_owner_and_status(
+    async def get_overdue_payments_by_owner(
         self,
         owner_id: int,
-        is_paid: bool,
+        as_of_date: Optional[date] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None,
-    ) -> list[Payment]:
-        """Get payments by property owner and payment status.
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        compact: bool = False,
+    ) -> Page:
+        """Get overdue payments for properties owned by a specific owner.
 
         Args:
             owner_id (int): Property owner ID
-            is_paid (bool): Payment status
+            as_of_date (Optional[date]): Date to check against (defaults to today)
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            compact (bool): Return compact rows instead of payments
 
         Returns:
-            list[Payment]: List of payments for the owner's properties with specified status
+            Page: Page of the owner's overdue payments (or compact rows), oldest due date first
         """
-        from api.src.leases.models import Lease
-        from api.src.properties.models import Property
-        from api.src.units.models import Unit
+        if as_of_date is None:
+            as_of_date = date.today()
 
-        stmt = (
-            select(Payment)
-            .join(Payment.lease)
-            .join(Lease.unit)
-            .join(Unit.property)
-            .options()
-            .where(Property.owner_id == owner_id, Payment.is_paid == is_paid)
-            .order_by(Payment.created_at.desc())
+        stmt = self._list_query(compact).where(
+            Payment.owner_id == owner_id,
+            ~Payment.is_paid,
+            Payment.due_date < as_of_date,
+        )
+        return await paginate(
+            self.session,
+            stmt,
+            DUE_DATE_KEYSET,
+            limit,
+            cursor,
+            include_total,
+            rows=compact,
         )
 
-        if limit is not None:
-            stmt = stmt.limit(limit)
-        if offset is not None:
-            stmt = stmt.offset(offset)
-
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
-
-    async def get_overdue_payments_by_owner(
-        self, owner_id: int, as_of_date: Optional[date] = None
-    ) -> list[Payment]:
-        """Get overdue payments for properties owned by a specific owner.
+    async def get_statistics(
+        self,
+        owner_id: Optional[int] = None,
+        property_id: Optional[int] = None,
+        as_of_date: Optional[date] = None,
+    ) -> dict:
+        """Get payment counts and amounts grouped by status in a single query.
 
         Args:
-            owner_id (int): Property owner ID
-            as_of_date (Optional[date]): Date to check against (defaults to today)
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            property_id (Optional[int]): Restrict to a single property
+            as_of_date (Optional[date]): Date to check overdue against (defaults to today)
 
         Returns:
-            list[Payment]: List of overdue payments for the owner's properties
+            dict: Counts and gross value sums for total, paid, pending and overdue
         """
-        from api.src.leases.models import Lease
-        from api.src.properties.models import Property
-        from api.src.units.models import Unit
-
         if as_of_date is None:
             as_of_date = date.today()
 
-        stmt = (
-            select(Payment)
-            .join(Payment.lease)
-            .join(Lease.unit)
-            .join(Unit.property)
-            .options()
-            .where(
-                Property.owner_id == owner_id,
-                ~Payment.is_paid,
-                Payment.due_date < as_of_date,
-            )
-            .order_by(Payment.due_date.asc())
-        )
+        overdue = and_(~Payment.is_paid, Payment.due_date < as_of_date)
+        pending = and_(~Payment.is_paid, Payment.due_date >= as_of_date)
+
+        stmt = select(
+            func.count().label("total_payments"),
+            func.count().filter(Payment.is_paid).label("paid_count"),
+            func.count().filter(pending).label("pending_count"),
+            func.count().filter(overdue).label("overdue_count"),
+            func.coalesce(func.sum(Payment.gross_value), 0).label("total_amount"),
+            func.coalesce(
+                func.sum(Payment.gross_value).filter(Payment.is_paid), 0
+            ).label("paid_amount"),
+            func.coalesce(func.sum(Payment.gross_value).filter(pending), 0).label(
+                "pending_amount"
+            ),
+            func.coalesce(func.sum(Payment.gross_value).filter(overdue), 0).label(
+                "overdue_amount"
+            ),
+        ).select_from(Payment)
+
+        if owner_id is not None:
+            stmt = stmt.where(Payment.owner_id == owner_id)
+        if property_id is not None:
+            stmt = stmt.where(Payment.property_id == property_id)
+
         result = await self.session.execute(stmt)
-        return result.scalars().all()
+        statistics = dict(result.one()._mapping)
+        statistics["as_of_date"] = as_of_date
+        return statistics
+
+    async def get_aging(
+        self, owner_id: Optional[int] = None, as_of_date: Optional[date] = None
+    ) -> list[Row]:
+        """Bucket overdue amounts by days past due in a single query.
 
-    async def count_total_for_owner(self, owner_id: int) -> int:
-        """Get total count of payments for properties owned by a specific owner.
+        ``width_bucket`` assigns every overdue payment to one of the
+        ``AGING_BUCKETS`` and GROUPING SETS aggregate the buckets per
+        property, per tenant and overall in the same scan.
 
         Args:
-            owner_id (int): Property owner ID
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            as_of_date (Optional[date]): Date to age against (defaults to today)
 
         Returns:
-            int: Total number of payments for the owner's properties
+            list[Row]: Rows with ``level`` ("property", "tenant" or "total"),
+                property_id, property_title, tenant_id, tenant_name, one amount
+                per bucket, total_amount and overdue_count
         """
+        if as_of_date is None:
+            as_of_date = date.today()
+
+        days_overdue = literal(as_of_date, Date) - Payment.due_date
+        bucket = func.width_bucket(
+            days_overdue, literal(AGING_BUCKET_BOUNDS, ARRAY(Integer))
+        )
+        tenant_name = (User.first_name + " " + User.last_name).label("tenant_name")
+        grouping = func.grouping(Payment.property_id, Lease.tenant_id)
+
         stmt = (
-            select(Payment.id)
+            select(
+                case(
+                    (grouping == 1, "property"),
+                    (grouping == 2, "tenant"),
+                    else_="total",
+                ).label("level"),
+                Payment.property_id,
+                Property.title.label("property_title"),
+                Lease.tenant_id,
+                tenant_name,
+                *[
+                    func.coalesce(
+                        func.sum(Payment.gross_value).filter(bucket == index), 0
+                    ).label(name)
+                    for index, name in enumerate(AGING_BUCKETS)
+                ],
+                func.coalesce(func.sum(Payment.gross_value), 0).label("total_amount"),
+                func.count().label("overdue_count"),
+            )
             .select_from(Payment)
-            .join(Lease, Payment.lease_id == Lease.id)
-            .join(Unit, Lease.unit_id == Unit.id)
-            .join(Property, Unit.property_id == Property.id)
-            .where(Property.owner_id == owner_id)
+            .outerjoin(Property, Payment.property_id == Property.id)
+            .outerjoin(Lease, Payment.lease_id == Lease.id)
+            .outerjoin(User, Lease.tenant_id == User.id)
+            .where(~Payment.is_paid, Payment.due_date < as_of_date)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(Payment.property_id, Property.title),
+                    tuple_(Lease.tenant_id, User.first_name, User.last_name),
+                    tuple_(),
+                )
+            )
+            .order_by(grouping, text("total_amount DESC"))
         )
+        if owner_id is not None:
+            stmt = stmt.where(Payment.owner_id == owner_id)
+
         result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        return list(result.all())
+
+    def _ledger_scope(
+        self,
+        entity,
+        lease_id: Optional[int],
+        tenant_id: Optional[int],
+        owner_id: Optional[int],
+    ) -> list:
+        """WHERE conditions selecting the ledger's payments from ``entity``."""
+        conditions = []
+        if lease_id is not None:
+            conditions.append(entity.lease_id == lease_id)
+        if tenant_id is not None:
+            conditions.append(
+                entity.lease_id.in_(
+                    select(Lease.id).where(Lease.tenant_id == tenant_id)
+                )
+            )
+        if owner_id is not None:
+            conditions.append(entity.owner_id == owner_id)
+        return conditions
 
-    async def count_by_status_for_owner(self, owner_id: int, is_paid: bool) -> int:
-        """Get count of payments by status for properties owned by a specific owner.
+    async def get_ledger(
+        self,
+        lease_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        owner_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Page:
+        """Get ledger entries with a running balance, oldest due date first.
+
+        Every payment is a charge, paid payments are also a payment of the
+        same amount. The page is selected by keyset and LIMIT in a subquery
+        and its balance accumulated by ``SUM() OVER (ORDER BY due_date, id)``
+        over that subquery only, on top of an opening balance summed over all
+        earlier entries (before the cursor or the start date) in the same
+        query, so deep pages and long histories never window over more rows
+        than they return.
 
         Args:
-            owner_id (int): Property owner ID
-            is_paid (bool): Payment status
+            lease_id (Optional[int]): Restrict to a single lease
+            tenant_id (Optional[int]): Restrict to leases of this tenant
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            start_date (Optional[date]): First due date to return
+            end_date (Optional[date]): Last due date to return
+            limit (Optional[int]): Maximum number of results
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching entries
 
         Returns:
-            int: Number of payments with the specified status for the owner's properties
+            Page: Rows with id, due_date, document_type, description, lease_id,
+                status, charge, payment and balance
         """
-        stmt = (
-            select(Payment.id)
-            .select_from(Payment)
-            .join(Lease, Payment.lease_id == Lease.id)
-            .join(Unit, Lease.unit_id == Unit.id)
-            .join(Property, Unit.property_id == Property.id)
-            .where(Property.owner_id == owner_id, Payment.is_paid == is_paid)
+        charge = cast(Payment.gross_value, LEDGER_AMOUNT)
+        stmt = select(
+            Payment.id,
+            Payment.due_date,
+            Payment.document_type,
+            Payment.description,
+            Payment.lease_id,
+            STATUS,
+            charge.label("charge"),
+            case((Payment.is_paid, charge), else_=0).label("payment"),
+        ).where(*self._ledger_scope(Payment, lease_id, tenant_id, owner_id))
+        if start_date is not None:
+            stmt = stmt.where(Payment.due_date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Payment.due_date <= end_date)
+        total = await count_rows(self.session, stmt) if include_total else None
+
+        page = DUE_DATE_KEYSET.apply(stmt, cursor)
+        if limit is not None:
+            page = page.limit(limit + 1)
+        page = page.subquery("page")
+
+        order = (page.c.due_date, page.c.id)
+        balance = func.sum(page.c.charge - page.c.payment).over(order_by=order)
+        earlier = aliased(Payment)
+        opening = None
+        if cursor:
+            opening = tuple_(earlier.due_date, earlier.id) <= tuple_(
+                *DUE_DATE_KEYSET.decode(cursor)
+            )
+        elif start_date is not None:
+            opening = earlier.due_date < start_date
+        if opening is not None:
+            earlier_charge = cast(earlier.gross_value, LEDGER_AMOUNT)
+            balance += (
+                select(
+                    func.coalesce(
+                        func.sum(case((earlier.is_paid, 0), else_=earlier_charge)), 0
+                    )
+                )
+                .where(
+                    *self._ledger_scope(earlier, lease_id, tenant_id, owner_id),
+                    opening,
+                )
+                .scalar_subquery()
+            )
+
+        result = await self.session.execute(
+            select(*page.c, balance.label("balance")).order_by(*order)
         )
-        result = await self.session.execute(stmt)
-        return len(result.scalars().all())
+        items = list(result.all())
+
+        next_cursor = None
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+            next_cursor = DUE_DATE_KEYSET.encode(items[-1])
+
+        return Page(items=items, next_cursor=next_cursor, total=total)
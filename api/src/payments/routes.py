@@ -1,23 +1,38 @@
-from typing import Optional
+from datetime import date
+from typing import AsyncIterator, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.core.database import get_session
+from api.core.database import async_session, get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.idempotency.service import IDEMPOTENCY_KEY_HEADER, IdempotencyService
+from api.src.ownership.service import OwnershipService, get_ownership_service
+from api.src.payments.export import CSV_MEDIA_TYPE, XLSX_MEDIA_TYPE
 from api.src.payments.schemas import (
+    BulkPaymentRequest,
+    BulkPaymentResponse,
+    ExportFormat,
+    PaymentAgingReport,
+    PaymentCompactListResponse,
     PaymentCreate,
     PaymentInvoiceUpdate,
+    PaymentListResponse,
+    PaymentListView,
     PaymentResponse,
+    PaymentSort,
+    PaymentStatistics,
+    PaymentStatus,
     PaymentStatusUpdate,
     PaymentUpdate,
+    PaymentView,
     RecurringPaymentCreate,
     RecurringPaymentResponse,
 )
 from api.src.payments.service import PaymentService
-from api.src.users.models import User
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/payments", tags=["payments"])
@@ -30,6 +45,12 @@ def get_payment_service(
     return PaymentService(session)
 
 
+async def get_idempotency_service() -> AsyncIterator[IdempotencyService]:
+    """Get idempotency service instance with a session of its own."""
+    async with async_session() as session:
+        yield IdempotencyService(session)
+
+
 @router.post(
     "/",
     response_model=PaymentResponse,
@@ -37,103 +58,293 @@ def get_payment_service(
 )
 async def create_payment(
     payment_data: PaymentCreate,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        max_length=255,
+        description="Retries with the same key replay the first response",
+    ),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Create a new payment.
 
-    Requires: ADMIN or OWNER role
+    Requires: ADMIN or OWNER role. Owners must attach the payment to one
+    of their leases, since lease-less payments have no owner.
     """
     if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to create payments",
         )
+    if payment_data.lease_id is None and current_user.role != EnumUserRoles.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Payments created by owners require a lease",
+        )
+    if payment_data.lease_id is not None:
+        await ownership.authorize(
+            current_user,
+            "lease",
+            payment_data.lease_id,
+            detail="Not authorized to create payments for this lease",
+        )
 
     logger.info(f"Creating payment by user {current_user.id}")
-    return await service.create_payment(payment_data)
+    return await idempotency.run(
+        idempotency_key,
+        current_user.id,
+        "create_payment",
+        payment_data,
+        lambda: service.create_payment(payment_data),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
     "/",
-    response_model=list[PaymentResponse],
+    response_model=PaymentListView,
 )
 async def get_payments(
-    limit: Optional[int] = Query(
-        None, ge=1, le=100, description="Maximum number of results"
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    include_total: bool = Query(
+        False, description="Also return the total number of matching payments"
+    ),
+    view: PaymentView = Query(
+        PaymentView.FULL, description="full payments or compact table rows"
+    ),
+    payment_status: Optional[PaymentStatus] = Query(
+        None, alias="status", description="Filter by status: Paid, Pending, Overdue"
+    ),
+    sort: PaymentSort = Query(
+        PaymentSort.NEWEST, description="Sort order, '-' prefix for descending"
     ),
-    offset: Optional[int] = Query(None, ge=0, description="Number of results to skip"),
     status_filter: Optional[str] = Query(
-        None, regex="^(paid|unpaid|overdue)$", description="Filter by payment status"
+        None,
+        pattern="^(paid|unpaid|overdue)$",
+        description="Filter by payment status (deprecated, use status)",
+        deprecated=True,
     ),
     lease_id: Optional[int] = Query(None, description="Filter by lease ID"),
     tenant_id: Optional[int] = Query(None, description="Filter by tenant ID"),
+    q: Optional[str] = Query(
+        None,
+        max_length=100,
+        description="Search receiver, description and document type",
+    ),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
-) -> list[PaymentResponse]:
-    """Get payments with optional filtering.
+    current_user: Principal = Depends(get_current_user),
+) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+    """Get payments with optional filtering, sorting and keyset pagination.
 
     Supports filtering by:
-    - status: paid, unpaid, overdue
+    - status: Paid, Pending, Overdue
     - lease_id: specific lease
     - tenant_id: specific tenant
+    - q: words matching the start of words in the receiver, description or
+      document type, or text found anywhere in the receiver
 
-    Tenants can only see their own payments.
+    Filters can be combined. Results are returned in pages; pass next_cursor
+    back as cursor (with the same filters and sort) to get the following page.
+    Tenants can only see their own payments and owners only payments for
+    their properties.
     """
     logger.info(
-        f"Getting payments for user {current_user.id} with filters: status={status_filter}, lease_id={lease_id}, tenant_id={tenant_id}"
+        f"Getting payments for user {current_user.id} with filters: status={payment_status}, lease_id={lease_id}, tenant_id={tenant_id}, q={q}, sort={sort.value}"
+    )
+
+    filters = _list_filters(current_user, payment_status, status_filter, tenant_id, q)
+    return await service.get_payments(
+        **filters,
+        lease_id=lease_id,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+        view=view,
     )
 
-    # If user is tenant, they can only see their own payments
-    if current_user.role == EnumUserRoles.TENANT:
-        return await service.get_payments_by_tenant(current_user.id)
 
-    # Apply filters based on query parameters
-    if tenant_id:
-        return await service.get_payments_by_tenant(tenant_id)
+@router.get("/export")
+async def export_payments(
+    export_format: ExportFormat = Query(
+        ExportFormat.CSV, alias="format", description="File format: csv or xlsx"
+    ),
+    payment_status: Optional[PaymentStatus] = Query(
+        None, alias="status", description="Filter by status: Paid, Pending, Overdue"
+    ),
+    sort: PaymentSort = Query(
+        PaymentSort.NEWEST, description="Sort order, '-' prefix for descending"
+    ),
+    status_filter: Optional[str] = Query(
+        None,
+        pattern="^(paid|unpaid|overdue)$",
+        description="Filter by payment status (deprecated, use status)",
+        deprecated=True,
+    ),
+    lease_id: Optional[int] = Query(None, description="Filter by lease ID"),
+    tenant_id: Optional[int] = Query(None, description="Filter by tenant ID"),
+    q: Optional[str] = Query(
+        None,
+        max_length=100,
+        description="Search receiver, description and document type",
+    ),
+    current_user: Principal = Depends(get_current_user),
+) -> StreamingResponse:
+    """Download all payments matching the filters as a CSV or XLSX file.
 
-    if lease_id:
-        return await service.get_payments_by_lease(lease_id)
+    Takes the same filters and sort as the payment list, without pagination.
+    The file is streamed while payments are read from a server-side cursor,
+    so exports of any size start downloading immediately.
+    """
+    logger.info(
+        f"Exporting payments as {export_format.value} for user {current_user.id} with filters: status={payment_status}, lease_id={lease_id}, tenant_id={tenant_id}, q={q}, sort={sort.value}"
+    )
+    filters = _list_filters(current_user, payment_status, status_filter, tenant_id, q)
 
-    # Handle status filters with owner/admin logic
-    if status_filter == "paid":
-        if current_user.role == EnumUserRoles.OWNER:
-            return await service.get_payments_for_owner_by_status(
-                current_user.id, True, limit=limit, offset=offset
+    async def content():
+        # The request scoped session is closed before the body is streamed
+        async with async_session() as session:
+            chunks = PaymentService(session).export_payments(
+                export_format, **filters, lease_id=lease_id, sort=sort
             )
-        return await service.get_payments_by_status(True, limit=limit, offset=offset)
+            async for chunk in chunks:
+                yield chunk
+
+    if export_format == ExportFormat.XLSX:
+        media_type = XLSX_MEDIA_TYPE
+    else:
+        media_type = CSV_MEDIA_TYPE
+    return StreamingResponse(
+        content(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="payments.{export_format.value}"'
+        },
+    )
+
+
+def _list_filters(
+    current_user: Principal,
+    payment_status: Optional[PaymentStatus],
+    status_filter: Optional[str],
+    tenant_id: Optional[int],
+    q: Optional[str] = None,
+) -> dict:
+    """Resolve list filters, scoping tenants and owners to their own payments."""
+    is_paid = None
+    if status_filter == "paid":
+        payment_status = PaymentStatus.PAID
     elif status_filter == "unpaid":
-        if current_user.role == EnumUserRoles.OWNER:
-            return await service.get_payments_for_owner_by_status(
-                current_user.id, False, limit=limit, offset=offset
-            )
-        return await service.get_payments_by_status(False, limit=limit, offset=offset)
+        is_paid = False
     elif status_filter == "overdue":
-        if current_user.role == EnumUserRoles.OWNER:
-            return await service.get_overdue_payments_for_owner(current_user.id)
-        return await service.get_overdue_payments()
+        payment_status = PaymentStatus.OVERDUE
 
-    # Default: get all payments based on user role
-    if current_user.role == EnumUserRoles.OWNER:
-        return await service.get_payments_for_owner(
-            current_user.id, limit=limit, offset=offset
+    owner_id = None
+    if current_user.role == EnumUserRoles.TENANT:
+        tenant_id = current_user.id
+    elif current_user.role == EnumUserRoles.OWNER:
+        owner_id = current_user.id
+
+    return {
+        "owner_id": owner_id,
+        "tenant_id": tenant_id,
+        "is_paid": is_paid,
+        "status": payment_status,
+        "search": (q or "").strip() or None,
+    }
+
+
+@router.post(
+    "/bulk",
+    response_model=BulkPaymentResponse,
+)
+async def apply_bulk_payment_operations(
+    request: BulkPaymentRequest,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        max_length=255,
+        description="Retries with the same key replay the first response",
+    ),
+    service: PaymentService = Depends(get_payment_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    current_user: Principal = Depends(get_current_user),
+) -> BulkPaymentResponse:
+    """Mark paid/unpaid, update or delete many payments in one call.
+
+    Each operation is applied with a single set-based statement and all
+    operations are committed in one transaction. Owners can only change
+    payments for their own properties; other payments are reported as failed
+    items, as are payments that do not exist.
+
+    Requires: ADMIN or OWNER role
+    """
+    if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to change payments",
         )
 
-    # ADMIN gets all payments
-    return await service.get_all_payments(limit=limit, offset=offset)
+    logger.info(
+        f"Applying {len(request.operations)} bulk payment operations by user {current_user.id}"
+    )
+    owner_id = current_user.id if current_user.role == EnumUserRoles.OWNER else None
+    return await idempotency.run(
+        idempotency_key,
+        current_user.id,
+        "bulk_payment_operations",
+        request,
+        lambda: service.apply_bulk_operations(request, owner_id=owner_id),
+    )
+
+
+@router.get(
+    "/aging",
+    response_model=PaymentAgingReport,
+)
+async def get_payment_aging(
+    service: PaymentService = Depends(get_payment_service),
+    current_user: Principal = Depends(get_current_user),
+) -> PaymentAgingReport:
+    """Get overdue amounts bucketed by days past due per property and tenant.
+
+    Buckets are 0-30, 31-60, 61-90 and over 90 days past the due date.
+    Owners only see their own properties.
+
+    Requires: ADMIN or OWNER role
+    """
+    if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view the aging report",
+        )
+
+    logger.info(f"Getting payment aging report for user {current_user.id}")
+    owner_id = current_user.id if current_user.role == EnumUserRoles.OWNER else None
+    return await service.get_aging_report(owner_id=owner_id)
 
 
 @router.get(
     "/statistics",
-    response_model=dict,
+    response_model=PaymentStatistics,
 )
 async def get_payment_statistics(
+    as_of: Optional[date] = Query(
+        None, description="Date to check overdue payments against (defaults to today)"
+    ),
+    property_id: Optional[int] = Query(None, description="Filter by property ID"),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
-) -> dict:
+    current_user: Principal = Depends(get_current_user),
+) -> PaymentStatistics:
     """Get payment statistics.
 
-    Returns counts for total, paid, pending, and overdue payments.
+    Returns counts and amounts for total, paid, pending, and overdue payments.
     Requires: ADMIN or OWNER role
     """
     if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
@@ -146,22 +357,37 @@ async def get_payment_statistics(
 
     # If user is OWNER, get statistics only for their properties
     if current_user.role == EnumUserRoles.OWNER:
-        return await service.get_payment_statistics_for_owner(current_user.id)
+        return await service.get_payment_statistics_for_owner(
+            current_user.id, as_of_date=as_of, property_id=property_id
+        )
 
     # ADMIN gets all statistics
-    return await service.get_payment_statistics()
+    return await service.get_payment_statistics(
+        as_of_date=as_of, property_id=property_id
+    )
 
 
 @router.get(
     "/overdue",
-    response_model=list[PaymentResponse],
+    response_model=PaymentListView,
 )
 async def get_overdue_payments(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    include_total: bool = Query(
+        False, description="Also return the total number of matching payments"
+    ),
+    view: PaymentView = Query(
+        PaymentView.FULL, description="full payments or compact table rows"
+    ),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
-) -> list[PaymentResponse]:
-    """Get all overdue payments.
+    current_user: Principal = Depends(get_current_user),
+) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+    """Get overdue payments, oldest due date first.
 
+    Owners only see overdue payments for their own properties.
     Requires: ADMIN or OWNER role
     """
     if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
@@ -171,7 +397,16 @@ async def get_overdue_payments(
         )
 
     logger.info(f"Getting overdue payments for user {current_user.id}")
-    return await service.get_overdue_payments()
+    page = {
+        "limit": limit,
+        "cursor": cursor,
+        "include_total": include_total,
+        "view": view,
+    }
+
+    if current_user.role == EnumUserRoles.OWNER:
+        return await service.get_overdue_payments_for_owner(current_user.id, **page)
+    return await service.get_overdue_payments(**page)
 
 
 @router.get(
@@ -181,12 +416,21 @@ async def get_overdue_payments(
 async def get_payment(
     payment_id: int,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Get payment by ID.
 
-    Tenants can only access their own payments.
+    Tenants can only access their own payments and owners only payments for
+    their properties.
     """
+    if current_user.role != EnumUserRoles.TENANT:
+        await ownership.authorize(
+            current_user,
+            "payment",
+            payment_id,
+            detail="Not authorized to view this payment",
+        )
     payment = await service.get_payment(payment_id)
 
     # Check if tenant is trying to access someone else's payment
@@ -212,17 +456,41 @@ async def update_payment(
     payment_id: int,
     payment_data: PaymentUpdate,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Update payment information.
 
-    Requires: ADMIN or OWNER role
+    Requires: ADMIN or OWNER role. Owners cannot detach a payment from
+    its lease.
     """
     if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update payments",
         )
+    if (
+        "lease_id" in payment_data.model_fields_set
+        and payment_data.lease_id is None
+        and current_user.role != EnumUserRoles.ADMIN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Payments of owners require a lease",
+        )
+    await ownership.authorize(
+        current_user,
+        "payment",
+        payment_id,
+        detail="Not authorized to update this payment",
+    )
+    if payment_data.lease_id is not None:
+        await ownership.authorize(
+            current_user,
+            "lease",
+            payment_data.lease_id,
+            detail="Not authorized to move payments to this lease",
+        )
 
     logger.info(f"Updating payment {payment_id} by user {current_user.id}")
     return await service.update_payment(payment_id, payment_data)
@@ -236,7 +504,8 @@ async def update_payment_status(
     payment_id: int,
     status_data: PaymentStatusUpdate,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Update payment status (mark as paid/unpaid).
 
@@ -247,6 +516,12 @@ async def update_payment_status(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to update payment status",
         )
+    await ownership.authorize(
+        current_user,
+        "payment",
+        payment_id,
+        detail="Not authorized to update the status of this payment",
+    )
 
     logger.info(
         f"Updating payment {payment_id} status to {status_data.is_paid} by user {current_user.id}"
@@ -265,7 +540,8 @@ async def update_payment_status(
 async def mark_payment_as_paid(
     payment_id: int,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Mark payment as paid.
 
@@ -276,6 +552,12 @@ async def mark_payment_as_paid(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to mark payments as paid",
         )
+    await ownership.authorize(
+        current_user,
+        "payment",
+        payment_id,
+        detail="Not authorized to mark this payment as paid",
+    )
 
     logger.info(f"Marking payment {payment_id} as paid by user {current_user.id}")
     return await service.mark_payment_as_paid(payment_id)
@@ -288,7 +570,8 @@ async def mark_payment_as_paid(
 async def mark_payment_as_unpaid(
     payment_id: int,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Mark payment as unpaid.
 
@@ -299,6 +582,12 @@ async def mark_payment_as_unpaid(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to mark payments as unpaid",
         )
+    await ownership.authorize(
+        current_user,
+        "payment",
+        payment_id,
+        detail="Not authorized to mark this payment as unpaid",
+    )
 
     logger.info(f"Marking payment {payment_id} as unpaid by user {current_user.id}")
     return await service.mark_payment_as_unpaid(payment_id)
@@ -312,7 +601,8 @@ async def attach_invoice_to_payment(
     payment_id: int,
     invoice_data: PaymentInvoiceUpdate,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PaymentResponse:
     """Attach invoice file to payment.
 
@@ -323,6 +613,12 @@ async def attach_invoice_to_payment(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to attach invoices to payments",
         )
+    await ownership.authorize(
+        current_user,
+        "payment",
+        payment_id,
+        detail="Not authorized to attach invoices to this payment",
+    )
 
     logger.info(f"Attaching invoice to payment {payment_id} by user {current_user.id}")
     return await service.attach_invoice_to_payment(payment_id, invoice_data)
@@ -335,7 +631,8 @@ async def attach_invoice_to_payment(
 async def delete_payment(
     payment_id: int,
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> None:
     """Delete a payment.
 
@@ -346,6 +643,12 @@ async def delete_payment(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to delete payments",
         )
+    await ownership.authorize(
+        current_user,
+        "payment",
+        payment_id,
+        detail="Not authorized to delete this payment",
+    )
 
     logger.info(f"Deleting payment {payment_id} by user {current_user.id}")
     await service.delete_payment(payment_id)
@@ -353,23 +656,48 @@ async def delete_payment(
 
 @router.get(
     "/lease/{lease_id}",
-    response_model=list[PaymentResponse],
+    response_model=PaymentListView,
 )
 async def get_payments_by_lease(
     lease_id: int,
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    include_total: bool = Query(
+        False, description="Also return the total number of matching payments"
+    ),
+    view: PaymentView = Query(
+        PaymentView.FULL, description="full payments or compact table rows"
+    ),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
-) -> list[PaymentResponse]:
-    """Get all payments for a specific lease.
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
+) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+    """Get payments for a specific lease.
 
-    Tenants can only access payments for their own leases.
+    Tenants can only access payments for their own leases and owners only
+    payments for leases on their properties.
     """
-    payments = await service.get_payments_by_lease(lease_id)
+    if current_user.role != EnumUserRoles.TENANT:
+        await ownership.authorize(
+            current_user,
+            "lease",
+            lease_id,
+            detail="Not authorized to view payments for this lease",
+        )
+    payments = await service.get_payments_by_lease(
+        lease_id, limit=limit, cursor=cursor, include_total=include_total, view=view
+    )
 
     # Check if tenant is trying to access payments for someone else's lease
     if current_user.role == EnumUserRoles.TENANT:
-        for payment in payments:
-            if payment.lease and payment.lease.tenant_id != current_user.id:
+        for payment in payments.payments:
+            if view == PaymentView.COMPACT:
+                tenant_id = payment.tenant_id
+            else:
+                tenant_id = payment.lease.tenant_id if payment.lease else None
+            if tenant_id is not None and tenant_id != current_user.id:
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="Not authorized to view payments for this lease",
@@ -381,14 +709,25 @@ async def get_payments_by_lease(
 
 @router.get(
     "/tenant/{tenant_id}",
-    response_model=list[PaymentResponse],
+    response_model=PaymentListView,
 )
 async def get_payments_by_tenant(
     tenant_id: int,
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    include_total: bool = Query(
+        False, description="Also return the total number of matching payments"
+    ),
+    view: PaymentView = Query(
+        PaymentView.FULL, description="full payments or compact table rows"
+    ),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
-) -> list[PaymentResponse]:
-    """Get all payments for a specific tenant.
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
+) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+    """Get payments for a specific tenant.
 
     Tenants can only access their own payments.
     Requires: ADMIN, OWNER role or tenant accessing own payments
@@ -410,9 +749,18 @@ async def get_payments_by_tenant(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to view tenant payments",
         )
+    if current_user.role != EnumUserRoles.TENANT:
+        await ownership.authorize(
+            current_user,
+            "tenant",
+            tenant_id,
+            detail="Not authorized to view payments for this tenant",
+        )
 
     logger.info(f"Getting payments for tenant {tenant_id} by user {current_user.id}")
-    return await service.get_payments_by_tenant(tenant_id)
+    return await service.get_payments_by_tenant(
+        tenant_id, limit=limit, cursor=cursor, include_total=include_total, view=view
+    )
 
 
 @router.post(
@@ -422,13 +770,26 @@ async def get_payments_by_tenant(
 )
 async def create_recurring_payments(
     recurring_data: RecurringPaymentCreate,
+    response: Response,
+    dry_run: bool = Query(
+        False, description="Only compute and return the schedule, write nothing"
+    ),
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        max_length=255,
+        description="Retries with the same key replay the first response",
+    ),
     service: PaymentService = Depends(get_payment_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    idempotency: IdempotencyService = Depends(get_idempotency_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> RecurringPaymentResponse:
     """Create recurring payments for a lease.
 
     Creates multiple payments based on frequency (monthly, quarterly, yearly)
-    and distributes the total amount across the lease duration.
+    and distributes the total amount across the lease duration. With
+    dry_run=true the computed schedule is returned without creating anything.
 
     Requires: ADMIN, OWNER, or OWNER role
     """
@@ -441,14 +802,32 @@ async def create_recurring_payments(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to create recurring payments",
         )
+    await ownership.authorize(
+        current_user,
+        "lease",
+        recurring_data.lease_id,
+        detail="Not authorized to create payments for this lease",
+    )
 
     logger.info(
         f"Creating recurring payments for lease {recurring_data.lease_id} "
         f"by user {current_user.id}"
     )
 
+    if dry_run:
+        response.status_code = status.HTTP_200_OK
+
     try:
-        return await service.create_recurring_payments(recurring_data)
+        return await idempotency.run(
+            idempotency_key,
+            current_user.id,
+            "create_recurring_payments",
+            {"payment": recurring_data, "dry_run": dry_run},
+            lambda: service.create_recurring_payments(recurring_data, dry_run=dry_run),
+            status_code=response.status_code or status.HTTP_201_CREATED,
+        )
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,222 @@
+"""Vectorized payment schedule engine.
+
+Computes due dates and amounts for many leases at once using NumPy
+``datetime64[M]`` month arithmetic instead of stepping through dates one at a
+time. Every input row (usually a lease) produces zero or more payments:
+
+- due dates fall on ``due_day`` every ``frequency_months`` months, clamped to
+  the last day of shorter months, starting with the first due date on or after
+  the start date and ending with the last one on or before the end date;
+- with ``prorate`` enabled, the stub between the start date and the first due
+  date is billed as an extra payment due on the start date, and the last
+  payment is reduced when the end date cuts its period short;
+- amounts are either a fixed amount per full period (``period_amounts``) or a
+  total split across the payments (``total_amounts``), in whole cents, with
+  the rounding remainder handed out one cent at a time so the payments always
+  add up to the total exactly.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from api.src.payments.schemas import PaymentFrequency
+
+FREQUENCY_MONTHS = {
+    PaymentFrequency.MONTHLY: 1,
+    PaymentFrequency.QUARTERLY: 3,
+    PaymentFrequency.YEARLY: 12,
+}
+
+ArrayLike = Union[Sequence, np.ndarray]
+
+
+@dataclass(frozen=True)
+class PaymentSchedule:
+    """Flat schedule for many rows, sorted by row and due date."""
+
+    rows: np.ndarray  # index of the input row each payment belongs to
+    due_dates: np.ndarray  # datetime64[D]
+    amount_cents: np.ndarray  # int64
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """Payment amounts in currency units."""
+        return self.amount_cents / 100
+
+    def to_list(self) -> list[tuple[int, date, float]]:
+        """Return the schedule as (row, due date, amount) tuples."""
+        return list(
+            zip(
+                self.rows.tolist(),
+                self.due_dates.astype(object).tolist(),
+                self.amounts.tolist(),
+            )
+        )
+
+
+def _due_dates(months: np.ndarray, due_days: np.ndarray) -> np.ndarray:
+    """Return ``due_days`` of ``months``, clamped to each month's last day."""
+    month_start = months.astype("datetime64[D]")
+    month_length = (
+        (months + np.timedelta64(1, "M")).astype("datetime64[D]") - month_start
+    ).astype(np.int64)
+    offset = np.minimum(due_days, month_length) - 1
+    return month_start + offset.astype("timedelta64[D]")
+
+
+def compute_schedules(
+    start_dates: ArrayLike,
+    end_dates: ArrayLike,
+    due_days: ArrayLike,
+    frequency_months: Union[int, ArrayLike] = 1,
+    period_amounts: Optional[ArrayLike] = None,
+    total_amounts: Optional[ArrayLike] = None,
+    prorate: bool = False,
+) -> PaymentSchedule:
+    """Compute payment schedules for many rows at once.
+
+    Args:
+        start_dates (ArrayLike): First day covered by each schedule
+        end_dates (ArrayLike): Last day covered by each schedule (inclusive)
+        due_days (ArrayLike): Day of month payments are due (1-31)
+        frequency_months (Union[int, ArrayLike]): Months between payments
+        period_amounts (Optional[ArrayLike]): Amount charged per full period
+        total_amounts (Optional[ArrayLike]): Total split across all payments
+        prorate (bool): Prorate the first and last partial periods
+
+    Returns:
+        PaymentSchedule: Flat schedule for all rows
+
+    Raises:
+        ValueError: If not exactly one of period_amounts and total_amounts is given
+    """
+    if (period_amounts is None) == (total_amounts is None):
+        raise ValueError("Pass exactly one of period_amounts or total_amounts")
+
+    start = np.asarray(start_dates, dtype="datetime64[D]")
+    end = np.asarray(end_dates, dtype="datetime64[D]")
+    due_day = np.asarray(due_days, dtype=np.int64)
+    step = np.broadcast_to(np.asarray(frequency_months, dtype=np.int64), start.shape)
+    one_day = np.timedelta64(1, "D")
+
+    # First due date on or after the start date
+    first_month = start.astype("datetime64[M]")
+    first_month = first_month + step * (_due_dates(first_month, due_day) < start)
+    first_due = _due_dates(first_month, due_day)
+
+    # Number of regular payments up to the end date
+    span = (end.astype("datetime64[M]") - first_month).astype(np.int64)
+    counts = np.where(span >= 0, span // step + 1, 0)
+    last_month = first_month + (counts - 1) * step
+    counts = counts - ((counts > 0) & (_due_dates(last_month, due_day) > end))
+    last_month = first_month + (counts - 1) * step
+
+    # Expand to one entry per regular payment
+    rows = np.repeat(np.arange(len(start)), counts)
+    period_index = np.arange(counts.sum()) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    months = first_month[rows] + period_index * step[rows]
+    due_dates = _due_dates(months, due_day[rows])
+    weights = np.ones(len(rows))
+
+    if prorate:
+        # Shorten the last period when the end date falls inside it
+        has_payments = counts > 0
+        last_index = (np.cumsum(counts) - 1)[has_payments]
+        last_due = due_dates[last_index]
+        period_end = _due_dates(
+            last_month[has_payments] + step[has_payments], due_day[has_payments]
+        )
+        covered = np.minimum(end[has_payments] + one_day, period_end) - last_due
+        weights[last_index] = covered / (period_end - last_due)
+
+        # Bill the stub between the start date and the first due date
+        previous_due = _due_dates(first_month - step, due_day)
+        stub_end = np.minimum(first_due, end + one_day)
+        stub = np.flatnonzero(stub_end > start)
+        stub_weights = (stub_end[stub] - start[stub]) / (
+            first_due[stub] - previous_due[stub]
+        )
+
+        rows = np.concatenate([stub, rows])
+        due_dates = np.concatenate([start[stub], due_dates])
+        weights = np.concatenate([stub_weights, weights])
+        order = np.lexsort((due_dates, rows))
+        rows, due_dates, weights = rows[order], due_dates[order], weights[order]
+
+    if period_amounts is not None:
+        period_cents = np.rint(np.asarray(period_amounts, dtype=np.float64) * 100)
+        amount_cents = np.rint(period_cents[rows] * weights).astype(np.int64)
+    else:
+        total_cents = np.rint(np.asarray(total_amounts, dtype=np.float64) * 100)
+        amount_cents = _split_cents(rows, weights, total_cents.astype(np.int64))
+
+    return PaymentSchedule(rows=rows, due_dates=due_dates, amount_cents=amount_cents)
+
+
+def _split_cents(
+    rows: np.ndarray, weights: np.ndarray, total_cents: np.ndarray
+) -> np.ndarray:
+    """Split each row's total across its payments by weight, exact to the cent.
+
+    Uses the largest remainder method: every payment gets the floor of its
+    share and the leftover cents go to the payments with the largest
+    fractional parts (the earliest ones on ties).
+    """
+    if len(rows) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    weight_sums = np.bincount(rows, weights=weights, minlength=len(total_cents))
+    shares = total_cents[rows] * weights / weight_sums[rows]
+    cents = np.floor(shares).astype(np.int64)
+    leftover = total_cents - np.bincount(
+        rows, weights=cents, minlength=len(total_cents)
+    ).astype(np.int64)
+
+    order = np.lexsort((-(shares - cents), rows))
+    row_starts = np.searchsorted(rows[order], rows[order], side="left")
+    rank = np.arange(len(order)) - row_starts
+    cents[order] += rank < leftover[rows[order]]
+    return cents
+
+
+def build_schedule(
+    start_date: date,
+    end_date: date,
+    frequency: PaymentFrequency,
+    due_day: int,
+    period_amount: Optional[float] = None,
+    total_amount: Optional[float] = None,
+    prorate: bool = False,
+) -> list[tuple[date, float]]:
+    """Compute a single schedule as (due date, amount) pairs.
+
+    Args:
+        start_date (date): First day covered by the schedule
+        end_date (date): Last day covered by the schedule (inclusive)
+        frequency (PaymentFrequency): Payment frequency
+        due_day (int): Day of month payments are due (1-31)
+        period_amount (Optional[float]): Amount charged per full period
+        total_amount (Optional[float]): Total split across all payments
+        prorate (bool): Prorate the first and last partial periods
+
+    Returns:
+        list[tuple[date, float]]: Due dates with their amounts
+    """
+    schedule = compute_schedules(
+        [start_date],
+        [end_date],
+        [due_day],
+        FREQUENCY_MONTHS[frequency],
+        period_amounts=None if period_amount is None else [period_amount],
+        total_amounts=None if total_amount is None else [total_amount],
+        prorate=prorate,
+    )
+    return [(due_date, amount) for _, due_date, amount in schedule.to_list()]
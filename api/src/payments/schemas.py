@@ -1,8 +1,8 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class PaymentFrequency(str, Enum):
@@ -13,6 +13,40 @@ class PaymentFrequency(str, Enum):
     YEARLY = "yearly"
 
 
+class PaymentStatus(str, Enum):
+    """Payment status derived from is_paid and due_date."""
+
+    PAID = "Paid"
+    PENDING = "Pending"
+    OVERDUE = "Overdue"
+
+
+class PaymentSort(str, Enum):
+    """Sort orders for payment lists; a leading '-' means descending."""
+
+    NEWEST = "-created_at"
+    OLDEST = "created_at"
+    DUE_DATE = "due_date"
+    DUE_DATE_DESC = "-due_date"
+    AMOUNT = "gross_value"
+    AMOUNT_DESC = "-gross_value"
+    STATUS = "status"
+
+
+class PaymentView(str, Enum):
+    """Shapes of payment list items."""
+
+    FULL = "full"
+    COMPACT = "compact"
+
+
+class ExportFormat(str, Enum):
+    """File formats for payment exports."""
+
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
 class PaymentBase(BaseModel):
     """Base payment schema with common fields."""
 
@@ -50,6 +84,10 @@ class RecurringPaymentCreate(BaseModel):
     description: Optional[str] = Field(
         None, description="Optional payment description"
     )
+    prorate: bool = Field(
+        False,
+        description="Prorate partial first and last periods instead of skipping them",
+    )
 
     @field_validator("due_day")
     @classmethod
@@ -59,6 +97,13 @@ class RecurringPaymentCreate(BaseModel):
         return v
 
 
+class ScheduledPayment(BaseModel):
+    """A single computed entry of a recurring payment schedule."""
+
+    due_date: date
+    gross_value: float
+
+
 class RecurringPaymentResponse(BaseModel):
     """Response schema for recurring payment creation."""
 
@@ -68,6 +113,10 @@ class RecurringPaymentResponse(BaseModel):
     frequency: PaymentFrequency
     due_day: int
     payments: list[int]  # List of created payment IDs
+    dry_run: bool = False
+    schedule: list[ScheduledPayment] = Field(
+        default_factory=list, description="Computed due dates and amounts"
+    )
 
 
 class PaymentUpdate(BaseModel):
@@ -82,6 +131,64 @@ class PaymentUpdate(BaseModel):
     is_paid: Optional[bool] = None
 
 
+class BulkPaymentAction(str, Enum):
+    """Operations supported by the bulk payment endpoint."""
+
+    MARK_PAID = "mark_paid"
+    MARK_UNPAID = "mark_unpaid"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class BulkPaymentOperation(BaseModel):
+    """A single operation applied to a set of payments."""
+
+    action: BulkPaymentAction = Field(..., description="Operation to apply")
+    payment_ids: list[int] = Field(
+        ..., min_length=1, description="Payments to apply the operation to"
+    )
+    data: Optional[PaymentUpdate] = Field(
+        None, description="Fields to set, required for the update action"
+    )
+
+    @model_validator(mode="after")
+    def validate_data(self):
+        if self.action == BulkPaymentAction.UPDATE and not (
+            self.data and self.data.model_fields_set
+        ):
+            raise ValueError("The update action requires data")
+        return self
+
+
+class BulkPaymentRequest(BaseModel):
+    """Schema for applying several payment operations in one transaction."""
+
+    operations: list[BulkPaymentOperation] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def validate_size(self):
+        if sum(len(operation.payment_ids) for operation in self.operations) > 1000:
+            raise ValueError("At most 1000 payments can be changed per request")
+        return self
+
+
+class BulkPaymentItemResult(BaseModel):
+    """Outcome of a bulk operation for a single payment."""
+
+    payment_id: int
+    action: BulkPaymentAction
+    success: bool
+    error: Optional[str] = None
+
+
+class BulkPaymentResponse(BaseModel):
+    """Schema for bulk payment operation results."""
+
+    succeeded: int
+    failed: int
+    results: list[BulkPaymentItemResult]
+
+
 class PaymentStatusUpdate(BaseModel):
     """Schema for updating payment status only."""
 
@@ -171,11 +278,131 @@ class PaymentResponse(PaymentBase):
         return value
 
 
+class PaymentStatistics(BaseModel):
+    """Schema for payment statistics (counts and amounts by status)."""
+
+    total_payments: int
+    paid_count: int
+    pending_count: int
+    overdue_count: int
+    total_amount: float
+    paid_amount: float
+    pending_amount: float
+    overdue_amount: float
+    as_of_date: date
+
+
+class LedgerEntry(BaseModel):
+    """A payment as ledger entry with the running balance after it."""
+
+    id: int
+    due_date: date
+    document_type: str
+    description: Optional[str] = None
+    lease_id: Optional[int] = None
+    status: str
+    charge: float
+    payment: float = Field(..., description="Amount paid, 0 while unpaid")
+    balance: float = Field(..., description="Outstanding balance after this entry")
+
+
+class LedgerResponse(BaseModel):
+    """Schema for keyset paginated ledgers."""
+
+    entries: list[LedgerEntry]
+    size: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+    total: Optional[int] = Field(
+        None, description="Total matching entries, only when include_total is set"
+    )
+
+
+class AgingBuckets(BaseModel):
+    """Overdue amounts by days past due date."""
+
+    days_0_30: float = 0
+    days_31_60: float = 0
+    days_61_90: float = 0
+    days_over_90: float = 0
+    total_amount: float = 0
+    overdue_count: int = 0
+
+
+class PropertyAging(AgingBuckets):
+    """Aging buckets of a single property."""
+
+    property_id: Optional[int]
+    property_title: Optional[str]
+
+
+class TenantAging(AgingBuckets):
+    """Aging buckets of a single tenant."""
+
+    tenant_id: Optional[int]
+    tenant_name: Optional[str]
+
+
+class PaymentAgingReport(BaseModel):
+    """Receivables aging report of overdue payments."""
+
+    as_of_date: date
+    totals: AgingBuckets
+    properties: list[PropertyAging]
+    tenants: list[TenantAging]
+
+
 class PaymentListResponse(BaseModel):
-    """Schema for paginated payment list responses."""
+    """Schema for keyset paginated payment list responses."""
 
+    view: Literal["full"] = "full"
     payments: list[PaymentResponse]
-    total: int
-    page: int
     size: int
-    pages: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+    total: Optional[int] = Field(
+        None, description="Total matching payments, only when include_total is set"
+    )
+
+
+class PaymentCompactResponse(BaseModel):
+    """Flat payment row with only the columns shown in payment tables."""
+
+    id: int
+    document_type: str
+    gross_value: float
+    due_date: date
+    receiver: str
+    is_paid: bool
+    status: str
+    created_at: datetime
+    lease_id: Optional[int] = None
+    tenant_id: Optional[int] = None
+    tenant_name: Optional[str] = None
+    unit_name: Optional[str] = None
+    property_title: Optional[str] = None
+    invoice_file_id: Optional[int] = None
+    invoice_filename: Optional[str] = None
+
+
+class PaymentCompactListResponse(BaseModel):
+    """Schema for keyset paginated compact payment list responses."""
+
+    view: Literal["compact"] = "compact"
+    payments: list[PaymentCompactResponse]
+    size: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
+    total: Optional[int] = Field(
+        None, description="Total matching payments, only when include_total is set"
+    )
+
+
+# Response of list endpoints taking a ``view`` parameter
+PaymentListView = Annotated[
+    Union[PaymentListResponse, PaymentCompactListResponse],
+    Field(discriminator="view"),
+]
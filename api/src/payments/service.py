@@ -1,20 +1,52 @@
 from datetime import date
-from typing import Optional
+from typing import AsyncIterator, Optional, Union
 
-from dateutil.relativedelta import relativedelta
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.core.exceptions import BusinessRuleViolationException
+from api.core.logging import get_logger
+from api.src.leases.models import Lease
 from api.src.leases.repository import LeaseRepository
-from api.src.payments.repository import PaymentRepository
+from api.src.ownership.service import invalidate_ownership
+from api.src.payments.export import stream_csv, stream_xlsx
+from api.src.payments.repository import EXPORT_COLUMNS, PaymentRepository
+from api.src.payments.schedule import build_schedule
 from api.src.payments.schemas import (
+    AgingBuckets,
+    BulkPaymentAction,
+    BulkPaymentItemResult,
+    BulkPaymentOperation,
+    BulkPaymentRequest,
+    BulkPaymentResponse,
+    ExportFormat,
+    LedgerEntry,
+    LedgerResponse,
+    PaymentAgingReport,
+    PaymentCompactListResponse,
+    PaymentCompactResponse,
     PaymentCreate,
-    PaymentFrequency,
     PaymentInvoiceUpdate,
+    PaymentListResponse,
     PaymentResponse,
+    PaymentSort,
+    PaymentStatistics,
+    PaymentStatus,
     PaymentUpdate,
+    PaymentView,
+    PropertyAging,
     RecurringPaymentCreate,
     RecurringPaymentResponse,
+    ScheduledPayment,
+    TenantAging,
 )
+from api.src.utils.cache import TTLCache
+from api.src.utils.pagination import Page
+
+logger = get_logger(__name__)
+
+# Aging reports per owner, validated against the owner's summaries
+AGING_CACHE: TTLCache[int, tuple] = TTLCache(maxsize=1024, ttl=300)
 
 
 class PaymentService:
@@ -53,76 +85,181 @@ class PaymentService:
         payment = await self.repository.get_by_id(payment_id)
         return PaymentResponse.model_validate(payment)
 
-    async def get_all_payments(
-        self, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> list[PaymentResponse]:
-        """Get all payments.
+    async def get_payments(
+        self,
+        owner_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        lease_id: Optional[int] = None,
+        is_paid: Optional[bool] = None,
+        status: Optional[PaymentStatus] = None,
+        search: Optional[str] = None,
+        sort: PaymentSort = PaymentSort.NEWEST,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        view: PaymentView = PaymentView.FULL,
+    ) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+        """Get payments matching all given filters in the requested order.
 
         Args:
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            tenant_id (Optional[int]): Restrict to leases of this tenant
+            lease_id (Optional[int]): Restrict to a single lease
+            is_paid (Optional[bool]): Filter by paid flag
+            status (Optional[PaymentStatus]): Filter by Paid, Pending or Overdue
+            search (Optional[str]): Search receiver, description and document type
+            sort (PaymentSort): Sort order
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            view (PaymentView): Full payments or compact rows
 
         Returns:
-            list[PaymentResponse]: List of payment responses
+            Union[PaymentListResponse, PaymentCompactListResponse]: Page of payment responses
         """
-        payments = await self.repository.get_all(limit=limit, offset=offset)
-        return [PaymentResponse.model_validate(payment) for payment in payments]
+        page = await self.repository.get_filtered(
+            owner_id=owner_id,
+            tenant_id=tenant_id,
+            lease_id=lease_id,
+            is_paid=is_paid,
+            status=status,
+            search=search,
+            sort=sort,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            compact=view == PaymentView.COMPACT,
+        )
+        return self._to_list_response(page, view)
 
-    async def get_payments_by_lease(self, lease_id: int) -> list[PaymentResponse]:
-        """Get all payments for a specific lease.
+    def export_payments(
+        self,
+        export_format: ExportFormat,
+        owner_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        lease_id: Optional[int] = None,
+        is_paid: Optional[bool] = None,
+        status: Optional[PaymentStatus] = None,
+        search: Optional[str] = None,
+        sort: PaymentSort = PaymentSort.NEWEST,
+    ) -> AsyncIterator[bytes]:
+        """Export all payments matching the filters as a CSV or XLSX file.
+
+        The session must stay open until the returned iterator is exhausted.
 
         Args:
-            lease_id (int): Lease ID
+            export_format (ExportFormat): File format to encode
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            tenant_id (Optional[int]): Restrict to leases of this tenant
+            lease_id (Optional[int]): Restrict to a single lease
+            is_paid (Optional[bool]): Filter by paid flag
+            status (Optional[PaymentStatus]): Filter by Paid, Pending or Overdue
+            search (Optional[str]): Search receiver, description and document type
+            sort (PaymentSort): Sort order
 
         Returns:
-            list[PaymentResponse]: List of payment responses for the lease
+            AsyncIterator[bytes]: Encoded file chunks
         """
-        payments = await self.repository.get_by_lease_id(lease_id)
-        return [PaymentResponse.model_validate(payment) for payment in payments]
+        rows = self.repository.stream_export_rows(
+            owner_id=owner_id,
+            tenant_id=tenant_id,
+            lease_id=lease_id,
+            is_paid=is_paid,
+            status=status,
+            search=search,
+            sort=sort,
+        )
+        headers = [header for header, _ in EXPORT_COLUMNS]
+        if export_format == ExportFormat.XLSX:
+            return stream_xlsx(headers, rows)
+        return stream_csv(headers, rows)
 
-    async def get_payments_by_tenant(self, tenant_id: int) -> list[PaymentResponse]:
-        """Get all payments for a specific tenant.
+    async def get_payments_by_lease(
+        self,
+        lease_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        view: PaymentView = PaymentView.FULL,
+    ) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+        """Get payments for a specific lease.
 
         Args:
-            tenant_id (int): Tenant ID
+            lease_id (int): Lease ID
+            limit (Optional[int]): Maximum number of results
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            view (PaymentView): Full payments or compact rows
 
         Returns:
-            list[PaymentResponse]: List of payment responses for the tenant
+            Union[PaymentListResponse, PaymentCompactListResponse]: Page of payment responses for the lease
         """
-        payments = await self.repository.get_by_tenant_id(tenant_id)
-        return [PaymentResponse.model_validate(payment) for payment in payments]
+        page = await self.repository.get_by_lease_id(
+            lease_id,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            compact=view == PaymentView.COMPACT,
+        )
+        return self._to_list_response(page, view)
 
-    async def get_payments_by_status(
-        self, is_paid: bool, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> list[PaymentResponse]:
-        """Get payments by payment status.
+    async def get_payments_by_tenant(
+        self,
+        tenant_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        view: PaymentView = PaymentView.FULL,
+    ) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+        """Get payments for a specific tenant.
 
         Args:
-            is_paid (bool): Payment status
+            tenant_id (int): Tenant ID
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            view (PaymentView): Full payments or compact rows
 
         Returns:
-            list[PaymentResponse]: List of payment responses with specified status
+            Union[PaymentListResponse, PaymentCompactListResponse]: Page of payment responses for the tenant
         """
-        payments = await self.repository.get_by_status(
-            is_paid, limit=limit, offset=offset
+        page = await self.repository.get_by_tenant_id(
+            tenant_id,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            compact=view == PaymentView.COMPACT,
         )
-        return [PaymentResponse.model_validate(payment) for payment in payments]
+        return self._to_list_response(page, view)
 
     async def get_overdue_payments(
-        self, as_of_date: Optional[date] = None
-    ) -> list[PaymentResponse]:
+        self,
+        as_of_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        view: PaymentView = PaymentView.FULL,
+    ) -> Union[PaymentListResponse, PaymentCompactListResponse]:
         """Get overdue payments.
 
         Args:
             as_of_date (Optional[date]): Date to check against (defaults to today)
+            limit (Optional[int]): Maximum number of results
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            view (PaymentView): Full payments or compact rows
 
         Returns:
-            list[PaymentResponse]: List of overdue payment responses
+            Union[PaymentListResponse, PaymentCompactListResponse]: Page of overdue payment responses
         """
-        payments = await self.repository.get_overdue_payments(as_of_date)
-        return [PaymentResponse.model_validate(payment) for payment in payments]
+        page = await self.repository.get_overdue_payments(
+            as_of_date,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            compact=view == PaymentView.COMPACT,
+        )
+        return self._to_list_response(page, view)
 
     async def update_payment(
         self, payment_id: int, payment_data: PaymentUpdate
@@ -186,114 +323,312 @@ class PaymentService:
         """
         await self.repository.delete(payment_id)
 
-    async def get_payment_statistics(self) -> dict:
+    async def apply_bulk_operations(
+        self, request: BulkPaymentRequest, owner_id: Optional[int] = None
+    ) -> BulkPaymentResponse:
+        """Apply several payment operations in one transaction.
+
+        Every operation runs as one set-based statement inside its own
+        savepoint, so an operation that violates a constraint fails alone
+        while the others are still committed. Payments that do not exist, or
+        do not belong to ``owner_id``, are reported as failed items.
+
+        Args:
+            request (BulkPaymentRequest): Operations to apply
+            owner_id (Optional[int]): Restrict changes to payments of this owner
+
+        Returns:
+            BulkPaymentResponse: Per payment results
+        """
+        results = []
+        for operation in request.operations:
+            payment_ids = list(dict.fromkeys(operation.payment_ids))
+            error = "Payment not found"
+            try:
+                async with self.session.begin_nested():
+                    changed = await self._apply_bulk_operation(operation, owner_id)
+            except IntegrityError:
+                changed, error = set(), "Operation violates a database constraint"
+            except BusinessRuleViolationException as e:
+                changed, error = set(), e.detail
+
+            results.extend(
+                BulkPaymentItemResult(
+                    payment_id=payment_id,
+                    action=operation.action,
+                    success=payment_id in changed,
+                    error=None if payment_id in changed else error,
+                )
+                for payment_id in payment_ids
+            )
+
+        await self.session.commit()
+        if any(
+            operation.data and "lease_id" in operation.data.model_fields_set
+            for operation in request.operations
+        ):
+            invalidate_ownership()
+
+        succeeded = sum(result.success for result in results)
+        logger.info(
+            f"Bulk payment operations: {succeeded} succeeded, "
+            f"{len(results) - succeeded} failed"
+        )
+        return BulkPaymentResponse(
+            succeeded=succeeded, failed=len(results) - succeeded, results=results
+        )
+
+    async def _apply_bulk_operation(
+        self, operation: BulkPaymentOperation, owner_id: Optional[int]
+    ) -> set[int]:
+        """Apply a single bulk operation and return the IDs it changed."""
+        if operation.action == BulkPaymentAction.DELETE:
+            deleted = await self.repository.bulk_delete(
+                operation.payment_ids, owner_id=owner_id
+            )
+            return set(deleted)
+
+        if operation.action == BulkPaymentAction.MARK_PAID:
+            values = {"is_paid": True}
+        elif operation.action == BulkPaymentAction.MARK_UNPAID:
+            values = {"is_paid": False}
+        else:
+            values = operation.data.model_dump(exclude_unset=True)
+
+        if "lease_id" in values:
+            if values["lease_id"] is None and owner_id is not None:
+                raise BusinessRuleViolationException(
+                    "Payments of owners require a lease"
+                )
+            ownership = await self.repository.get_lease_ownership(
+                [values["lease_id"]] if values["lease_id"] is not None else []
+            )
+            property_id, lease_owner_id = ownership.get(
+                values["lease_id"], (None, None)
+            )
+            if values["lease_id"] is not None and (
+                values["lease_id"] not in ownership
+                or (owner_id is not None and lease_owner_id != owner_id)
+            ):
+                raise BusinessRuleViolationException("Lease not found")
+            values.update(property_id=property_id, owner_id=lease_owner_id)
+
+        updated = await self.repository.bulk_update(
+            operation.payment_ids, values, owner_id=owner_id
+        )
+        return set(updated)
+
+    async def get_payment_statistics(
+        self,
+        as_of_date: Optional[date] = None,
+        property_id: Optional[int] = None,
+    ) -> PaymentStatistics:
         """Get payment statistics.
 
+        Args:
+            as_of_date (Optional[date]): Date to check overdue against (defaults to today)
+            property_id (Optional[int]): Restrict statistics to a single property
+
         Returns:
-            dict: Dictionary with payment statistics
+            PaymentStatistics: Payment counts and amounts by status
         """
-        total_payments = await self.repository.count_total()
-        paid_payments = await self.repository.count_by_status(True)
-        unpaid_payments = await self.repository.count_by_status(False)
-        overdue_payments = await self.repository.get_overdue_payments()
-
-        return {
-            "total_payments": total_payments,
-            "paid_count": paid_payments,
-            "pending_count": unpaid_payments - len(overdue_payments),
-            "overdue_count": len(overdue_payments),
-        }
-
-    async def get_payment_statistics_for_owner(self, owner_id: int) -> dict:
+        statistics = await self.repository.get_statistics(
+            property_id=property_id, as_of_date=as_of_date
+        )
+        return PaymentStatistics(**statistics)
+
+    async def get_payment_statistics_for_owner(
+        self,
+        owner_id: int,
+        as_of_date: Optional[date] = None,
+        property_id: Optional[int] = None,
+    ) -> PaymentStatistics:
         """Get payment statistics for a specific owner.
 
+        Statistics as of today are read from the pre-aggregated payment
+        summaries; other dates, or summaries not yet aged to today, fall back
+        to aggregating the payments.
+
         Args:
             owner_id (int): Property owner ID
+            as_of_date (Optional[date]): Date to check overdue against (defaults to today)
+            property_id (Optional[int]): Restrict statistics to a single property
 
         Returns:
-            dict: Dictionary with payment statistics for the owner
+            PaymentStatistics: Payment counts and amounts by status for the owner
         """
-        total_payments = await self.repository.count_total_for_owner(owner_id)
-        paid_payments = await self.repository.count_by_status_for_owner(owner_id, True)
-        unpaid_payments = await self.repository.count_by_status_for_owner(
-            owner_id, False
-        )
-        overdue_payments = await self.repository.get_overdue_payments_by_owner(
-            owner_id
-        )
-
-        return {
-            "total_payments": total_payments,
-            "paid_count": paid_payments,
-            "pending_count": unpaid_payments - len(overdue_payments),
-            "overdue_count": len(overdue_payments),
-        }
+        statistics = None
+        if as_of_date is None or as_of_date == date.today():
+            statistics = await self.repository.summaries.get_totals(
+                owner_id, property_id=property_id
+            )
+        if statistics is None:
+            statistics = await self.repository.get_statistics(
+                owner_id=owner_id, property_id=property_id, as_of_date=as_of_date
+            )
+        return PaymentStatistics(**statistics)
 
-    async def get_payments_for_owner(
-        self, owner_id: int, limit: Optional[int] = None, offset: Optional[int] = None
-    ) -> list[PaymentResponse]:
-        """Get all payments for properties owned by a specific owner.
+    async def get_overdue_payments_for_owner(
+        self,
+        owner_id: int,
+        as_of_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        view: PaymentView = PaymentView.FULL,
+    ) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+        """Get overdue payments for properties owned by a specific owner.
 
         Args:
             owner_id (int): Property owner ID
+            as_of_date (Optional[date]): Date to check against (defaults to today)
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching payments
+            view (PaymentView): Full payments or compact rows
 
         Returns:
-            list[PaymentResponse]: List of payment responses for the owner's properties
+            Union[PaymentListResponse, PaymentCompactListResponse]: Page of overdue payment responses for the owner's properties
         """
-        payments = await self.repository.get_by_property_owner(
-            owner_id, limit=limit, offset=offset
+        page = await self.repository.get_overdue_payments_by_owner(
+            owner_id,
+            as_of_date,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            compact=view == PaymentView.COMPACT,
         )
-        return [PaymentResponse.model_validate(payment) for payment in payments]
+        return self._to_list_response(page, view)
 
-    async def get_payments_for_owner_by_status(
+    async def get_ledger(
         self,
-        owner_id: int,
-        is_paid: bool,
+        lease_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        owner_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None,
-    ) -> list[PaymentResponse]:
-        """Get payments for an owner by payment status.
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> LedgerResponse:
+        """Get charges, payments and the running balance of a lease or tenant.
 
         Args:
-            owner_id (int): Property owner ID
-            is_paid (bool): Payment status
+            lease_id (Optional[int]): Restrict to a single lease
+            tenant_id (Optional[int]): Restrict to leases of this tenant
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+            start_date (Optional[date]): First due date to return
+            end_date (Optional[date]): Last due date to return
             limit (Optional[int]): Maximum number of results
-            offset (Optional[int]): Number of results to skip
+            cursor (Optional[str]): Cursor returned with the previous page
+            include_total (bool): Also count all matching entries
 
         Returns:
-            list[PaymentResponse]: List of payment responses for the owner's properties with specified status
+            LedgerResponse: Page of ledger entries, oldest due date first
+
+        Raises:
+            BusinessRuleViolationException: If start_date is after end_date
         """
-        payments = await self.repository.get_by_property_owner_and_status(
-            owner_id, is_paid, limit=limit, offset=offset
+        if start_date and end_date and start_date > end_date:
+            raise BusinessRuleViolationException(
+                "start_date must not be after end_date"
+            )
+
+        page = await self.repository.get_ledger(
+            lease_id=lease_id,
+            tenant_id=tenant_id,
+            owner_id=owner_id,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        return LedgerResponse(
+            entries=[LedgerEntry.model_validate(row._mapping) for row in page.items],
+            size=len(page.items),
+            next_cursor=page.next_cursor,
+            total=page.total,
         )
-        return [PaymentResponse.model_validate(payment) for payment in payments]
 
-    async def get_overdue_payments_for_owner(
-        self, owner_id: int, as_of_date: Optional[date] = None
-    ) -> list[PaymentResponse]:
-        """Get overdue payments for properties owned by a specific owner.
+    async def get_aging_report(
+        self, owner_id: Optional[int] = None
+    ) -> PaymentAgingReport:
+        """Get the receivables aging report per property and tenant.
+
+        Reports are cached per owner. A cached report is reused only while
+        the owner's payment summaries are unchanged and it is from today, so
+        marking a payment paid or moving its due date invalidates it on every
+        worker. The report of all owners is not cached: it includes payments
+        without a lease, which have no summary to version them.
 
         Args:
-            owner_id (int): Property owner ID
-            as_of_date (Optional[date]): Date to check against (defaults to today)
+            owner_id (Optional[int]): Restrict to properties owned by this owner
 
         Returns:
-            list[PaymentResponse]: List of overdue payment responses for the owner's properties
+            PaymentAgingReport: Overdue amounts bucketed by days past due
         """
-        payments = await self.repository.get_overdue_payments_by_owner(
-            owner_id, as_of_date
+        today = date.today()
+        if owner_id is not None:
+            version = (
+                today,
+                await self.repository.summaries.get_version(owner_id=owner_id),
+            )
+            cached = AGING_CACHE.get(owner_id)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+        totals = AgingBuckets()
+        properties, tenants = [], []
+        for row in await self.repository.get_aging(owner_id, as_of_date=today):
+            if row.level == "property":
+                properties.append(PropertyAging.model_validate(row._mapping))
+            elif row.level == "tenant":
+                tenants.append(TenantAging.model_validate(row._mapping))
+            else:
+                totals = AgingBuckets.model_validate(row._mapping)
+
+        report = PaymentAgingReport(
+            as_of_date=today, totals=totals, properties=properties, tenants=tenants
+        )
+        if owner_id is not None:
+            AGING_CACHE.set(owner_id, (version, report))
+        return report
+
+    def _to_list_response(
+        self, page: Page, view: PaymentView = PaymentView.FULL
+    ) -> Union[PaymentListResponse, PaymentCompactListResponse]:
+        """Convert a page of payments or compact rows into a list response."""
+        if view == PaymentView.COMPACT:
+            return PaymentCompactListResponse(
+                payments=[
+                    PaymentCompactResponse.model_validate(row._mapping)
+                    for row in page.items
+                ],
+                size=len(page.items),
+                next_cursor=page.next_cursor,
+                total=page.total,
+            )
+        return PaymentListResponse(
+            payments=[
+                PaymentResponse.model_validate(payment) for payment in page.items
+            ],
+            size=len(page.items),
+            next_cursor=page.next_cursor,
+            total=page.total,
         )
-        return [PaymentResponse.model_validate(payment) for payment in payments]
 
     async def create_recurring_payments(
-        self, recurring_data: RecurringPaymentCreate
+        self, recurring_data: RecurringPaymentCreate, dry_run: bool = False
     ) -> RecurringPaymentResponse:
         """Create recurring payments for a lease based on frequency and duration.
 
+        The whole schedule is computed up front and written with a single
+        bulk insert in one transaction.
+
         Args:
             recurring_data (RecurringPaymentCreate): Recurring payment creation data
+            dry_run (bool): Only compute and return the schedule without writing it
 
         Returns:
             RecurringPaymentResponse: Response with created payment details
@@ -308,44 +643,11 @@ class PaymentService:
         if not lease.is_active:
             raise ValueError("Cannot create payments for inactive lease")
 
-        # Calculate payment schedule
-        start_date = lease.start_date
-        end_date = lease.end_date or date.today().replace(year=date.today().year + 1)
-
-        payment_dates = self._calculate_payment_dates(
-            start_date, end_date, recurring_data.frequency, recurring_data.due_day
-        )
-
-        # Calculate amount per payment
-        amount_per_payment = self._calculate_payment_amount(
-            recurring_data.amount, len(payment_dates), recurring_data.frequency
+        schedule = self._build_recurring_schedule(lease, recurring_data)
+        created_payments = (
+            [] if dry_run else await self.repository.bulk_create(schedule)
         )
 
-        # Create payments
-        created_payments = []
-        for i, payment_date in enumerate(payment_dates):
-            # For the last payment, adjust amount to handle any remainder from division
-            if i == len(payment_dates) - 1:
-                remaining_amount = recurring_data.amount - (
-                    amount_per_payment * (len(payment_dates) - 1)
-                )
-                current_amount = remaining_amount
-            else:
-                current_amount = amount_per_payment
-
-            payment_data = PaymentCreate(
-                document_type=recurring_data.document_type,
-                gross_value=current_amount,
-                due_date=payment_date,
-                receiver=f"{lease.user.first_name} {lease.user.last_name}",
-                description=recurring_data.description
-                or f"{recurring_data.frequency.value.title()} payment",
-                lease_id=recurring_data.lease_id,
-            )
-
-            payment = await self.repository.create(payment_data)
-            created_payments.append(payment.id)
-
         return RecurringPaymentResponse(
             lease_id=recurring_data.lease_id,
             payments_created=len(created_payments),
@@ -353,80 +655,40 @@ class PaymentService:
             frequency=recurring_data.frequency,
             due_day=recurring_data.due_day,
             payments=created_payments,
+            dry_run=dry_run,
+            schedule=[
+                ScheduledPayment(
+                    due_date=payment.due_date, gross_value=payment.gross_value
+                )
+                for payment in schedule
+            ],
         )
 
-    def _calculate_payment_dates(
-        self,
-        start_date: date,
-        end_date: date,
-        frequency: PaymentFrequency,
-        due_day: int,
-    ) -> list[date]:
-        """Calculate payment due dates based on frequency and lease duration."""
-        payment_dates = []
-
-        # Calculate the first payment date
-        current_date = start_date.replace(
-            day=min(due_day, 28)
-        )  # Safe day to avoid month overflow
-
-        # Adjust first payment to the due day
-        if current_date.day != due_day:
-            # Try to set the exact due day, but handle month overflow
-            try:
-                current_date = current_date.replace(day=due_day)
-            except ValueError:
-                # If due_day doesn't exist in current month (e.g., day 31 in February),
-                # use the last day of the month
-                next_month = current_date.replace(day=28) + relativedelta(days=4)
-                current_date = (
-                    next_month - relativedelta(days=next_month.day)
-                ).replace(
-                    day=min(
-                        due_day, (next_month - relativedelta(days=next_month.day)).day
-                    )
-                )
+    def _build_recurring_schedule(
+        self, lease: Lease, recurring_data: RecurringPaymentCreate
+    ) -> list[PaymentCreate]:
+        """Compute the payments to create for a lease without touching the DB."""
+        start_date = lease.start_date
+        end_date = lease.end_date or date.today().replace(year=date.today().year + 1)
 
-        # If the first payment date is before the start date, move to next period
-        if current_date < start_date:
-            if frequency == PaymentFrequency.MONTHLY:
-                current_date += relativedelta(months=1)
-            elif frequency == PaymentFrequency.QUARTERLY:
-                current_date += relativedelta(months=3)
-            elif frequency == PaymentFrequency.YEARLY:
-                current_date += relativedelta(years=1)
-
-        # Generate payment dates until end of lease
-        while current_date <= end_date:
-            payment_dates.append(current_date)
-
-            if frequency == PaymentFrequency.MONTHLY:
-                current_date += relativedelta(months=1)
-            elif frequency == PaymentFrequency.QUARTERLY:
-                current_date += relativedelta(months=3)
-            elif frequency == PaymentFrequency.YEARLY:
-                current_date += relativedelta(years=1)
-
-            # Handle day overflow for next month
-            try:
-                current_date = current_date.replace(day=due_day)
-            except ValueError:
-                # Use last day of month if due_day doesn't exist
-                next_month = current_date.replace(day=28) + relativedelta(days=4)
-                last_day = (next_month - relativedelta(days=next_month.day)).day
-                current_date = current_date.replace(day=min(due_day, last_day))
-
-        return payment_dates
-
-    def _calculate_payment_amount(
-        self, total_amount: float, num_payments: int, frequency: PaymentFrequency
-    ) -> float:
-        """Calculate the amount per payment, handling division remainders."""
-        if num_payments == 0:
-            return 0.0
-
-        # For most payments, use the divided amount
-        base_amount = total_amount / num_payments
-
-        # Round to 2 decimal places to handle currency
-        return round(base_amount, 2)
+        schedule = build_schedule(
+            start_date,
+            end_date,
+            recurring_data.frequency,
+            recurring_data.due_day,
+            total_amount=recurring_data.amount,
+            prorate=recurring_data.prorate,
+        )
+
+        return [
+            PaymentCreate(
+                document_type=recurring_data.document_type,
+                gross_value=amount,
+                due_date=due_date,
+                receiver=f"{lease.user.first_name} {lease.user.last_name}",
+                description=recurring_data.description
+                or f"{recurring_data.frequency.value.title()} payment",
+                lease_id=recurring_data.lease_id,
+            )
+            for due_date, amount in schedule
+        ]
@@ -14,7 +14,7 @@ class Property(Base):
     address = Column(String)
     price = Column(Float)
 
-    owner_id = Column(Integer, ForeignKey("users.id"))
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
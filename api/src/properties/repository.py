@@ -8,6 +8,8 @@ from api.core.exceptions import (
     ConflictException,
     NotFoundException,
 )
+from api.src.ownership.service import invalidate_ownership
+from api.src.payments.repository import PaymentRepository
 from api.src.properties.models import Property
 from api.src.properties.schemas import PropertyCreate
 from api.src.units.models import Unit
@@ -117,7 +119,14 @@ class PropertyRepository:
         if not result.rowcount:
             raise NotFoundException(f"Property with id {property_id} not found")
 
+        if "owner_id" in update_data:
+            await PaymentRepository(self.session).sync_ownership(
+                property_ids=[property_id]
+            )
+
         await self.session.commit()
+        if "owner_id" in update_data:
+            invalidate_ownership()
         return await self.get_by_id(property_id)
 
     async def delete(
@@ -150,6 +159,8 @@ class PropertyRepository:
             )
 
         # If no active leases, proceed with deletion
+        await PaymentRepository(self.session).clear_ownership(property_id=property_id)
         query = delete(Property).where(Property.id == property_id)
         await self.session.execute(query)
         await self.session.commit()
+        invalidate_ownership()
@@ -3,11 +3,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.ownership.service import OwnershipService, get_ownership_service
 from api.src.properties.schemas import PropertyBase, PropertyResponse, PropertyUpdate
 from api.src.properties.service import PropertyService
-from api.src.users.models import User
 from api.src.utils.access_verify import is_owner_or_admin
 
 logger = get_logger(__name__)
@@ -26,7 +26,7 @@ def get_property_service(
 )
 async def get_all_properties(
     service: PropertyService = Depends(get_property_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[PropertyResponse]:
     properties = []
     if current_user.role == EnumUserRoles.ADMIN:
@@ -42,7 +42,7 @@ async def get_all_properties(
 )
 async def get_owner_properties(
     service: PropertyService = Depends(get_property_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[PropertyResponse]:
     is_owner_or_admin(current_user)
 
@@ -57,7 +57,7 @@ async def get_owner_properties(
 async def get_property(
     property_id: int,
     service: PropertyService = Depends(get_property_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> PropertyResponse:
     properties = await service.get_property(property_id)
     return properties
@@ -71,7 +71,7 @@ async def get_property(
 async def create_property(
     property_data: PropertyBase,
     service: PropertyService = Depends(get_property_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> PropertyResponse:
     property_create = property_data.model_copy(update={"owner_id": current_user.id})
     property_obj = await service.create_property(property_create)
@@ -86,8 +86,15 @@ async def update_property(
     property_id: int,
     property_data: PropertyUpdate,
     service: PropertyService = Depends(get_property_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> PropertyResponse:
+    await ownership.authorize(
+        current_user,
+        "property",
+        property_id,
+        detail="Not authorized to update this property",
+    )
     property_obj = await service.update_property(property_id, property_data)
     return property_obj
 
@@ -99,6 +106,13 @@ async def update_property(
 async def delete_property(
     property_id: int,
     service: PropertyService = Depends(get_property_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> None:
+    await ownership.authorize(
+        current_user,
+        "property",
+        property_id,
+        detail="Not authorized to delete this property",
+    )
     await service.delete_property(property_id)
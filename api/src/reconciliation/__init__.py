@@ -0,0 +1 @@
+# Reconciliation module
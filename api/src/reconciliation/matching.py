@@ -0,0 +1,125 @@
+"""Match bank statement transfers to open payments.
+
+Open payments are indexed in a dict keyed by amount in cents and normalized
+receiver name, so each transfer is matched with a single lookup instead of a
+scan over all open payments.
+"""
+
+import re
+import unicodedata
+from datetime import date
+from typing import Iterable, NamedTuple
+
+from api.src.reconciliation.statements import StatementLine
+
+# Candidates due within this many days of the booking date are preferred
+MATCH_WINDOW_DAYS = 10
+
+
+class OpenPayment(NamedTuple):
+    """The payment columns matching depends on."""
+
+    id: int
+    amount_cents: int
+    receiver: str
+    due_date: date
+
+
+class Reconciliation(NamedTuple):
+    """Outcome of matching a statement against open payments."""
+
+    matched: list[tuple[StatementLine, OpenPayment]]
+    ambiguous: list[tuple[StatementLine, list[OpenPayment]]]
+    unmatched: list[StatementLine]
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a person name for comparison.
+
+    Case, accents, punctuation and word order are ignored, so
+    ``"DOE, JOHN"`` and ``"John Doe"`` compare equal.
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    ascii_name = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return " ".join(sorted(re.findall(r"[a-z0-9]+", ascii_name)))
+
+
+def build_index(
+    payments: Iterable[OpenPayment],
+) -> dict[tuple[int, str], list[OpenPayment]]:
+    """Index open payments by amount and normalized receiver.
+
+    Args:
+        payments (Iterable[OpenPayment]): Open payments
+
+    Returns:
+        dict[tuple[int, str], list[OpenPayment]]: Payments per key, oldest
+            due date first
+    """
+    index: dict[tuple[int, str], list[OpenPayment]] = {}
+    for payment in payments:
+        key = (payment.amount_cents, normalize_name(payment.receiver))
+        index.setdefault(key, []).append(payment)
+    for candidates in index.values():
+        candidates.sort(key=lambda payment: (payment.due_date, payment.id))
+    return index
+
+
+def _pick(line: StatementLine, candidates: list[OpenPayment]) -> list[OpenPayment]:
+    """Narrow down candidates using the reference text and due date."""
+    if len(candidates) == 1:
+        return candidates
+
+    numbers = set(re.findall(r"\d+", line.reference))
+    referenced = [payment for payment in candidates if str(payment.id) in numbers]
+    if referenced:
+        return referenced
+
+    due_soon = [
+        payment
+        for payment in candidates
+        if abs((payment.due_date - line.booking_date).days) <= MATCH_WINDOW_DAYS
+    ]
+    return due_soon or candidates
+
+
+def match_lines(
+    lines: Iterable[StatementLine], payments: Iterable[OpenPayment]
+) -> Reconciliation:
+    """Match statement transfers to open payments.
+
+    A transfer matches the open payments with the same amount and receiver.
+    Several candidates are narrowed down to those whose ID appears in the
+    reference, otherwise to those due within ``MATCH_WINDOW_DAYS`` of the
+    booking date. A transfer is only matched when a single candidate is
+    left; each payment is matched at most once.
+
+    Args:
+        lines (Iterable[StatementLine]): Incoming transfers
+        payments (Iterable[OpenPayment]): Open payments
+
+    Returns:
+        Reconciliation: Matched, ambiguous and unmatched transfers
+    """
+    index = build_index(payments)
+    claimed: set[int] = set()
+    result = Reconciliation([], [], [])
+
+    for line in lines:
+        key = (line.amount_cents, normalize_name(line.counterparty))
+        candidates = [
+            payment for payment in index.get(key, ()) if payment.id not in claimed
+        ]
+        if not candidates:
+            result.unmatched.append(line)
+            continue
+
+        picked = _pick(line, candidates)
+        if len(picked) == 1:
+            claimed.add(picked[0].id)
+            result.matched.append((line, picked[0]))
+        else:
+            result.ambiguous.append((line, picked))
+    return result
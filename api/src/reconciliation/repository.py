@@ -0,0 +1,78 @@
+from typing import Optional
+
+from sqlalchemy import BigInteger, Numeric, any_, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.payments.models import Payment
+from api.src.payments.repository import PaymentRepository
+from api.src.reconciliation.matching import OpenPayment
+
+logger = get_logger(__name__)
+
+
+class ReconciliationRepository:
+    """Repository for bank statement reconciliation queries."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize ReconciliationRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.payments = PaymentRepository(session)
+
+    async def get_open_payments(
+        self, amounts_cents: set[int], owner_id: Optional[int] = None
+    ) -> list[OpenPayment]:
+        """Get unpaid payments whose amount appears on the statement.
+
+        Only the columns needed for matching are selected, no ORM objects are
+        built.
+
+        Args:
+            amounts_cents (set[int]): Transfer amounts in cents
+            owner_id (Optional[int]): Restrict to properties owned by this owner
+
+        Returns:
+            list[OpenPayment]: Candidate payments
+        """
+        if not amounts_cents:
+            return []
+
+        amount_cents = cast(
+            func.round(cast(Payment.gross_value, Numeric) * 100), BigInteger
+        ).label("amount_cents")
+        stmt = select(
+            Payment.id, amount_cents, Payment.receiver, Payment.due_date
+        ).where(
+            ~Payment.is_paid,
+            amount_cents == any_(literal(sorted(amounts_cents), ARRAY(BigInteger))),
+        )
+        if owner_id is not None:
+            stmt = stmt.where(Payment.owner_id == owner_id)
+
+        result = await self.session.execute(stmt)
+        return [OpenPayment(*row) for row in result]
+
+    async def mark_as_paid(
+        self, payment_ids: list[int], owner_id: Optional[int] = None
+    ) -> list[int]:
+        """Mark all matched payments as paid with a single bulk update.
+
+        The caller is responsible for committing.
+
+        Args:
+            payment_ids (list[int]): Matched payments
+            owner_id (Optional[int]): Restrict to payments of this owner
+
+        Returns:
+            list[int]: IDs of the payments that were updated
+        """
+        if not payment_ids:
+            return []
+        return await self.payments.bulk_update(
+            payment_ids, {"is_paid": True}, owner_id=owner_id
+        )
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.database import get_session
+from api.core.logging import get_logger
+from api.core.security import Principal, get_current_user
+from api.src.enums.enums_user_role import EnumUserRoles
+from api.src.reconciliation.schemas import StatementReconciliationResponse
+from api.src.reconciliation.service import ReconciliationService
+from api.src.utils.access_verify import is_owner_or_admin
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/reconciliation", tags=["reconciliation"])
+
+
+def get_reconciliation_service(
+    session: AsyncSession = Depends(get_session),
+) -> ReconciliationService:
+    """Get reconciliation service instance."""
+    return ReconciliationService(session)
+
+
+@router.post("/statements", response_model=StatementReconciliationResponse)
+async def reconcile_statement(
+    file: UploadFile = File(..., description="MT940 or CSV bank statement"),
+    dry_run: bool = Query(False, description="Only report matches, write nothing"),
+    service: ReconciliationService = Depends(get_reconciliation_service),
+    current_user: Principal = Depends(get_current_user),
+) -> StatementReconciliationResponse:
+    """Upload a bank statement and mark the payments it pays as paid.
+
+    Incoming transfers are matched to unpaid payments by amount and receiver
+    name, using the reference text and due date to pick between several
+    candidates. Transfers still matching more than one payment are returned
+    for review and left untouched. Owners only reconcile their own payments.
+    Requires: ADMIN or OWNER role
+    """
+    is_owner_or_admin(current_user)
+
+    logger.info(f"Reconciling statement {file.filename} by user {current_user.id}")
+    owner_id = current_user.id if current_user.role == EnumUserRoles.OWNER else None
+    return await service.reconcile(
+        file.file, filename=file.filename, owner_id=owner_id, dry_run=dry_run
+    )
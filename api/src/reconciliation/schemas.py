@@ -0,0 +1,38 @@
+from datetime import date
+
+from pydantic import BaseModel, Field
+
+
+class StatementTransfer(BaseModel):
+    """An incoming transfer read from a bank statement."""
+
+    line_number: int = Field(..., description="Line or row in the statement")
+    booking_date: date
+    amount: float
+    counterparty: str
+    reference: str
+
+
+class MatchedTransfer(StatementTransfer):
+    """A transfer matched to exactly one open payment."""
+
+    payment_id: int
+
+
+class AmbiguousTransfer(StatementTransfer):
+    """A transfer matching several open payments, to be reviewed manually."""
+
+    candidate_payment_ids: list[int]
+
+
+class StatementReconciliationResponse(BaseModel):
+    """Outcome of reconciling a bank statement."""
+
+    statement_format: str
+    dry_run: bool
+    transfers_read: int
+    payments_marked_paid: int
+    matched: list[MatchedTransfer]
+    ambiguous: list[AmbiguousTransfer]
+    unmatched: list[StatementTransfer]
+    duration_ms: int
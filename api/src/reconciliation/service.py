@@ -0,0 +1,123 @@
+from time import perf_counter
+from typing import BinaryIO, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.exceptions import BusinessRuleViolationException
+from api.core.logging import get_logger
+from api.src.reconciliation.matching import match_lines
+from api.src.reconciliation.repository import ReconciliationRepository
+from api.src.reconciliation.schemas import (
+    AmbiguousTransfer,
+    MatchedTransfer,
+    StatementReconciliationResponse,
+    StatementTransfer,
+)
+from api.src.reconciliation.statements import (
+    StatementLine,
+    StatementParseError,
+    parse_statement,
+)
+
+logger = get_logger(__name__)
+
+
+def _transfer(line: StatementLine) -> dict:
+    return {
+        "line_number": line.line_number,
+        "booking_date": line.booking_date,
+        "amount": line.amount_cents / 100,
+        "counterparty": line.counterparty,
+        "reference": line.reference,
+    }
+
+
+class ReconciliationService:
+    """Service reconciling bank statements with open payments."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize ReconciliationService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = ReconciliationRepository(session)
+
+    async def reconcile(
+        self,
+        file: BinaryIO,
+        filename: Optional[str] = None,
+        owner_id: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> StatementReconciliationResponse:
+        """Match a bank statement to open payments and mark matches as paid.
+
+        The statement is parsed as a stream into compact transfer tuples.
+        Only unpaid payments with an amount found on the statement are
+        loaded, matched in memory (see ``match_lines``) and all confirmed
+        matches are marked paid with a single bulk update. Ambiguous
+        transfers are returned for manual review and change nothing.
+
+        Args:
+            file (BinaryIO): MT940 or CSV statement
+            filename (Optional[str]): Original file name, used to detect the format
+            owner_id (Optional[int]): Restrict matching to this owner's payments
+            dry_run (bool): Only report matches, write nothing
+
+        Returns:
+            StatementReconciliationResponse: Matched, ambiguous and unmatched
+                transfers
+
+        Raises:
+            BusinessRuleViolationException: If the statement cannot be parsed
+        """
+        started = perf_counter()
+        statement_format, transfers = parse_statement(file, filename)
+        try:
+            lines = list(transfers)
+        except StatementParseError as e:
+            raise BusinessRuleViolationException(
+                f"Invalid {statement_format} statement: {e}"
+            ) from None
+
+        payments = await self.repository.get_open_payments(
+            {line.amount_cents for line in lines}, owner_id=owner_id
+        )
+        result = match_lines(lines, payments)
+
+        marked_paid = 0
+        if result.matched and not dry_run:
+            updated = await self.repository.mark_as_paid(
+                [payment.id for _, payment in result.matched], owner_id=owner_id
+            )
+            await self.session.commit()
+            marked_paid = len(updated)
+
+        duration_ms = int((perf_counter() - started) * 1000)
+        logger.info(
+            f"Reconciled {len(lines)} transfers against {len(payments)} open "
+            f"payments: {len(result.matched)} matched, {len(result.ambiguous)} "
+            f"ambiguous, {len(result.unmatched)} unmatched in {duration_ms} ms"
+        )
+        return StatementReconciliationResponse(
+            statement_format=statement_format,
+            dry_run=dry_run,
+            transfers_read=len(lines),
+            payments_marked_paid=marked_paid,
+            matched=[
+                MatchedTransfer(**_transfer(line), payment_id=payment.id)
+                for line, payment in result.matched
+            ],
+            ambiguous=[
+                AmbiguousTransfer(
+                    **_transfer(line),
+                    candidate_payment_ids=[payment.id for payment in candidates],
+                )
+                for line, candidates in result.ambiguous
+            ],
+            unmatched=[
+                StatementTransfer(**_transfer(line)) for line in result.unmatched
+            ],
+            duration_ms=duration_ms,
+        )
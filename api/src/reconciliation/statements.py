@@ -0,0 +1,252 @@
+"""Streaming parsers for MT940 and CSV bank statements.
+
+Both parsers read a statement line by line and yield one ``StatementLine``
+per incoming transfer, so the whole file is never held in memory. Outgoing
+transfers are skipped, only credits can pay a payment.
+"""
+
+import csv
+import io
+import itertools
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, Optional
+
+MT940_EXTENSIONS = (".sta", ".mt940", ".940")
+
+CSV_COLUMNS = {
+    "booking_date": ("booking date", "date", "value date", "transaction date"),
+    "amount": ("amount", "credit", "credit amount"),
+    "counterparty": ("counterparty", "name", "payer", "sender", "from"),
+    "reference": ("reference", "description", "details", "purpose", "memo"),
+}
+DATE_FORMATS = ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%Y%m%d")
+
+# :61: value date, optional entry date, credit/debit mark, fund code and amount
+MT940_ENTRY = re.compile(
+    r"^(?P<date>\d{6})(?:\d{4})?(?P<mark>R?[CD])[A-Z]?(?P<amount>\d+,\d{0,2})"
+)
+MT940_TAG = re.compile(r"^:(?P<tag>\d{2}[A-Z]?):(?P<value>.*)$")
+# Structured :86: keywords, e.g. /NAME/John Doe/REMI/Rent May
+MT940_KEYWORD = re.compile(r"/(NAME|REMI|EREF)/([^/]*)")
+
+
+class StatementParseError(ValueError):
+    """Raised for statement lines that cannot be parsed."""
+
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"Line {line_number}: {message}")
+        self.line_number = line_number
+
+
+class StatementLine(NamedTuple):
+    """A single incoming transfer from a bank statement."""
+
+    line_number: int
+    booking_date: date
+    amount_cents: int
+    counterparty: str
+    reference: str
+
+
+def parse_amount(value: str) -> int:
+    """Parse an amount with either decimal separator into cents.
+
+    The last ``,`` or ``.`` followed by one or two digits is the decimal
+    separator, any other separator groups thousands.
+    """
+    value = value.strip().replace(" ", "").replace("'", "")
+    match = re.search(r"[.,](\d{1,2})$", value)
+    if match:
+        whole, fraction = value[: match.start()], match.group(1)
+    else:
+        whole, fraction = value, "0"
+    whole = whole.replace(",", "").replace(".", "")
+    try:
+        amount = Decimal(f"{whole}.{fraction}")
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}") from None
+    return int(amount * 100)
+
+
+def parse_date(value: str) -> date:
+    """Parse a statement date in one of ``DATE_FORMATS``."""
+    value = value.strip()
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date: {value!r}")
+
+
+def parse_csv(lines: Iterable[str]) -> Iterator[StatementLine]:
+    """Parse a CSV statement with a header row.
+
+    Columns are recognized by their header names (see ``CSV_COLUMNS``), the
+    delimiter (comma, semicolon or tab) is detected from the header.
+
+    Args:
+        lines (Iterable[str]): Statement text lines
+
+    Yields:
+        StatementLine: Incoming transfers
+    """
+    lines = iter(lines)
+    header = next(lines, "")
+    try:
+        dialect = csv.Sniffer().sniff(header, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    names = [name.strip().lower() for name in next(csv.reader([header], dialect), [])]
+
+    positions = {}
+    for field, aliases in CSV_COLUMNS.items():
+        for alias in aliases:
+            if alias in names:
+                positions[field] = names.index(alias)
+                break
+    missing = {"booking_date", "amount"} - positions.keys()
+    if missing:
+        raise StatementParseError(
+            1, f"Missing column(s): {', '.join(sorted(missing))}"
+        )
+
+    def cell(row: list[str], field: str) -> str:
+        position = positions.get(field)
+        if position is None or position >= len(row):
+            return ""
+        return row[position].strip()
+
+    for line_number, row in enumerate(csv.reader(lines, dialect), start=2):
+        if not any(value.strip() for value in row):
+            continue
+        try:
+            amount_cents = parse_amount(cell(row, "amount"))
+            booking_date = parse_date(cell(row, "booking_date"))
+        except ValueError as e:
+            raise StatementParseError(line_number, str(e)) from None
+        if amount_cents <= 0:
+            continue
+        yield StatementLine(
+            line_number,
+            booking_date,
+            amount_cents,
+            cell(row, "counterparty"),
+            cell(row, "reference"),
+        )
+
+
+def _parse_information(text: str) -> tuple[str, str]:
+    """Split a :86: information field into counterparty and reference."""
+    if text.startswith("?") or re.match(r"^\d{3}\?", text):
+        # German structured format: ?20-?29 remittance, ?32-?33 name
+        subfields = {
+            match.group(1): match.group(2)
+            for match in re.finditer(r"\?(\d{2})([^?]*)", text)
+        }
+        reference = "".join(subfields.get(str(key), "") for key in range(20, 30))
+        counterparty = subfields.get("32", "") + subfields.get("33", "")
+        return counterparty.strip(), reference.strip()
+
+    keywords = dict(MT940_KEYWORD.findall(text))
+    if keywords:
+        reference = keywords.get("REMI") or keywords.get("EREF", "")
+        return keywords.get("NAME", "").strip(), reference.strip()
+    return "", text.strip()
+
+
+def parse_mt940(lines: Iterable[str]) -> Iterator[StatementLine]:
+    """Parse an MT940 statement.
+
+    Every :61: statement line is combined with the :86: information that
+    follows it; continuation lines of a field are joined.
+
+    Args:
+        lines (Iterable[str]): Statement text lines
+
+    Yields:
+        StatementLine: Incoming transfers
+    """
+    entry: Optional[tuple[int, date, int]] = None
+    information: list[str] = []
+    in_information = False
+
+    def flush() -> Optional[StatementLine]:
+        if entry is None or entry[2] <= 0:
+            return None
+        counterparty, reference = _parse_information("".join(information))
+        return StatementLine(*entry, counterparty, reference)
+
+    for line_number, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        match = MT940_TAG.match(line)
+        if not match:
+            if in_information:
+                information.append(line)
+            continue
+
+        tag, value = match.group("tag"), match.group("value")
+        in_information = tag == "86" and entry is not None
+        if in_information:
+            information = [value]
+            continue
+
+        # Any other tag ends the current transfer
+        transfer = flush()
+        if transfer:
+            yield transfer
+        entry, information = None, []
+        if tag != "61":
+            continue
+
+        entry_match = MT940_ENTRY.match(value)
+        if not entry_match:
+            raise StatementParseError(line_number, "Invalid :61: statement line")
+        try:
+            booking_date = datetime.strptime(
+                entry_match.group("date"), "%y%m%d"
+            ).date()
+        except ValueError:
+            raise StatementParseError(line_number, "Invalid :61: value date") from None
+        amount_cents = parse_amount(entry_match.group("amount"))
+        # Debits and reversed credits take money out of the account
+        if entry_match.group("mark") not in ("C", "RD"):
+            amount_cents = -amount_cents
+        entry = (line_number, booking_date, amount_cents)
+
+    transfer = flush()
+    if transfer:
+        yield transfer
+
+
+def detect_format(filename: Optional[str], first_line: str) -> str:
+    """Detect MT940 statements by file extension or their first tag."""
+    if filename and filename.lower().endswith(MT940_EXTENSIONS):
+        return "mt940"
+    if first_line.strip().startswith(("{1:", ":20:")):
+        return "mt940"
+    return "csv"
+
+
+def parse_statement(
+    file: BinaryIO, filename: Optional[str] = None
+) -> tuple[str, Iterator[StatementLine]]:
+    """Open an MT940 or CSV statement for parsing, detecting the format.
+
+    Args:
+        file (BinaryIO): Uploaded statement
+        filename (Optional[str]): Original file name, used to detect the format
+
+    Returns:
+        tuple[str, Iterator[StatementLine]]: Detected format ("mt940" or
+            "csv") and a lazy iterator over the incoming transfers
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+    first_line = text.readline()
+    lines = itertools.chain([first_line], text)
+    statement_format = detect_format(filename, first_line)
+    if statement_format == "mt940":
+        return statement_format, parse_mt940(lines)
+    return statement_format, parse_csv(lines)
@@ -0,0 +1 @@
+# Refresh tokens module
@@ -0,0 +1,31 @@
+"""Delete expired refresh tokens from the command line.
+
+Usage:
+    python -m api.src.refresh_tokens.cli purge
+
+Expired tokens are never accepted again, so purging only keeps the table
+small. Schedule it daily, e.g. via cron.
+"""
+
+import argparse
+import asyncio
+
+from api.core.database import async_session
+from api.src.refresh_tokens.repository import RefreshTokenRepository
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Purge expired refresh tokens.")
+    parser.add_argument("command", choices=["purge"])
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with async_session() as session:
+        purged = await RefreshTokenRepository(session).purge_expired()
+        await session.commit()
+        print(f"Purged {purged} expired refresh tokens")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+from sqlalchemy.sql import func
+
+from api.core.database import Base
+
+
+class RefreshToken(Base):
+    """Refresh token of a login session.
+
+    Every refresh replaces the token with a new row of the same session
+    and marks the old one used. Revoking a session revokes all its rows;
+    access tokens carry the session ID, so they are rejected as well.
+    ``user_id`` has no foreign key so revoked sessions of deleted users
+    stay known until they expire.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(String(32), nullable=False, index=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True)  # SHA-256
+    created_at = Column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    used_at = Column(DateTime(timezone=True), nullable=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=True, index=True)
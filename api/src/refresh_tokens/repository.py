@@ -0,0 +1,174 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Row, delete, exists, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.logging import get_logger
+from api.src.refresh_tokens.models import RefreshToken
+from api.src.users.models import User
+
+logger = get_logger(__name__)
+
+
+class RefreshTokenRepository:
+    """Repository for refresh tokens and session revocations.
+
+    Writing methods leave committing to the caller.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize RefreshTokenRepository.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+
+    async def create(
+        self,
+        session_id: str,
+        user_id: int,
+        token_hash: bytes,
+        expires_at: datetime,
+    ) -> None:
+        """Store a new refresh token of a session.
+
+        Args:
+            session_id (str): Login session the token belongs to
+            user_id (int): User the session belongs to
+            token_hash (bytes): SHA-256 of the token
+            expires_at (datetime): Time the token stops being accepted
+        """
+        await self.session.execute(
+            insert(RefreshToken).values(
+                session_id=session_id,
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+        )
+
+    async def get_for_update(self, token_hash: bytes) -> Optional[RefreshToken]:
+        """Get a refresh token and lock it until the transaction ends.
+
+        Args:
+            token_hash (bytes): SHA-256 of the token
+
+        Returns:
+            Optional[RefreshToken]: Stored token or None
+        """
+        result = await self.session.execute(
+            select(RefreshToken)
+            .where(RefreshToken.token_hash == token_hash)
+            .with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    async def get_user_claims(self, user_id: int) -> Optional[Row]:
+        """Get the user columns carried in access tokens.
+
+        Args:
+            user_id (int): User of the session
+
+        Returns:
+            Optional[Row]: Row with id, role and email, None if the user
+                was deleted
+        """
+        result = await self.session.execute(
+            select(User.id, User.role, User.email).where(User.id == user_id)
+        )
+        return result.one_or_none()
+
+    async def mark_used(self, token_id: int) -> None:
+        """Mark a refresh token as exchanged for a new one."""
+        await self.session.execute(
+            update(RefreshToken)
+            .where(RefreshToken.id == token_id)
+            .values(used_at=func.now())
+        )
+
+    async def revoke_session(self, session_id: str) -> None:
+        """Revoke every refresh token of a session."""
+        await self.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.session_id == session_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+        )
+
+    async def revoke_user(self, user_id: int) -> list[str]:
+        """Revoke every unexpired session of a user.
+
+        Args:
+            user_id (int): User to log out everywhere
+
+        Returns:
+            list[str]: IDs of the revoked sessions
+        """
+        result = await self.session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > func.now(),
+            )
+            .values(revoked_at=func.now())
+            .returning(RefreshToken.session_id)
+        )
+        return list(set(result.scalars().all()))
+
+    async def get_revoked_sessions(
+        self, since: Optional[datetime] = None
+    ) -> list[Row]:
+        """Get the revoked sessions that have not expired yet.
+
+        Args:
+            since (Optional[datetime]): Only sessions revoked at or after
+                this time, all when omitted
+
+        Returns:
+            list[Row]: Rows with session_id and revoked_at
+        """
+        stmt = (
+            select(
+                RefreshToken.session_id,
+                func.max(RefreshToken.revoked_at).label("revoked_at"),
+            )
+            .where(
+                RefreshToken.revoked_at.is_not(None),
+                RefreshToken.expires_at > func.now(),
+            )
+            .group_by(RefreshToken.session_id)
+        )
+        if since is not None:
+            stmt = stmt.where(RefreshToken.revoked_at >= since)
+
+        result = await self.session.execute(stmt)
+        return list(result.all())
+
+    async def is_session_revoked(self, session_id: str) -> bool:
+        """Check exactly whether a session was revoked."""
+        return bool(
+            await self.session.scalar(
+                select(
+                    exists().where(
+                        RefreshToken.session_id == session_id,
+                        RefreshToken.revoked_at.is_not(None),
+                    )
+                )
+            )
+        )
+
+    async def purge_expired(self) -> int:
+        """Delete every expired refresh token.
+
+        Returns:
+            int: Number of tokens deleted
+        """
+        result = await self.session.execute(
+            delete(RefreshToken).where(RefreshToken.expires_at <= func.now())
+        )
+        return result.rowcount
@@ -0,0 +1,129 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from api.core.config import settings
+from api.core.database import async_session
+from api.core.logging import get_logger
+from api.src.refresh_tokens.repository import RefreshTokenRepository
+from api.src.utils.bloom import BloomFilter
+
+logger = get_logger(__name__)
+
+# Revocations committed late (their time is set when the transaction
+# starts) are still picked up by the next incremental load
+REVOCATION_OVERLAP = timedelta(minutes=1)
+
+MIN_CAPACITY = 1024
+
+
+class RevokedSessions:
+    """Per-process filter of revoked login sessions.
+
+    Checking a session costs no database query unless the Bloom filter
+    reports it, which happens for revoked sessions and, rarely, as a false
+    positive; the database then decides. The filter is topped up with new
+    revocations every ``refresh_seconds`` and rebuilt every
+    ``rebuild_seconds`` to drop expired sessions. Sessions revoked by this
+    process are added immediately, other processes see them after the
+    next refresh.
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: float,
+        rebuild_seconds: float,
+        error_rate: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize RevokedSessions.
+
+        Args:
+            refresh_seconds (float): Seconds between loads of new revocations
+            rebuild_seconds (float): Seconds between full rebuilds
+            error_rate (float): False positive rate of the filter
+            timer (Callable[[], float]): Clock used for the intervals
+        """
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.error_rate = error_rate
+        self.timer = timer
+        self._filter = BloomFilter(MIN_CAPACITY, error_rate)
+        self._loaded_at: Optional[float] = None
+        self._rebuilt_at: Optional[float] = None
+        self._watermark: Optional[datetime] = None
+        self._lock = asyncio.Lock()
+
+    def add(self, session_id: str) -> None:
+        """Reject a session revoked by this process right away."""
+        self._filter.add(session_id)
+
+    async def is_revoked(self, session_id: str) -> bool:
+        """Check whether a session was revoked.
+
+        Args:
+            session_id (str): Session ID of an access token
+
+        Returns:
+            bool: True if the session was revoked
+        """
+        await self.refresh()
+        if session_id not in self._filter:
+            return False
+
+        async with async_session() as session:
+            return await RefreshTokenRepository(session).is_session_revoked(session_id)
+
+    async def refresh(self) -> None:
+        """Load new revocations if the refresh interval has passed."""
+        if not self._is_due(self._loaded_at, self.refresh_seconds):
+            return
+
+        async with self._lock:
+            if not self._is_due(self._loaded_at, self.refresh_seconds):
+                return
+            rebuild = self._watermark is None or self._is_due(
+                self._rebuilt_at, self.rebuild_seconds
+            )
+            now = self.timer()
+            try:
+                async with async_session() as session:
+                    revoked = await RefreshTokenRepository(
+                        session
+                    ).get_revoked_sessions(
+                        None if rebuild else self._watermark - REVOCATION_OVERLAP
+                    )
+            except Exception as e:
+                # Keep validating with the current filter, retry next interval
+                logger.error(f"Failed to load revoked sessions: {e}")
+                self._loaded_at = now
+                return
+
+            revoked_at = [row.revoked_at for row in revoked]
+            if rebuild:
+                self._filter = BloomFilter(
+                    max(MIN_CAPACITY, 2 * len(revoked)),
+                    self.error_rate,
+                    (row.session_id for row in revoked),
+                )
+                self._watermark = max(revoked_at, default=None)
+                self._rebuilt_at = now
+            else:
+                for row in revoked:
+                    if row.session_id not in self._filter:
+                        self._filter.add(row.session_id)
+                self._watermark = max(revoked_at, default=self._watermark)
+                if len(self._filter) > self._filter.capacity:
+                    self._rebuilt_at = None  # Resize on the next refresh
+            self._loaded_at = now
+
+    def _is_due(self, last: Optional[float], interval: float) -> bool:
+        return last is None or self.timer() - last >= interval
+
+
+revoked_sessions = RevokedSessions(
+    refresh_seconds=settings.REVOCATION_REFRESH_SECONDS,
+    rebuild_seconds=settings.REVOCATION_REBUILD_SECONDS,
+    error_rate=settings.REVOCATION_FILTER_ERROR_RATE,
+)
@@ -0,0 +1,167 @@
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.config import settings
+from api.core.exceptions import UnauthorizedException
+from api.core.logging import get_logger
+from api.core.security import create_access_token
+from api.src.enums import EnumUserRoles
+from api.src.refresh_tokens.repository import RefreshTokenRepository
+from api.src.refresh_tokens.revocation import revoked_sessions
+from api.src.users.schemas import Token
+
+logger = get_logger(__name__)
+
+
+def _digest(token: str) -> bytes:
+    """SHA-256 of a refresh token, only the hash is stored."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+class RefreshTokenService:
+    """Service issuing, rotating and revoking login sessions.
+
+    A login starts a session with a short-lived access token and a refresh
+    token. Exchanging the refresh token rotates it: the old one is marked
+    used and a new one is issued for the same session. Presenting a used
+    token again after ``REFRESH_TOKEN_REUSE_GRACE_SECONDS`` means it was
+    copied, so the whole session is revoked.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize RefreshTokenService.
+
+        Args:
+            session (AsyncSession): SQLAlchemy async session
+        """
+        self.session = session
+        self.repository = RefreshTokenRepository(session)
+
+    async def issue(self, user_id: int, role: EnumUserRoles, email: str) -> Token:
+        """Start a new session for a user who logged in.
+
+        Args:
+            user_id (int): User ID
+            role (EnumUserRoles): User role, carried in the access token
+            email (str): User email, carried in the access token
+
+        Returns:
+            Token: Access and refresh token of the new session
+        """
+        session_id = uuid.uuid4().hex
+        refresh_token = await self._store(session_id, user_id)
+        await self.session.commit()
+        return self._token(session_id, user_id, role, email, refresh_token)
+
+    async def rotate(self, refresh_token: str) -> Token:
+        """Exchange a refresh token for a new access and refresh token.
+
+        Args:
+            refresh_token (str): Current refresh token of the session
+
+        Returns:
+            Token: New access and refresh token of the same session
+
+        Raises:
+            UnauthorizedException: If the token is unknown, expired, revoked
+                or already used
+        """
+        now = datetime.now(timezone.utc)
+        stored = await self.repository.get_for_update(_digest(refresh_token))
+        if stored is None or stored.revoked_at is not None or stored.expires_at <= now:
+            await self.session.rollback()
+            raise UnauthorizedException(detail="Invalid refresh token")
+
+        if stored.used_at is not None:
+            grace = timedelta(seconds=settings.REFRESH_TOKEN_REUSE_GRACE_SECONDS)
+            if now - stored.used_at <= grace:
+                # Another tab refreshed at the same time, it has the new token
+                await self.session.rollback()
+            else:
+                logger.warning(
+                    f"Refresh token of session {stored.session_id} reused, "
+                    f"revoking the session of user {stored.user_id}"
+                )
+                await self._revoke(stored.session_id)
+            raise UnauthorizedException(detail="Refresh token was already used")
+
+        user = await self.repository.get_user_claims(stored.user_id)
+        if user is None:
+            await self._revoke(stored.session_id)
+            raise UnauthorizedException(detail="Invalid refresh token")
+
+        await self.repository.mark_used(stored.id)
+        new_refresh_token = await self._store(stored.session_id, stored.user_id)
+        await self.session.commit()
+        return self._token(
+            stored.session_id, user.id, user.role, user.email, new_refresh_token
+        )
+
+    async def revoke_session(self, session_id: str) -> None:
+        """Log out a session; its access tokens are rejected within seconds.
+
+        Args:
+            session_id (str): Session to revoke
+        """
+        await self._revoke(session_id)
+        logger.info(f"Revoked session {session_id}")
+
+    async def revoke_user(self, user_id: int) -> int:
+        """Log out every session of a user.
+
+        Args:
+            user_id (int): User to log out everywhere
+
+        Returns:
+            int: Number of sessions revoked
+        """
+        session_ids = await self.repository.revoke_user(user_id)
+        await self.session.commit()
+        for session_id in session_ids:
+            revoked_sessions.add(session_id)
+        logger.info(f"Revoked {len(session_ids)} sessions of user {user_id}")
+        return len(session_ids)
+
+    async def _revoke(self, session_id: str) -> None:
+        await self.repository.revoke_session(session_id)
+        await self.session.commit()
+        revoked_sessions.add(session_id)
+
+    async def _store(self, session_id: str, user_id: int) -> str:
+        """Create and store a new refresh token, returning it in clear."""
+        refresh_token = secrets.token_urlsafe(32)
+        await self.repository.create(
+            session_id,
+            user_id,
+            _digest(refresh_token),
+            datetime.now(timezone.utc)
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRATION_DAYS),
+        )
+        return refresh_token
+
+    def _token(
+        self,
+        session_id: str,
+        user_id: int,
+        role: EnumUserRoles,
+        email: str,
+        refresh_token: str,
+    ) -> Token:
+        access_token = create_access_token(
+            data={
+                "sub": str(user_id),
+                "role": role.value,
+                "email": email,
+                "sid": session_id,
+            },
+            expires_delta=timedelta(minutes=settings.JWT_EXPIRATION),
+        )
+        return Token(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=settings.JWT_EXPIRATION * 60,
+        )
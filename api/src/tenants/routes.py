@@ -1,11 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.enums.enums_user_role import EnumUserRoles
-from api.src.users.models import User
+from api.src.ownership.service import OwnershipService, get_ownership_service
+from api.src.payments.schemas import LedgerResponse
+from api.src.payments.service import PaymentService
 from api.src.users.schemas import TenantCreate, UserResponse, UserUpdate
 from api.src.users.service import UserService
 from api.src.utils.access_verify import is_owner_or_admin
@@ -18,7 +23,7 @@ router = APIRouter(prefix="/tenants", tags=["tenants"])
 async def create_tenant(
     tenant_data: TenantCreate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserResponse:
     is_owner_or_admin(current_user)
 
@@ -38,7 +43,7 @@ async def create_tenant(
 @router.get("/", response_model=list[UserResponse])
 async def get_tenants_for_owner(
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[UserResponse]:
     is_owner_or_admin(current_user)
 
@@ -54,7 +59,8 @@ async def get_tenants_for_owner(
 async def get_tenant(
     tenant_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserResponse:
     is_owner_or_admin(current_user)
 
@@ -64,25 +70,63 @@ async def get_tenant(
             status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
         )
 
-    if current_user.role == EnumUserRoles.OWNER:
-        tenants_in_properties = await UserService(session).get_tenants_for_owner(
-            current_user.id
-        )
-        if not any(t.id == tenant_id for t in tenants_in_properties):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to view this tenant",
-            )
+    await ownership.authorize(
+        current_user, "tenant", tenant_id, detail="Not authorized to view this tenant"
+    )
 
     return UserResponse.model_validate(tenant)
 
 
+@router.get("/{tenant_id}/ledger", response_model=LedgerResponse)
+async def get_tenant_ledger(
+    tenant_id: int,
+    start_date: Optional[date] = Query(None, description="First due date"),
+    end_date: Optional[date] = Query(None, description="Last due date"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor returned as next_cursor by the previous page"
+    ),
+    include_total: bool = Query(
+        False, description="Also return the total number of matching entries"
+    ),
+    session: AsyncSession = Depends(get_session),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
+) -> LedgerResponse:
+    """Get charges, payments and the running balance over all leases of a tenant.
+
+    Balances include every entry before start_date. Tenants only see their
+    own ledger; owners only the tenant's payments on their own properties.
+    """
+    if not (
+        current_user.role == EnumUserRoles.TENANT and tenant_id == current_user.id
+    ):
+        await ownership.authorize(
+            current_user,
+            "tenant",
+            tenant_id,
+            detail="Not authorized to view this tenant's ledger",
+        )
+
+    owner_id = current_user.id if current_user.role == EnumUserRoles.OWNER else None
+    return await PaymentService(session).get_ledger(
+        tenant_id=tenant_id,
+        owner_id=owner_id,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
 @router.put("/{tenant_id}", response_model=UserResponse)
 async def update_tenant(
     tenant_id: int,
     tenant_data: UserUpdate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserResponse:
     is_owner_or_admin(current_user)
 
@@ -92,15 +136,12 @@ async def update_tenant(
             status_code=status.HTTP_404_NOT_FOUND, detail="Tenant not found"
         )
 
-    if current_user.role == EnumUserRoles.OWNER:
-        tenants_in_properties = await UserService(session).get_tenants_for_owner(
-            current_user.id
-        )
-        if not any(t.id == tenant_id for t in tenants_in_properties):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this tenant",
-            )
+    await ownership.authorize(
+        current_user,
+        "tenant",
+        tenant_id,
+        detail="Not authorized to update this tenant",
+    )
 
     updated_tenant = await UserService(session).update_user(tenant_id, tenant_data)
     logger.info(f"Updated tenant {tenant_id}")
@@ -112,7 +153,7 @@ async def update_tenant(
 async def delete_tenant(
     tenant_id: int,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> None:
     if current_user.role != EnumUserRoles.ADMIN:
         raise HTTPException(
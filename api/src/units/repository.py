@@ -8,6 +8,8 @@ from api.core.exceptions import (
     ConflictException,
     NotFoundException,
 )
+from api.src.ownership.service import invalidate_ownership
+from api.src.payments.repository import PaymentRepository
 from api.src.units.models import Unit
 from api.src.units.schemas import UnitCreate, UnitUpdate
 
@@ -65,10 +67,18 @@ class UnitRepository:
         data: UnitUpdate,
     ) -> Unit:
         unit = await self.get_by_id(unit_id)
-        for field, value in data.model_dump(exclude_unset=True).items():
+        update_data = data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
             setattr(unit, field, value)
         self.session.add(unit)
+
+        if "property_id" in update_data:
+            await self.session.flush()
+            await PaymentRepository(self.session).sync_ownership(unit_ids=[unit_id])
+
         await self.session.commit()
+        if "property_id" in update_data:
+            invalidate_ownership()
         await self.session.refresh(unit)
         return unit
 
@@ -97,5 +107,7 @@ class UnitRepository:
             )
 
         # If no active leases, proceed with deletion
+        await PaymentRepository(self.session).clear_ownership(unit_id=unit_id)
         await self.session.delete(unit)
         await self.session.commit()
+        invalidate_ownership()
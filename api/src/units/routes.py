@@ -1,15 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.enums.enums_user_role import EnumUserRoles
-from api.src.properties.repository import PropertyRepository
+from api.src.ownership.service import OwnershipService, get_ownership_service
 from api.src.units.schemas import UnitCreate, UnitResponse, UnitUpdate
 from api.src.units.service import UnitService
-from api.src.users.models import User
-from api.src.utils.access_verify import is_authorized_user
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/units", tags=["units"])
@@ -29,11 +27,15 @@ def get_unit_service(
 async def create_unit(
     unit_data: UnitCreate,
     service: UnitService = Depends(get_unit_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ) -> UnitResponse:
-    property_repo = PropertyRepository(service.repository.session)
-    prop = await property_repo.get_by_id(unit_data.property_id)
-    is_authorized_user(current_user, prop, detail="Not authorized to create unit")
+    await ownership.authorize(
+        current_user,
+        "property",
+        unit_data.property_id,
+        detail="Not authorized to create unit",
+    )
     return await service.create_unit(unit_data)
 
 
@@ -43,7 +45,7 @@ async def create_unit(
 )
 async def get_all_units(
     service: UnitService = Depends(get_unit_service),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[UnitResponse]:
     """Get all units. Admins see all units, owners see only their units."""
     if current_user.role == EnumUserRoles.ADMIN:
@@ -73,15 +75,13 @@ async def list_units(
 async def delete_unit(
     unit_id: int,
     service: UnitService = Depends(get_unit_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     logger.debug(f"User {current_user.id} is attempting to delete unit {unit_id}")
-    unit = await service.get_unit(unit_id)
-    if not unit:
-        raise HTTPException(status_code=404, detail="Unit not found")
-    property_repo = PropertyRepository(service.repository.session)
-    prop = await property_repo.get_by_id(unit.property_id)
-    is_authorized_user(current_user, prop, detail="Not authorized to delete this unit")
+    await ownership.authorize(
+        current_user, "unit", unit_id, detail="Not authorized to delete this unit"
+    )
     await service.delete_unit(unit_id)
 
 
@@ -90,15 +90,20 @@ async def update_unit(
     unit_id: int,
     unit_data: UnitUpdate,
     service: UnitService = Depends(get_unit_service),
-    current_user: User = Depends(get_current_user),
+    ownership: OwnershipService = Depends(get_ownership_service),
+    current_user: Principal = Depends(get_current_user),
 ):
     """Update a unit by ID."""
     logger.debug(f"User {current_user.id} is attempting to update unit {unit_id}")
-    unit = await service.get_unit(unit_id)
-    if not unit:
-        raise HTTPException(status_code=404, detail="Unit not found")
     # Only owner or admin can update the unit
-    property_repo = PropertyRepository(service.repository.session)
-    prop = await property_repo.get_by_id(unit.property_id)
-    is_authorized_user(current_user, prop, detail="Not authorized to update this unit")
+    await ownership.authorize(
+        current_user, "unit", unit_id, detail="Not authorized to update this unit"
+    )
+    if unit_data.property_id is not None:
+        await ownership.authorize(
+            current_user,
+            "property",
+            unit_data.property_id,
+            detail="Not authorized to move this unit",
+        )
     return await service.update_unit(unit_id, unit_data)
@@ -6,7 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user, get_current_user_model
+from api.src.refresh_tokens.schemas import RefreshTokenRequest
+from api.src.refresh_tokens.service import RefreshTokenService
 from api.src.users.models import User
 from api.src.users.schemas import (
     LoginData,
@@ -46,9 +48,27 @@ async def login(
     return {"user": UserResponse.model_validate(user), "token": token}
 
 
+@router.post("/refresh", response_model=Token)
+async def refresh(
+    refresh_data: RefreshTokenRequest,
+    session: AsyncSession = Depends(get_session),
+) -> Token:
+    """Exchange a refresh token for a new access and refresh token"""
+    return await RefreshTokenService(session).rotate(refresh_data.refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    session: AsyncSession = Depends(get_session),
+    current_user: Principal = Depends(get_current_user),
+) -> None:
+    """Revoke the current session and its refresh token"""
+    await RefreshTokenService(session).revoke_session(current_user.session_id)
+
+
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    user: User = Depends(get_current_user),
+    user: User = Depends(get_current_user_model),
 ) -> UserResponse:
     logger.debug(f"User authenticated: {user.email}")
     return user
@@ -58,7 +78,7 @@ async def get_me(
 async def update_me(
     user_data: UserUpdate,
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> UserResponse:
     """Update current user's profile"""
     logger.debug(f"Updating profile for user: {current_user.email}")
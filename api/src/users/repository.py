@@ -29,7 +29,7 @@ class UserRepository:
             last_name=user_data.last_name,
             username=user_data.username,
             email=user_data.email,
-            hashed_password=get_password_hash(user_data.password),
+            hashed_password=await get_password_hash(user_data.password),
             role=user_data.role,
         )
         self.session.add(user)
@@ -259,6 +259,10 @@ class UserRepository:
         logger.info(f"Updated user: {user.email}")
         return user
 
+    async def update_password_hash(self, user: User, hashed_password: str) -> None:
+        user.hashed_password = hashed_password
+        await self.session.commit()
+
     async def delete(self, user_id: int) -> None:
         user = await self.get_by_id(user_id)
 
@@ -1,13 +1,12 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_session
 from api.core.logging import get_logger
-from api.core.security import get_current_user
+from api.core.security import Principal, get_current_user
 from api.src.enums.enums_user_role import EnumUserRoles
-from api.src.users.models import User
 from api.src.users.schemas import UserResponse
 from api.src.users.service import UserService
 from api.src.utils.access_verify import is_owner_or_admin
@@ -24,7 +23,7 @@ async def get_all_users(
         None, description="Filter by role (ADMIN, OWNER, TENANT)"
     ),
     session: AsyncSession = Depends(get_session),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ) -> list[UserResponse]:
     is_owner_or_admin(current_user)
 
@@ -46,3 +45,21 @@ async def get_all_users(
         result.append(UserResponse(**user_dict))
 
     return result
+
+
+@users_router.post(
+    "/{user_id}/revoke-sessions", status_code=status.HTTP_204_NO_CONTENT
+)
+async def revoke_sessions(
+    user_id: int,
+    session: AsyncSession = Depends(get_session),
+    current_user: Principal = Depends(get_current_user),
+) -> None:
+    """Log a user out of every session"""
+    if current_user.role != EnumUserRoles.ADMIN:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+
+    revoked = await UserService(session).revoke_sessions(user_id)
+    logger.info(f"Revoked {revoked} sessions of user {user_id}")
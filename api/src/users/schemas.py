@@ -55,7 +55,9 @@ class UserResponse(UserBase):
 
 class Token(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
+    expires_in: int  # Seconds the access token is valid
 
 
 class LoginData(BaseModel):
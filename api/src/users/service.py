@@ -1,12 +1,10 @@
-from datetime import timedelta
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.core.config import settings
 from api.core.exceptions import UnauthorizedException
 from api.core.logging import get_logger
-from api.core.security import create_access_token, verify_password
+from api.core.security import verify_password
 from api.src.enums import EnumUserRoles
+from api.src.refresh_tokens.service import RefreshTokenService
 from api.src.users.models import User
 from api.src.users.repository import UserRepository
 from api.src.users.schemas import (
@@ -41,18 +39,24 @@ class UserService:
 
     async def authenticate(self, login_data: LoginData) -> Token:
         user = await self.repository.get_by_email(login_data.email)
-        if not user or not verify_password(
+        if not user:
+            raise UnauthorizedException(detail="Incorrect email or password")
+
+        verified, new_hash = await verify_password(
             login_data.password, str(user.hashed_password)
-        ):
+        )
+        if not verified:
             raise UnauthorizedException(detail="Incorrect email or password")
+        if new_hash is not None:
+            await self.repository.update_password_hash(user, new_hash)
+            logger.info(f"Rehashed password of user: {user.email}")
 
-        access_token = create_access_token(
-            data={"sub": str(user.id)},
-            expires_delta=timedelta(minutes=settings.JWT_EXPIRATION),
+        token = await RefreshTokenService(self.session).issue(
+            user.id, user.role, user.email
         )
 
         logger.info(f"User authenticated: {user.email}")
-        return Token(access_token=access_token)
+        return token
 
     async def get_user(self, user_id: int) -> User:
         return await self.repository.get_by_id(user_id)
@@ -79,7 +83,17 @@ class UserService:
         return await self.repository.get_leases_for_owner(owner_id)
 
     async def update_user(self, user_id: int, user_data: UserUpdate) -> User:
-        return await self.repository.update(user_id, user_data)
+        previous_role = (await self.repository.get_by_id(user_id)).role
+        user = await self.repository.update(user_id, user_data)
+        # Access tokens carry the role, so a new role needs a new login
+        if user_data.is_active is False or user.role != previous_role:
+            await RefreshTokenService(self.session).revoke_user(user_id)
+        return user
 
     async def delete_user(self, user_id: int) -> None:
         await self.repository.delete(user_id)
+        await RefreshTokenService(self.session).revoke_user(user_id)
+
+    async def revoke_sessions(self, user_id: int) -> int:
+        await self.repository.get_by_id(user_id)
+        return await RefreshTokenService(self.session).revoke_user(user_id)
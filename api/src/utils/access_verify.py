@@ -1,14 +1,13 @@
 from fastapi import HTTPException, status
 
 from api.core.logging import get_logger
+from api.core.security import Principal
 from api.src.enums.enums_user_role import EnumUserRoles
-from api.src.properties.models import Property
-from api.src.users.models import User
 
 logger = get_logger(__name__)
 
 
-def is_owner_or_admin(current_user: User) -> None:
+def is_owner_or_admin(current_user: Principal) -> None:
     if current_user.role not in [EnumUserRoles.ADMIN, EnumUserRoles.OWNER]:
         logger.warning(
             f"Access denied for user {current_user.email} with role {current_user.role}"
@@ -17,12 +16,3 @@ def is_owner_or_admin(current_user: User) -> None:
             status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
         )
     return None
-
-
-def is_authorized_user(current_user: User, prop: Property, detail: str) -> None:
-    if (
-        current_user.role not in [EnumUserRoles.ADMIN]
-        and prop.owner_id != current_user.id
-    ):
-        raise HTTPException(status_code=403, detail=detail)
-    return None
@@ -0,0 +1,56 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+class BloomFilter:
+    """Fixed-size set membership filter for strings.
+
+    ``in`` never misses an added item, but may report an item that was not
+    added with a probability of about ``error_rate`` while the filter holds
+    at most ``capacity`` items. Items cannot be removed; rebuild the filter
+    instead.
+    """
+
+    def __init__(
+        self, capacity: int, error_rate: float = 0.001, items: Iterable[str] = ()
+    ):
+        """Initialize BloomFilter.
+
+        Args:
+            capacity (int): Number of items the error rate is sized for
+            error_rate (float): Acceptable false positive probability
+            items (Iterable[str]): Items to add
+        """
+        capacity = max(capacity, 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+        for item in items:
+            self.add(item)
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7))
+            for index in self._indexes(item)
+        )
+
+    def __len__(self) -> int:
+        """Number of items added, counting repeated items each time."""
+        return self._count
+
+    def _indexes(self, item: str) -> list[int]:
+        """Bit positions of an item, by double hashing one BLAKE2b digest."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
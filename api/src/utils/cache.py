@@ -0,0 +1,63 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Small in-process LRU cache whose entries expire after ``ttl`` seconds.
+
+    Not shared between worker processes; entries must either tolerate being
+    up to ``ttl`` seconds stale or be validated by the caller.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize TTLCache.
+
+        Args:
+            maxsize (int): Maximum number of entries, least recently used
+                entries are evicted first
+            ttl (float): Seconds an entry stays valid
+            timer (Callable[[], float]): Clock used for expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Return the cached value, or ``default`` if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= self.timer():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache ``value`` for ``ttl`` seconds."""
+        self._entries[key] = (self.timer() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Invalidate a single entry."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalidate all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,141 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Generic, Optional, TypeVar
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.core.exceptions import BusinessRuleViolationException
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """A single page of results from a keyset paginated query."""
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Keyset:
+    """Sort key used for keyset pagination.
+
+    The last column must be unique (usually the primary key) so that the
+    ordering is total and no row is skipped or repeated between pages.
+    """
+
+    name: str
+    columns: tuple = field(default_factory=tuple)
+    descending: bool = False
+
+    def order_by(self) -> list:
+        """Return ORDER BY clauses matching the keyset direction."""
+        if self.descending:
+            return [column.desc() for column in self.columns]
+        return [column.asc() for column in self.columns]
+
+    def encode(self, row: Any) -> str:
+        """Encode the keyset values of a row into an opaque cursor."""
+        values = [_to_json(getattr(row, column.key)) for column in self.columns]
+        payload = json.dumps({"k": self.name, "v": values}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        """Decode an opaque cursor back into typed keyset values.
+
+        Raises:
+            BusinessRuleViolationException: If the cursor is malformed or was
+                issued for a different sort order
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if payload["k"] != self.name or len(payload["v"]) != len(self.columns):
+                raise ValueError("cursor does not match sort order")
+            return [
+                _from_json(column.type.python_type, value)
+                for column, value in zip(self.columns, payload["v"])
+            ]
+        except (binascii.Error, KeyError, TypeError, ValueError) as e:
+            raise BusinessRuleViolationException("Invalid pagination cursor") from e
+
+    def apply(self, stmt: Select, cursor: Optional[str] = None) -> Select:
+        """Order the statement by the keyset and seek past the cursor."""
+        stmt = stmt.order_by(*self.order_by())
+        if cursor:
+            values = self.decode(cursor)
+            keys = tuple_(*self.columns)
+            stmt = stmt.where(
+                keys < tuple_(*values) if self.descending else keys > tuple_(*values)
+            )
+        return stmt
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(python_type: type, value: Any) -> Any:
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+async def count_rows(session: AsyncSession, stmt: Select) -> int:
+    """Count the rows a statement would return, ignoring ordering and limits."""
+    count_stmt = select(func.count()).select_from(
+        stmt.order_by(None).limit(None).offset(None).subquery()
+    )
+    result = await session.execute(count_stmt)
+    return result.scalar_one()
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    keyset: Keyset,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    rows: bool = False,
+) -> Page:
+    """Fetch one page of ORM entities using keyset pagination.
+
+    Args:
+        session (AsyncSession): SQLAlchemy async session
+        stmt (Select): Filtered entity query without ordering
+        keyset (Keyset): Sort key to paginate on
+        limit (Optional[int]): Page size (no limit if None)
+        cursor (Optional[str]): Cursor returned with the previous page
+        include_total (bool): Also count all rows matching the filters
+        rows (bool): Return the selected rows instead of entities, for column
+            queries selecting every keyset column by name
+
+    Returns:
+        Page: Page items, cursor for the next page and optional total count
+    """
+    total = await count_rows(session, stmt) if include_total else None
+
+    stmt = keyset.apply(stmt, cursor)
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+
+    result = await session.execute(stmt)
+    items = list(result.all() if rows else result.scalars().all())
+
+    next_cursor = None
+    if limit is not None and len(items) > limit:
+        items = items[:limit]
+        next_cursor = keyset.encode(items[-1])
+
+    return Page(items=items, next_cursor=next_cursor, total=total)
@@ -1,11 +1,27 @@
+interface AuthTokens {
+  access_token: string
+  refresh_token: string
+  expires_in: number
+}
+
 const token = ref<string | null>(null)
 const isValidating = ref<boolean>(false)
 
+// Renew the access token this long before it expires
+const REFRESH_MARGIN_MS = 30_000
+
+let refreshTimer: ReturnType<typeof setTimeout> | null = null
+let refreshing: Promise<boolean> | null = null
+
 export function useAuth() {
-  function setToken(accessToken: string) {
-    token.value = accessToken
+  function setToken(tokens: AuthTokens) {
+    token.value = tokens.access_token
     if (typeof window !== 'undefined') {
-      localStorage.setItem('access_token', accessToken)
+      const expiresAt = Date.now() + tokens.expires_in * 1000
+      localStorage.setItem('access_token', tokens.access_token)
+      localStorage.setItem('refresh_token', tokens.refresh_token)
+      localStorage.setItem('access_token_expires_at', String(expiresAt))
+      scheduleRefresh(expiresAt)
     }
   }
 
@@ -14,6 +30,7 @@ export function useAuth() {
       const stored = localStorage.getItem('access_token')
       if (stored) {
         token.value = stored
+        scheduleRefresh(Number(localStorage.getItem('access_token_expires_at')))
       }
     }
     return token.value
@@ -21,13 +38,76 @@ export function useAuth() {
 
   function clearToken() {
     token.value = null
+    if (refreshTimer) {
+      clearTimeout(refreshTimer)
+      refreshTimer = null
+    }
     if (typeof window !== 'undefined') {
       localStorage.removeItem('access_token')
+      localStorage.removeItem('refresh_token')
+      localStorage.removeItem('access_token_expires_at')
+    }
+  }
+
+  function scheduleRefresh(expiresAt: number) {
+    if (refreshTimer) {
+      clearTimeout(refreshTimer)
+    }
+    const delay = Math.max((expiresAt || 0) - Date.now() - REFRESH_MARGIN_MS, 0)
+    refreshTimer = setTimeout(() => refreshToken(), delay)
+  }
+
+  // Exchange the refresh token for new tokens, sharing one request between callers
+  function refreshToken(): Promise<boolean> {
+    if (!refreshing) {
+      refreshing = doRefresh().finally(() => {
+        refreshing = null
+      })
+    }
+    return refreshing
+  }
+
+  async function doRefresh(): Promise<boolean> {
+    if (typeof window === 'undefined') {
+      return false
+    }
+    const refreshTokenValue = localStorage.getItem('refresh_token')
+    if (!refreshTokenValue) {
+      return false
+    }
+
+    try {
+      const response = await fetch('http://localhost:8000/api/auth/refresh', {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({ refresh_token: refreshTokenValue })
+      })
+
+      if (response.ok) {
+        setToken(await response.json())
+        return true
+      }
+
+      // Another tab may have rotated the token at the same time
+      const current = localStorage.getItem('refresh_token')
+      if (current && current !== refreshTokenValue) {
+        token.value = localStorage.getItem('access_token')
+        scheduleRefresh(Number(localStorage.getItem('access_token_expires_at')))
+        return true
+      }
+
+      clearToken()
+      return false
+    } catch (error) {
+      console.error('Error refreshing token:', error)
+      return false
     }
   }
 
   async function validateToken(): Promise<boolean> {
-    const currentToken = getToken()
+    let currentToken = getToken()
 
     if (!currentToken) {
       return false
@@ -36,6 +116,14 @@ export function useAuth() {
     isValidating.value = true
 
     try {
+      const expiresAt = Number(localStorage.getItem('access_token_expires_at'))
+      if (expiresAt && expiresAt - Date.now() < REFRESH_MARGIN_MS) {
+        if (!await refreshToken()) {
+          return false
+        }
+        currentToken = getToken()
+      }
+
       const response = await fetch('http://localhost:8000/api/auth/me', {
         method: 'GET',
         headers: {
@@ -69,13 +157,33 @@ export function useAuth() {
     return await validateToken()
   }
 
+  // Revoke the session on the server, then forget the tokens
+  async function logout() {
+    const currentToken = getToken()
+    if (currentToken) {
+      try {
+        await fetch('http://localhost:8000/api/auth/logout', {
+          method: 'POST',
+          headers: {
+            Authorization: `Bearer ${currentToken}`
+          }
+        })
+      } catch (error) {
+        console.error('Error logging out:', error)
+      }
+    }
+    clearToken()
+  }
+
   return {
     token,
     isValidating,
     setToken,
     getToken,
     clearToken,
+    refreshToken,
     validateToken,
-    isAuthenticated
+    isAuthenticated,
+    logout
   }
 }
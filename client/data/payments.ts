@@ -51,3 +51,31 @@ export interface RecurringPaymentResponse {
   dueDay: number
   payments: number[]
 }
+
+export interface PaymentFigures {
+  amount: number
+  paidAmount: number
+  outstandingAmount: number
+  overdueAmount: number
+  paymentCount: number
+  paidCount: number
+}
+
+export interface PaymentComparison {
+  current: PaymentFigures
+  previous: PaymentFigures
+  // Percent change against the previous period, null when it had nothing
+  change: { [K in keyof PaymentFigures]: number | null }
+}
+
+export interface PaymentAnalytics {
+  period: 'daily' | 'weekly' | 'monthly'
+  startDate: string
+  endDate: string
+  previousStartDate: string
+  previousEndDate: string
+  series: (PaymentFigures & { periodStart: string })[]
+  totals: PaymentComparison
+  properties: (PaymentComparison & { propertyId: number, propertyTitle: string | null })[]
+  documentTypes: (PaymentComparison & { documentType: string })[]
+}
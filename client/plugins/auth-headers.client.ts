@@ -11,11 +11,13 @@ export default defineNuxtPlugin((nuxtApp) => {
     }
   })
 
-  nuxtApp.hook('fetch:error', (error: any) => {
+  nuxtApp.hook('fetch:error', async (error: any) => {
     if (error.response?.status === 401) {
-      const { clearToken } = useAuth()
-      clearToken()
-      navigateTo('/LogIn')
+      const { clearToken, refreshToken } = useAuth()
+      if (!await refreshToken()) {
+        clearToken()
+        navigateTo('/LogIn')
+      }
     }
   })
 })
@@ -0,0 +1,99 @@
+function toFigures(figures: any) {
+  return {
+    amount: figures.amount,
+    paidAmount: figures.paid_amount,
+    outstandingAmount: figures.outstanding_amount,
+    overdueAmount: figures.overdue_amount,
+    paymentCount: figures.payment_count,
+    paidCount: figures.paid_count
+  }
+}
+
+function toComparison(comparison: any) {
+  return {
+    current: toFigures(comparison.current),
+    previous: toFigures(comparison.previous),
+    change: toFigures(comparison.change)
+  }
+}
+
+export default eventHandler(async (event: any) => {
+  const authHeader = getHeader(event, 'authorization')
+
+  if (!authHeader) {
+    throw createError({
+      statusCode: 401,
+      statusMessage: 'No authorization header'
+    })
+  }
+
+  const url = new URL('http://backend:8000/api/analytics/payments')
+  const query = getQuery(event)
+  for (const [name, param] of [
+    ['startDate', 'start_date'],
+    ['endDate', 'end_date'],
+    ['period', 'period'],
+    ['propertyId', 'property_id'],
+    ['documentType', 'document_type']
+  ]) {
+    if (query[name]) {
+      url.searchParams.set(param, String(query[name]))
+    }
+  }
+
+  try {
+    const response = await fetch(url.toString(), {
+      method: 'GET',
+      headers: {
+        'Authorization': authHeader,
+        'Content-Type': 'application/json'
+      }
+    })
+
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({ detail: 'Unknown error' }))
+      throw createError({
+        statusCode: response.status,
+        statusMessage: response.statusText,
+        data: errorData
+      })
+    }
+
+    const analytics = await response.json()
+
+    // Transform backend data to frontend format
+    return {
+      period: analytics.period,
+      startDate: analytics.start_date,
+      endDate: analytics.end_date,
+      previousStartDate: analytics.previous_start_date,
+      previousEndDate: analytics.previous_end_date,
+      series: analytics.series.map((bucket: any) => ({
+        periodStart: bucket.period_start,
+        ...toFigures(bucket)
+      })),
+      totals: toComparison(analytics.totals),
+      properties: analytics.properties.map((property: any) => ({
+        propertyId: property.property_id,
+        propertyTitle: property.property_title,
+        ...toComparison(property)
+      })),
+      documentTypes: analytics.document_types.map((documentType: any) => ({
+        documentType: documentType.document_type,
+        ...toComparison(documentType)
+      }))
+    }
+  } catch (error: any) {
+    console.error('Error fetching payment analytics:', error)
+
+    if (error.statusCode) {
+      throw error
+    }
+
+    throw createError({
+      statusCode: 500,
+      statusMessage: 'Internal Server Error',
+      data: error.message
+    })
+  }
+})
@@ -1,13 +1,8 @@
 export default eventHandler(async (event) => {
   try {
-    // Get authorization header
-    const authHeader = getHeader(event, 'authorization')
-    if (!authHeader || !authHeader.startsWith('Bearer ')) {
-      throw createError({
-        statusCode: 401,
-        statusMessage: 'Missing or invalid authorization header'
-      })
-    }
+    // Reject invalid or expired tokens without a backend round trip
+    await requireAccessToken(event)
+    const authHeader = getHeader(event, 'authorization') as string
 
     // Get request body
     const body = await readBody(event)
@@ -17,13 +17,16 @@ export default eventHandler(async (event: any) => {
   }
 
   const body = await readBody(event)
+  // Forwarded so retried requests are replayed instead of creating duplicates
+  const idempotencyKey = getHeader(event, 'idempotency-key')
 
   try {
     const response = await fetch('http://backend:8000/api/payments/', {
       method: 'POST',
       headers: {
         'Authorization': authHeader,
-        'Content-Type': 'application/json'
+        'Content-Type': 'application/json',
+        ...(idempotencyKey ? { 'Idempotency-Key': idempotencyKey } : {})
       },
       body: JSON.stringify({
         document_type: body.documentType,
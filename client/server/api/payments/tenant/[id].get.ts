@@ -18,24 +18,7 @@ export default eventHandler(async (event: any) => {
   }
 
   try {
-    const response = await fetch(`http://backend:8000/api/payments/tenant/${tenantId}`, {
-      method: 'GET',
-      headers: {
-        'Authorization': authHeader,
-        'Content-Type': 'application/json'
-      }
-    })
-
-    if (!response.ok) {
-      const errorData = await response.json().catch(() => ({ detail: 'Unknown error' }))
-      throw createError({
-        statusCode: response.status,
-        statusMessage: response.statusText,
-        data: errorData
-      })
-    }
-
-    const result = await response.json()
+    const result = await fetchAllPaymentPages(`http://backend:8000/api/payments/tenant/${tenantId}`, authHeader)
 
     // Transform backend data to frontend format
     return result.map((payment: any) => ({
@@ -0,0 +1,41 @@
+// server/utils/auth.ts
+import type { H3Event } from 'h3'
+import { createRemoteJWKSet, jwtVerify } from 'jose'
+import type { JWTPayload } from 'jose'
+
+// Public keys of the backend; fetched once, refetched when a token names an unknown key
+const jwks = createRemoteJWKSet(new URL('http://backend:8000/api/.well-known/jwks.json'))
+
+export interface AccessTokenClaims extends JWTPayload {
+  sub: string
+  role: 'admin' | 'owner' | 'tenant'
+  email: string
+  sid: string
+}
+
+/**
+ * Verify the bearer token of a request against the backend's JWKS.
+ * Returns the token's claims without calling the backend. Revoked sessions
+ * are only rejected by the backend, so proxied calls still check them.
+ */
+export async function requireAccessToken(event: H3Event): Promise<AccessTokenClaims> {
+  const authHeader = getHeader(event, 'authorization')
+  if (!authHeader || !authHeader.startsWith('Bearer ')) {
+    throw createError({
+      statusCode: 401,
+      statusMessage: 'Missing or invalid authorization header'
+    })
+  }
+
+  try {
+    const { payload } = await jwtVerify(authHeader.slice('Bearer '.length), jwks, {
+      algorithms: ['RS256', 'ES256']
+    })
+    return payload as AccessTokenClaims
+  } catch {
+    throw createError({
+      statusCode: 401,
+      statusMessage: 'Invalid or expired access token'
+    })
+  }
+}
@@ -0,0 +1,44 @@
+// server/utils/payments.ts
+
+// Largest page size accepted by the backend payment list endpoints
+const PAGE_SIZE = 100
+
+/**
+ * Fetch every page of a keyset paginated backend payment list.
+ * Follows `next_cursor` until the last page and returns the concatenated rows.
+ */
+export async function fetchAllPaymentPages(url: string, authHeader: string): Promise<any[]> {
+  const payments: any[] = []
+  let cursor: string | null = null
+
+  do {
+    const pageUrl = new URL(url)
+    pageUrl.searchParams.set('limit', String(PAGE_SIZE))
+    if (cursor) {
+      pageUrl.searchParams.set('cursor', cursor)
+    }
+
+    const response = await fetch(pageUrl.toString(), {
+      method: 'GET',
+      headers: {
+        'Authorization': authHeader,
+        'Content-Type': 'application/json'
+      }
+    })
+
+    if (!response.ok) {
+      const errorData = await response.json().catch(() => ({ detail: 'Unknown error' }))
+      throw createError({
+        statusCode: response.status,
+        statusMessage: response.statusText,
+        data: errorData
+      })
+    }
+
+    const page = await response.json()
+    payments.push(...page.payments)
+    cursor = page.next_cursor
+  } while (cursor)
+
+  return payments
+}
@@ -0,0 +1,113 @@
+"""Benchmark full and compact payment list views against the database.
+
+Inserts benchmark payments spread over the existing leases inside a
+transaction, lists them with ``view=full`` and ``view=compact``, prints the
+number of SQL statements and the latency (query, response model and JSON
+encoding) of each view, then rolls everything back.
+
+Needs a migrated database with seeded leases (see tests/load_seeds.py).
+
+Usage:
+    python -m tests.benchmark_payment_views --payments 10000
+"""
+
+import argparse
+import asyncio
+from datetime import date, timedelta
+from statistics import median
+from time import perf_counter
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import api.src.files.models  # noqa: F401
+import api.src.profile_pictures.models  # noqa: F401
+from api.core.database import engine
+from api.src.leases.models import Lease
+from api.src.payments.models import Payment
+from api.src.payments.schemas import PaymentView
+from api.src.payments.service import PaymentService
+from api.src.properties.models import Property
+from api.src.units.models import Unit
+
+
+async def insert_payments(session: AsyncSession, count: int) -> int:
+    """Insert ``count`` unpaid and paid payments round robin over all leases."""
+    leases = (
+        await session.execute(
+            select(Lease.id, Unit.property_id, Property.owner_id, Lease.tenant_id)
+            .join(Unit, Lease.unit_id == Unit.id)
+            .join(Property, Unit.property_id == Property.id)
+            .order_by(Lease.id)
+        )
+    ).all()
+    if not leases:
+        raise SystemExit("No leases found, load the seeds first")
+
+    start = date.today() - timedelta(days=count // len(leases))
+    rows = [
+        {
+            "document_type": "Benchmark",
+            "gross_value": 500 + index % 2000,
+            "due_date": start + timedelta(days=index // len(leases)),
+            "receiver": f"Tenant {lease.tenant_id}",
+            "is_paid": index % 3 == 0,
+            "lease_id": lease.id,
+            "property_id": lease.property_id,
+            "owner_id": lease.owner_id,
+        }
+        for index in range(count)
+        for lease in [leases[index % len(leases)]]
+    ]
+    await session.execute(insert(Payment), rows)
+    return len(leases)
+
+
+async def run(payments: int, repeat: int) -> None:
+    statements = 0
+
+    def count_statement(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_statement)
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, expire_on_commit=False)
+        try:
+            leases = await insert_payments(session, payments)
+            print(f"Inserted {payments} payments over {leases} leases")
+
+            for view in PaymentView:
+                timings, rows = [], 0
+                for _ in range(repeat):
+                    session.expunge_all()
+                    statements = 0
+                    started = perf_counter()
+                    response = await PaymentService(session).get_payments(
+                        limit=payments, view=view
+                    )
+                    response.model_dump_json()
+                    timings.append(perf_counter() - started)
+                    rows = response.size
+                print(
+                    f"view={view.value:<8} rows {rows:>6}  "
+                    f"statements {statements:>3}  "
+                    f"median {median(timings) * 1000:8.1f} ms"
+                )
+        finally:
+            await session.close()
+            await transaction.rollback()
+            event.remove(engine.sync_engine, "before_cursor_execute", count_statement)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payments", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.payments, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from datetime import timedelta
+from typing import Any, Callable
+
+import pytest
+
+import api.core.security as security
+from api.core.signing_keys import KeyRing
+
+
+@pytest.fixture(autouse=True)
+def signing_keys(tmp_path, monkeypatch):
+    """Sign tokens with a throwaway ES256 key instead of the key directory."""
+    keys = KeyRing(
+        tmp_path / "keys", "ES256", grace=timedelta(minutes=60), reload_seconds=60
+    )
+    monkeypatch.setattr(security, "signing_keys", keys)
+    return keys
+
+
+class FakeClock:
+    """Monotonic timer stand-in; tests move time by setting ``now``."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class FakeSession:
+    """AsyncSession stand-in counting commits and rollbacks.
+
+    Statements passed to ``scalar`` are recorded and answered by ``answer``.
+    Also works as ``async with`` block, like sessions from the factory.
+    """
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+        self.statements = []
+        self.answer: Callable[[Any], Any] = lambda statement: None
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def scalar(self, statement):
+        self.statements.append(statement)
+        return self.answer(statement)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def fake_session() -> FakeSession:
+    return FakeSession()
@@ -0,0 +1,13 @@
+from api.src.utils.bloom import BloomFilter
+
+
+def test_added_items_are_always_found():
+    bloom = BloomFilter(1000, 0.01, (f"session-{i}" for i in range(1000)))
+    assert all(f"session-{i}" in bloom for i in range(1000))
+    assert len(bloom) == 1000
+
+
+def test_false_positive_rate_stays_near_the_error_rate():
+    bloom = BloomFilter(1000, 0.01, (f"session-{i}" for i in range(1000)))
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 200
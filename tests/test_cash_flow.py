@@ -0,0 +1,98 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import numpy as np
+
+import api.src.cash_flow.service as cash_flow_service
+from api.src.cash_flow.service import CashFlowService, implied_rent, late_rates
+from api.src.utils.cache import TTLCache
+
+
+def test_implied_rent_skips_billed_months():
+    start_month = np.datetime64("2026-10", "M")
+    rows, offsets, amounts = implied_rent(
+        start_month,
+        3,
+        date(2026, 10, 16),
+        lease_ids=np.array([7, 8]),
+        start_dates=np.array(["2025-01-20", "2026-11-05"], dtype="datetime64[D]"),
+        end_dates=np.array(["NaT", "2026-11-30"], dtype="datetime64[D]"),
+        monthly_rents=np.array([1000.0, 2500.0]),
+        # Lease 7 already has a payment in November
+        billed=np.array([7 * 3 + 1]),
+    )
+    assert rows.tolist() == [0, 0, 1]
+    assert offsets.tolist() == [0, 2, 1]
+    assert amounts.tolist() == [1000.0, 1000.0, 2500.0]
+
+
+def test_implied_rent_starts_after_as_of_date():
+    # The October due date of the lease has passed already
+    rows, offsets, _ = implied_rent(
+        np.datetime64("2026-10", "M"),
+        3,
+        date(2026, 10, 16),
+        lease_ids=np.array([1]),
+        start_dates=np.array(["2026-01-10"], dtype="datetime64[D]"),
+        end_dates=np.array(["NaT"], dtype="datetime64[D]"),
+        monthly_rents=np.array([800.0]),
+        billed=np.array([], dtype=np.int64),
+    )
+    assert offsets.tolist() == [1, 2]
+
+
+def test_late_rates_fall_back_to_the_portfolio_rate():
+    rates, default = late_rates(
+        np.array([3, 1, 9, 0]),
+        history_tenant_ids=np.array([3, 1]),
+        due_amounts=np.array([1000.0, 3000.0]),
+        unpaid_amounts=np.array([500.0, 0.0]),
+    )
+    assert default == 0.125
+    assert rates.tolist() == [0.5, 0.0, 0.125, 0.125]
+
+
+def test_late_rates_without_history_are_zero():
+    rates, default = late_rates(
+        np.array([1, 2]), np.array([], dtype=np.int64), np.array([]), np.array([])
+    )
+    assert default == 0.0
+    assert rates.tolist() == [0.0, 0.0]
+
+
+class ForecastRepository:
+    """Portfolio without leases or payments; versions never change."""
+
+    def __init__(self):
+        self.forecasts = 0
+        self.summaries = SimpleNamespace(get_version=self.get_version)
+
+    async def get_version(self, owner_id=None):
+        return (2, 17)
+
+    async def get_lease_version(self, owner_id=None):
+        return (1, 1)
+
+    async def get_lease_months(self, *args, owner_id=None):
+        self.forecasts += 1
+        return []
+
+    async def get_active_leases(self, *args, owner_id=None):
+        return []
+
+    async def get_tenant_arrears(self, *args, owner_id=None):
+        return []
+
+
+def test_only_forecasts_of_one_owner_are_cached(monkeypatch):
+    monkeypatch.setattr(
+        cash_flow_service, "FORECAST_CACHE", TTLCache(maxsize=4, ttl=60)
+    )
+    service = CashFlowService(None)
+    service.repository = ForecastRepository()
+
+    for owner_id in (5, 5, None, None):
+        asyncio.run(service.get_forecast(months=3, owner_id=owner_id))
+    # Lease-less payments in the forecast of all owners have no summary
+    assert service.repository.forecasts == 3
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import DBAPIError
+
+from api.src.idempotency.models import IdempotencyKey
+from api.src.idempotency.service import (
+    REPLAYED_HEADER,
+    IdempotencyService,
+    _digest,
+    request_fingerprint,
+)
+
+
+class FakeRepository:
+    def __init__(self, claimed=True, stored=None, claim_error=None):
+        self.claimed = claimed
+        self.stored = stored
+        self.claim_error = claim_error
+        self.completed = []
+
+    async def set_lock_timeout(self, milliseconds):
+        pass
+
+    async def claim(self, user_id, key_hash, request_hash, expires_at):
+        if self.claim_error:
+            raise self.claim_error
+        return self.claimed
+
+    async def get(self, user_id, key_hash):
+        return self.stored
+
+    async def complete(self, user_id, key_hash, status_code, response):
+        self.completed.append((status_code, response))
+
+
+@pytest.fixture
+def make_service(fake_session):
+    def make(repository):
+        service = IdempotencyService(fake_session)
+        service.repository = repository
+        return service
+
+    return make
+
+
+def run(service, key, request, calls, status_code=200):
+    async def handler():
+        calls.append(request)
+        return {"id": len(calls)}
+
+    return asyncio.run(
+        service.run(key, 1, "create_payment", request, handler, status_code)
+    )
+
+
+def test_request_without_key_runs_unchanged(make_service):
+    repository = FakeRepository()
+    service, calls = make_service(repository), []
+    assert run(service, None, {"amount": 10}, calls) == {"id": 1}
+    assert repository.completed == []
+    assert service.session.commits == 0
+
+
+def test_first_request_stores_its_response(make_service):
+    repository = FakeRepository()
+    service, calls = make_service(repository), []
+    assert run(service, "abc", {"amount": 10}, calls, status_code=201) == {"id": 1}
+    assert repository.completed == [(201, {"id": 1})]
+    assert service.session.commits == 1
+
+
+def test_retry_replays_the_stored_response(make_service):
+    stored = IdempotencyKey(
+        request_hash=request_fingerprint({"amount": 10}),
+        status_code=201,
+        response={"id": 7},
+    )
+    service, calls = make_service(FakeRepository(claimed=False, stored=stored)), []
+    response = run(service, "abc", {"amount": 10}, calls)
+    assert calls == []
+    assert isinstance(response, JSONResponse)
+    assert response.status_code == 201
+    assert response.body == b'{"id":7}'
+    assert response.headers[REPLAYED_HEADER] == "true"
+
+
+def test_key_reused_for_a_different_request_is_rejected(make_service):
+    stored = IdempotencyKey(
+        request_hash=request_fingerprint({"amount": 10}),
+        status_code=201,
+        response={"id": 7},
+    )
+    service, calls = make_service(FakeRepository(claimed=False, stored=stored)), []
+    with pytest.raises(HTTPException) as error:
+        run(service, "abc", {"amount": 20}, calls)
+    assert error.value.status_code == 422
+    assert calls == []
+
+
+def test_failed_request_releases_the_key(make_service):
+    repository = FakeRepository()
+    service = make_service(repository)
+
+    async def handler():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.run("abc", 1, "create_payment", {}, handler))
+    assert repository.completed == []
+    assert service.session.rollbacks == 1
+    assert service.session.commits == 0
+
+
+def test_request_still_running_after_wait_is_a_conflict(make_service):
+    class LockNotAvailable(Exception):
+        sqlstate = "55P03"
+
+    error = DBAPIError("INSERT", {}, LockNotAvailable())
+    service, calls = make_service(FakeRepository(claim_error=error)), []
+    with pytest.raises(HTTPException) as raised:
+        run(service, "abc", {}, calls)
+    assert raised.value.status_code == 409
+    assert calls == []
+
+
+def test_fingerprint_ignores_key_order_and_keys_are_scoped_per_endpoint():
+    assert request_fingerprint({"a": 1, "b": 2}) == request_fingerprint(
+        {"b": 2, "a": 1}
+    )
+    assert _digest("create_payment", "abc") != _digest("bulk", "abc")
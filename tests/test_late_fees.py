@@ -0,0 +1,41 @@
+from datetime import date
+
+import numpy as np
+
+from api.src.late_fees.service import compute_late_fees
+
+
+def fees(due_dates, amounts=None, rates=None, flat=None, grace=None):
+    count = len(due_dates)
+    return compute_late_fees(
+        date(2026, 9, 1),
+        date(2026, 9, 30),
+        np.array(due_dates, dtype="datetime64[D]"),
+        np.array(amounts or [1000.0] * count),
+        np.array(rates or [0.0] * count),
+        np.array(flat or [0.0] * count),
+        np.array(grace or [0] * count),
+    )
+
+
+def test_interest_accrues_for_days_of_delay_within_the_period():
+    cents = fees(
+        ["2026-08-10", "2026-09-10", "2026-09-30"],
+        rates=[36.5, 36.5, 36.5],
+    )
+    # 1000 at 36.5% a year is 1.00 a day: whole September, 20 days, none
+    assert cents.tolist() == [3000.0, 2000.0, 0.0]
+
+
+def test_grace_days_delay_interest():
+    cents = fees(["2026-09-10"], rates=[36.5], grace=[5])
+    assert cents.tolist() == [1500.0]
+
+
+def test_flat_fee_is_charged_in_the_month_the_delay_starts():
+    cents = fees(
+        ["2026-08-10", "2026-09-10", "2026-08-31", "2026-09-27"],
+        flat=[50.0] * 4,
+        grace=[0, 0, 0, 3],
+    )
+    assert cents.tolist() == [0.0, 5000.0, 5000.0, 0.0]
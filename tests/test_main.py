@@ -9,3 +9,8 @@ def test_health_check():
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
+
+
+def test_password_hashing_metrics_require_a_login():
+    response = client.get("/metrics/password-hashing")
+    assert response.status_code == 401
@@ -0,0 +1,175 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+import api.src.files.models  # noqa: F401
+import api.src.ownership.service as service_module
+import api.src.profile_pictures.models  # noqa: F401
+import api.src.users.models  # noqa: F401
+from api.core.exceptions import BusinessRuleViolationException
+from api.core.security import Principal
+from api.src.enums import EnumUserRoles
+from api.src.leases import routes as lease_routes
+from api.src.ownership.repository import ownership_query
+from api.src.ownership.service import OwnershipService
+from api.src.payments import routes
+from api.src.payments.repository import PaymentRepository
+from api.src.payments.schemas import (
+    BulkPaymentOperation,
+    PaymentCreate,
+    PaymentUpdate,
+)
+from api.src.payments.service import PaymentService
+from api.src.properties.repository import PropertyRepository
+from api.src.properties.schemas import PropertyUpdate
+from api.src.tenants import routes as tenant_routes
+from api.src.utils.cache import TTLCache
+
+ADMIN = Principal(1, EnumUserRoles.ADMIN, "admin@example.com", "s1")
+OWNER = Principal(5, EnumUserRoles.OWNER, "owner@example.com", "s2")
+TENANT = Principal(9, EnumUserRoles.TENANT, "tenant@example.com", "s3")
+
+
+@pytest.fixture
+def owned(fake_session) -> set:
+    """(owner, resource ID) pairs the EXISTS queries of fake_session find."""
+    owned = {(5, 7)}
+
+    def answer(query) -> bool:
+        params = query.compile().params
+        resource_id = params.get("id_1", params.get("tenant_id_1"))
+        return (params["owner_id_1"], resource_id) in owned
+
+    fake_session.answer = answer
+    return owned
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    cache = TTLCache(maxsize=16, ttl=30)
+    monkeypatch.setattr(service_module, "OWNERSHIP_CACHE", cache)
+    return cache
+
+
+def sql(resource: str) -> str:
+    query = ownership_query(resource, 5, 7).exists().select()
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.parametrize("resource", ["property", "unit", "lease", "payment"])
+def test_checks_are_one_exists_query_by_primary_key(resource):
+    statement = sql(resource)
+    assert statement.startswith("SELECT EXISTS (SELECT")
+    assert statement.count("SELECT") == 2
+    assert "owner_id = %(owner_id_1)s" in statement
+    assert ".id = %(id_1)s" in statement
+
+
+def test_tenant_check_follows_the_tenants_leases():
+    statement = sql("tenant")
+    assert "leases.tenant_id = %(tenant_id_1)s" in statement
+    assert "properties.owner_id = %(owner_id_1)s" in statement
+
+
+def test_unknown_resource_is_rejected():
+    with pytest.raises(ValueError):
+        ownership_query("building", 5, 7)
+
+
+def test_grants_are_cached_and_denials_are_not(fake_session, owned):
+    ownership = OwnershipService(fake_session)
+
+    assert asyncio.run(ownership.owns("unit", 5, 7))
+    assert asyncio.run(ownership.owns("unit", 5, 7))
+    assert len(fake_session.statements) == 1
+
+    assert not asyncio.run(ownership.owns("unit", 5, 8))
+    owned.add((5, 8))
+    assert asyncio.run(ownership.owns("unit", 5, 8))
+    assert len(fake_session.statements) == 3
+
+
+def test_authorize_allows_admins_and_owners_only(fake_session, owned):
+    ownership = OwnershipService(fake_session)
+
+    asyncio.run(ownership.authorize(ADMIN, "lease", 8, detail="denied"))
+    asyncio.run(ownership.authorize(OWNER, "lease", 7, detail="denied"))
+    assert len(fake_session.statements) == 1
+
+    for user, lease_id in ((OWNER, 8), (TENANT, 7)):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(ownership.authorize(user, "lease", lease_id, detail="denied"))
+        assert error.value.status_code == 403
+        assert error.value.detail == "denied"
+
+
+def test_owners_cannot_leave_payments_without_a_lease(fake_session, owned):
+    ownership = OwnershipService(fake_session)
+    payment = PaymentCreate(
+        document_type="Rent Invoice",
+        gross_value=100,
+        due_date=date(2025, 1, 1),
+        receiver="tenant@example.com",
+    )
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(
+            routes.create_payment(
+                payment, None, None, ownership, None, current_user=OWNER
+            )
+        )
+    assert error.value.status_code == 422
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(
+            routes.update_payment(
+                7, PaymentUpdate(lease_id=None), None, ownership, OWNER
+            )
+        )
+    assert error.value.status_code == 422
+
+    operation = BulkPaymentOperation(
+        action="update", payment_ids=[7], data=PaymentUpdate(lease_id=None)
+    )
+    service = PaymentService(fake_session)
+    with pytest.raises(BusinessRuleViolationException):
+        asyncio.run(service._apply_bulk_operation(operation, owner_id=5))
+
+
+def test_owner_change_drops_the_cached_grants(fake_session, owned, cache, monkeypatch):
+    async def execute(statement):
+        return SimpleNamespace(rowcount=1)
+
+    async def skip(*args, **kwargs):
+        return None
+
+    fake_session.execute = execute
+    repository = PropertyRepository(fake_session)
+    monkeypatch.setattr(repository, "get_by_id", skip)
+    monkeypatch.setattr(PaymentRepository, "sync_ownership", skip)
+    ownership = OwnershipService(fake_session)
+    assert asyncio.run(ownership.owns("property", 5, 7))
+
+    asyncio.run(repository.update(7, PropertyUpdate(price=1000)))
+    assert len(cache) == 1
+
+    owned.clear()
+    asyncio.run(repository.update(7, PropertyUpdate(owner_id=6)))
+    assert len(cache) == 0
+    assert not asyncio.run(ownership.owns("property", 5, 7))
+
+
+def test_ledgers_of_foreign_leases_and_tenants_are_forbidden(fake_session, owned):
+    ownership = OwnershipService(fake_session)
+    denied = [
+        lease_routes.get_lease_ledger(8, ownership=ownership, current_user=OWNER),
+        tenant_routes.get_tenant_ledger(8, ownership=ownership, current_user=OWNER),
+        tenant_routes.get_tenant_ledger(8, ownership=ownership, current_user=TENANT),
+    ]
+    for ledger in denied:
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(ledger)
+        assert error.value.status_code == 403
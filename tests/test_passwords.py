@@ -0,0 +1,70 @@
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+from passlib.hash import argon2
+
+from api.core.passwords import PasswordHasher, build_password_context
+
+BCRYPT_COST_4 = "$2b$04$" + "a" * 53
+
+
+def sha256_context(rounds: int) -> CryptContext:
+    return CryptContext(
+        schemes=["sha256_crypt"],
+        sha256_crypt__default_rounds=rounds,
+        sha256_crypt__min_rounds=rounds,
+        sha256_crypt__max_rounds=rounds,
+    )
+
+
+def test_hashes_with_another_cost_or_scheme_are_outdated():
+    assert not build_password_context(bcrypt_rounds=4).needs_update(BCRYPT_COST_4)
+    assert build_password_context(bcrypt_rounds=12).needs_update(BCRYPT_COST_4)
+
+    if argon2.has_backend():
+        assert build_password_context("argon2").needs_update(BCRYPT_COST_4)
+    else:
+        with pytest.raises(RuntimeError):
+            build_password_context("argon2")
+
+
+def test_outdated_hash_is_replaced_on_verification():
+    old_hash = PasswordHasher(sha256_context(1000), workers=1).context.hash("secret")
+    hasher = PasswordHasher(sha256_context(2000), workers=1)
+
+    verified, new_hash = asyncio.run(hasher.verify_and_update("secret", old_hash))
+    assert verified
+    assert "rounds=2000" in new_hash
+    assert asyncio.run(hasher.verify_and_update("secret", new_hash)) == (True, None)
+    assert asyncio.run(hasher.verify_and_update("wrong", new_hash)) == (False, None)
+    assert hasher.metrics.verifications == 3
+    assert hasher.metrics.rehashes == 1
+
+
+def test_hashing_runs_off_the_event_loop_and_queues_beyond_the_workers():
+    hasher = PasswordHasher(sha256_context(1000), workers=2)
+    release = threading.Event()
+    threads = set()
+
+    def slow_hash(password: str) -> str:
+        threads.add(threading.current_thread().name)
+        release.wait(5)
+        return password
+
+    hasher.context = type("Context", (), {"hash": staticmethod(slow_hash)})()
+
+    async def burst() -> list[str]:
+        tasks = [asyncio.create_task(hasher.hash(str(i))) for i in range(5)]
+        await asyncio.sleep(0.05)
+        assert hasher.metrics.in_progress == 2
+        assert hasher.metrics.queue_depth == 3
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(burst()) == ["0", "1", "2", "3", "4"]
+    assert threads and all(name.startswith("password-hash") for name in threads)
+    assert hasher.metrics.hashes == 5
+    assert hasher.metrics.in_progress == hasher.metrics.queue_depth == 0
+    assert hasher.metrics.wait_seconds_max > 0
@@ -0,0 +1,44 @@
+from datetime import date
+
+from api.src.payment_analytics.schemas import AnalyticsFigures, AnalyticsPeriod
+from api.src.payment_analytics.service import (
+    bucket_starts,
+    percent_change,
+    previous_range,
+)
+
+
+def test_previous_range_has_the_same_length():
+    assert previous_range(date(2026, 5, 1), date(2026, 5, 14)) == (
+        date(2026, 4, 17),
+        date(2026, 4, 30),
+    )
+    assert previous_range(date(2026, 3, 1), date(2026, 3, 1)) == (
+        date(2026, 2, 28),
+        date(2026, 2, 28),
+    )
+
+
+def test_bucket_starts_cover_the_range():
+    start, end = date(2026, 11, 18), date(2027, 1, 5)
+    assert len(bucket_starts(start, end, AnalyticsPeriod.DAILY)) == 49
+    # 2026-11-18 is a Wednesday, weeks start on Monday like date_trunc
+    weeks = bucket_starts(start, end, AnalyticsPeriod.WEEKLY)
+    assert weeks[0] == date(2026, 11, 16)
+    assert weeks[-1] == date(2027, 1, 4)
+    assert bucket_starts(start, end, AnalyticsPeriod.MONTHLY) == [
+        date(2026, 11, 1),
+        date(2026, 12, 1),
+        date(2027, 1, 1),
+    ]
+
+
+def test_percent_change_skips_empty_previous_figures():
+    change = percent_change(
+        AnalyticsFigures(amount=1500, paid_amount=900, payment_count=3),
+        AnalyticsFigures(amount=1000, paid_amount=0, payment_count=2),
+    )
+    assert change.amount == 50.0
+    assert change.payment_count == 50.0
+    assert change.paid_amount is None
+    assert change.overdue_amount is None
@@ -0,0 +1,71 @@
+import asyncio
+import csv
+import io
+import struct
+import zipfile
+from datetime import date, datetime
+from xml.etree import ElementTree
+
+from api.src.payments import export
+from api.src.payments.export import stream_csv, stream_xlsx
+
+HEADERS = ["id", "receiver", "due_date", "gross_value", "is_paid"]
+ROWS = [
+    (1, 'Kowalski, "Jan"', date(2026, 5, 1), 1200.5, True),
+    (2, "line\nbreak <b> & \x00\x0bcontrol", datetime(2026, 5, 2, 12), None, False),
+]
+NS = {"x": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+
+async def rows(values):
+    for row in values:
+        yield row
+
+
+def collect(stream) -> list[bytes]:
+    async def consume():
+        return [chunk async for chunk in stream]
+
+    return asyncio.run(consume())
+
+
+def test_csv_has_a_bom_and_quotes_values():
+    content = b"".join(collect(stream_csv(HEADERS, rows(ROWS)))).decode()
+    assert content.startswith("\ufeff")
+    assert list(csv.reader(io.StringIO(content[1:]))) == [
+        HEADERS,
+        ["1", 'Kowalski, "Jan"', "2026-05-01", "1200.5", "True"],
+        ["2", "line\nbreak <b> & \x00\x0bcontrol", "2026-05-02T12:00:00", "", "False"],
+    ]
+
+
+def test_csv_is_yielded_in_chunks(monkeypatch):
+    monkeypatch.setattr(export, "CHUNK_ROWS", 1)
+    chunks = collect(stream_csv(HEADERS, rows(ROWS)))
+    assert len(chunks) == 3
+
+
+def test_xlsx_is_a_valid_workbook_without_illegal_characters():
+    content = b"".join(collect(stream_xlsx(HEADERS, rows(ROWS))))
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.testzip() is None
+        for name in archive.namelist():
+            ElementTree.fromstring(archive.read(name))
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+
+    cells = [row.findall("x:c", NS) for row in sheet.findall("x:sheetData/x:row", NS)]
+    assert [cell.find("x:is/x:t", NS).text for cell in cells[0]] == HEADERS
+    assert cells[1][1].find("x:is/x:t", NS).text == 'Kowalski, "Jan"'
+    assert cells[1][2].get("s") == "1"
+    assert cells[1][4].find("x:v", NS).text == "1"
+    assert cells[2][1].find("x:is/x:t", NS).text == "line\nbreak <b> & control"
+    assert cells[2][2].get("s") == "2"
+    assert cells[2][3].find("x:v", NS) is None
+
+
+def test_xlsx_sheet_has_zip64_sizes():
+    content = b"".join(collect(stream_xlsx(HEADERS, rows(ROWS))))
+    # The first occurrence of the name is in the sheet's local file header
+    header = content.index(b"xl/worksheets/sheet1.xml") - 30
+    (version_needed,) = struct.unpack_from("<H", content, header + 4)
+    assert version_needed == zipfile.ZIP64_VERSION
@@ -0,0 +1,104 @@
+"""Running balances of the payment ledger, run against an in-memory SQLite.
+
+The ledger query is portable SQL (window function, row value comparison),
+so a minimal payments table is enough to check the balances it computes.
+"""
+
+import asyncio
+import re
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+import api.src.files.models  # noqa: F401
+import api.src.profile_pictures.models  # noqa: F401
+import api.src.users.models  # noqa: F401
+from api.src.payments.repository import PaymentRepository
+
+# (id, due date, amount, paid) of lease 1, and a payment of another lease
+PAYMENTS = [
+    (1, date(2026, 1, 1), 100, True),
+    (2, date(2026, 2, 1), 100, False),
+    (3, date(2026, 3, 1), 100, True),
+    (4, date(2026, 4, 1), 100, False),
+    (5, date(2026, 5, 1), 100, False),
+    (6, date(2026, 2, 1), 500, False),
+]
+
+
+class SyncSession:
+    """Runs statements of an async repository on a synchronous connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return self.connection.execute(statement)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE payments (id INTEGER PRIMARY KEY, due_date DATE, "
+                "document_type VARCHAR, description VARCHAR, lease_id INTEGER, "
+                "is_paid BOOLEAN, gross_value FLOAT)"
+            )
+        )
+        connection.execute(
+            text(
+                "INSERT INTO payments VALUES "
+                "(:id, :due_date, 'Rent Invoice', NULL, :lease_id, :paid, :amount)"
+            ),
+            [
+                {
+                    "id": id_,
+                    "due_date": due_date.isoformat(),
+                    "lease_id": 2 if id_ == 6 else 1,
+                    "paid": paid,
+                    "amount": amount,
+                }
+                for id_, due_date, amount, paid in PAYMENTS
+            ],
+        )
+        yield SyncSession(connection)
+
+
+def ledger(session, **kwargs):
+    return asyncio.run(PaymentRepository(session).get_ledger(lease_id=1, **kwargs))
+
+
+def balances(page) -> list:
+    return [(row.id, row.balance) for row in page.items]
+
+
+def test_running_balance_continues_across_pages(session):
+    first = ledger(session, limit=2, include_total=True)
+    second = ledger(session, limit=2, cursor=first.next_cursor)
+
+    assert first.total == 5
+    assert balances(first) == [(1, Decimal("0")), (2, Decimal("100"))]
+    assert balances(second) == [(3, Decimal("100")), (4, Decimal("200"))]
+    assert second.next_cursor is not None
+
+
+def test_opening_balance_covers_entries_before_the_start_date(session):
+    page = ledger(session, start_date=date(2026, 3, 1), end_date=date(2026, 4, 30))
+    assert balances(page) == [(3, Decimal("100")), (4, Decimal("200"))]
+    assert page.next_cursor is None
+
+
+def test_window_only_spans_the_page(session):
+    ledger(session, limit=2)
+    (statement,) = session.statements
+    sql = " ".join(str(statement.compile(dialect=postgresql.dialect())).split())
+    assert "OVER (ORDER BY page.due_date, page.id)" in sql
+    assert re.search(r"LIMIT %\(param_\d+\)s\) AS page ORDER BY", sql)
+    assert sql.endswith("ORDER BY page.due_date, page.id")
@@ -0,0 +1,184 @@
+"""Statements issued by the payment endpoints.
+
+Requests go through the payments router with a session that records the
+statements instead of running them, so every database round trip an
+endpoint makes is counted without a database.
+"""
+
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+import api.src.files.models  # noqa: F401
+import api.src.profile_pictures.models  # noqa: F401
+from api.core.database import get_session
+from api.core.security import get_current_user
+from api.src.enums import EnumUserRoles
+from api.src.payments.models import Payment
+from api.src.payments.repository import search_condition
+from api.src.payments.routes import router
+from api.src.users.models import User
+
+DUE_DATE = date(2026, 5, 1)
+UNPAID = (3, False, DUE_DATE, 1200.0)
+PAID = (3, True, DUE_DATE, 1200.0)
+
+
+class RecordedResult:
+    def __init__(self, rows: list):
+        self.rows = rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def all(self) -> list:
+        return self.rows
+
+    def unique(self) -> "RecordedResult":
+        return self
+
+    def scalar_one(self):
+        return self.rows[0][0]
+
+    def scalar_one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+
+class RecordingSession:
+    """Records compiled statements and answers them with canned rows."""
+
+    def __init__(self, returning: tuple = ()):
+        self.returning = returning
+        self.statements: list[str] = []
+
+    async def execute(self, statement, params=None) -> RecordedResult:
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        if sql.startswith(("UPDATE payments", "DELETE FROM payments")):
+            return RecordedResult([(1, *self.returning)])
+        if sql.startswith("INSERT INTO payments "):
+            return RecordedResult([(1,)])
+        if sql.startswith("SELECT payments.id"):
+            return RecordedResult([self.payment()])
+        return RecordedResult([])
+
+    def payment(self) -> Payment:
+        return Payment(
+            id=1,
+            document_type="Rent Invoice",
+            gross_value=1200.0,
+            due_date=DUE_DATE,
+            receiver="Jane Doe",
+            is_paid=True,
+            created_at=datetime(2026, 4, 1),
+            lease=None,
+            invoice_file=None,
+        )
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+class ConflictingSession(RecordingSession):
+    """Fails every payment update like a violated unique constraint."""
+
+    async def execute(self, statement, params=None) -> RecordedResult:
+        result = await super().execute(statement, params)
+        if self.statements[-1].startswith("UPDATE payments"):
+            raise IntegrityError(self.statements[-1], params, Exception("duplicate"))
+        return result
+
+
+def client(session: RecordingSession) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_session] = lambda: session
+    app.dependency_overrides[get_current_user] = lambda: User(
+        id=1, role=EnumUserRoles.ADMIN
+    )
+    return TestClient(app)
+
+
+def request(method: str, path: str, json=None, returning: tuple = ()):
+    session = RecordingSession(returning)
+    response = client(session).request(method, path, json=json)
+    assert response.status_code < 300, response.text
+    return session.statements
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "json", "returning", "expected"),
+    [
+        ("GET", "/payments/1", None, (), 1),
+        # Status changes: UPDATE, summary lock and upsert, reload
+        ("PATCH", "/payments/1/mark-paid", None, UNPAID + PAID, 4),
+        ("PATCH", "/payments/1/mark-unpaid", None, PAID + UNPAID, 4),
+        ("PATCH", "/payments/1/status", {"is_paid": True}, UNPAID + PAID, 4),
+        ("PUT", "/payments/1", {"lease_id": 4}, PAID + (4, *PAID[1:]), 4),
+        # Summaries are left alone when the summarized figures do not change
+        ("PATCH", "/payments/1/mark-paid", None, PAID + PAID, 2),
+        (
+            "PATCH",
+            "/payments/1/attach-invoice",
+            {"invoice_file_id": 9},
+            UNPAID + UNPAID,
+            2,
+        ),
+        ("DELETE", "/payments/1", None, UNPAID, 3),
+        (
+            "POST",
+            "/payments/",
+            {
+                "document_type": "Rent Invoice",
+                "gross_value": 1200,
+                "due_date": "2026-05-01",
+                "receiver": "Jane Doe",
+                "lease_id": 3,
+            },
+            (),
+            4,
+        ),
+    ],
+)
+def test_statement_count(method, path, json, returning, expected):
+    assert len(request(method, path, json, returning)) == expected
+
+
+def test_update_resolves_ownership_in_the_update_statement():
+    statements = request("PUT", "/payments/1", {"lease_id": 4}, PAID + (4, *PAID[1:]))
+    assert statements[0].startswith("UPDATE payments")
+    assert "owner_id=(SELECT properties.owner_id" in statements[0]
+    assert "RETURNING" in statements[0]
+
+
+def test_update_into_an_existing_period_is_a_conflict():
+    response = client(ConflictingSession()).put(
+        "/payments/1", json={"due_date": "2026-06-01"}
+    )
+    assert response.status_code == 409
+
+
+def test_reload_skips_invoice_contents():
+    (statement,) = request("GET", "/payments/1")
+    assert "files_1.filename" in statement
+    assert "files_1.data" not in statement
+
+
+def test_search_matches_word_prefixes_and_receiver_substrings():
+    condition = search_condition(" Kowal 50%_rent ")
+    sql = str(condition.compile(dialect=postgresql.dialect()))
+    params = condition.compile(dialect=postgresql.dialect()).params
+    assert "payments.search_vector @@ to_tsquery(CAST(" in sql
+    assert "payments.receiver ILIKE" in sql
+    assert sorted(map(str, params.values())) == [
+        "%Kowal 50/%/_rent%",
+        "kowal:* & 50:* & rent:*",
+        "simple",
+    ]
@@ -0,0 +1,88 @@
+from datetime import date
+
+from api.src.payments.schedule import build_schedule, compute_schedules
+from api.src.payments.schemas import PaymentFrequency
+
+
+def test_monthly_due_dates_clamp_to_month_end():
+    schedule = build_schedule(
+        date(2024, 1, 15),
+        date(2024, 5, 31),
+        PaymentFrequency.MONTHLY,
+        31,
+        period_amount=1000,
+    )
+    assert [due_date for due_date, _ in schedule] == [
+        date(2024, 1, 31),
+        date(2024, 2, 29),
+        date(2024, 3, 31),
+        date(2024, 4, 30),
+        date(2024, 5, 31),
+    ]
+    assert {amount for _, amount in schedule} == {1000.0}
+
+
+def test_yearly_leap_day_clamps_to_february_28():
+    schedule = build_schedule(
+        date(2024, 2, 29),
+        date(2026, 12, 31),
+        PaymentFrequency.YEARLY,
+        29,
+        period_amount=100,
+    )
+    assert [due_date for due_date, _ in schedule] == [
+        date(2024, 2, 29),
+        date(2025, 2, 28),
+        date(2026, 2, 28),
+    ]
+
+
+def test_total_split_is_cent_exact():
+    schedule = build_schedule(
+        date(2024, 1, 1),
+        date(2024, 12, 31),
+        PaymentFrequency.QUARTERLY,
+        1,
+        total_amount=100.01,
+    )
+    amounts = [amount for _, amount in schedule]
+    assert amounts == [25.01, 25.0, 25.0, 25.0]
+
+    schedule = build_schedule(
+        date(2024, 1, 1),
+        date(2024, 6, 30),
+        PaymentFrequency.MONTHLY,
+        1,
+        total_amount=1000,
+    )
+    assert round(sum(amount for _, amount in schedule) * 100) == 100000
+
+
+def test_prorated_first_and_last_periods():
+    schedule = build_schedule(
+        date(2024, 3, 17),
+        date(2024, 5, 15),
+        PaymentFrequency.MONTHLY,
+        1,
+        period_amount=3100,
+        prorate=True,
+    )
+    assert schedule[0] == (date(2024, 3, 17), 1500.0)
+    assert schedule[1] == (date(2024, 4, 1), 3100.0)
+    assert schedule[2][0] == date(2024, 5, 1)
+    assert schedule[2][1] == 1500.0
+
+
+def test_schedules_for_many_rows():
+    schedule = compute_schedules(
+        [date(2024, 1, 1), date(2024, 6, 1), date(2024, 3, 10)],
+        [date(2024, 3, 31), date(2024, 5, 31), date(2024, 4, 9)],
+        [1, 1, 10],
+        period_amounts=[100, 200, 300],
+    )
+    assert schedule.to_list() == [
+        (0, date(2024, 1, 1), 100.0),
+        (0, date(2024, 2, 1), 100.0),
+        (0, date(2024, 3, 1), 100.0),
+        (2, date(2024, 3, 10), 300.0),
+    ]
@@ -0,0 +1,88 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+import api.src.files.models  # noqa: F401
+import api.src.payments.service as payments_service
+import api.src.profile_pictures.models  # noqa: F401
+import api.src.users.models  # noqa: F401
+from api.src.payment_summaries.repository import (
+    PaymentFigures,
+    PaymentSummaryRepository,
+)
+from api.src.payments.service import PaymentService
+from api.src.utils.cache import TTLCache
+
+NEXT_VERSION = "version=nextval('payment_summaries_version_seq')"
+
+
+class Result:
+    def __init__(self, row=(0, 0)):
+        self.row = row
+        self.rowcount = 0
+
+    def one(self):
+        return self.row
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.statements.append(" ".join(sql.split()).replace(" = ", "="))
+        return Result((2, 17))
+
+
+def test_every_summary_write_draws_a_new_version():
+    session = RecordingSession()
+    repository = PaymentSummaryRepository(session)
+
+    asyncio.run(
+        repository.apply(added=[PaymentFigures(3, False, date(2026, 5, 1), 1200.0)])
+    )
+    asyncio.run(repository.age())
+
+    upsert = session.statements[1]
+    assert upsert.startswith("INSERT INTO payment_summaries")
+    assert upsert.endswith(NEXT_VERSION)
+    assert NEXT_VERSION in session.statements[-1]
+
+
+def test_version_sums_the_row_versions_of_an_owner():
+    session = RecordingSession()
+    version = asyncio.run(PaymentSummaryRepository(session).get_version(owner_id=5))
+
+    assert version == (2, 17)
+    (statement,) = session.statements
+    assert "coalesce(sum(payment_summaries.version)" in statement
+    assert "WHERE payment_summaries.owner_id=%(owner_id_1)s" in statement
+
+
+class AgingRepository:
+    """Counts aging queries; summary versions never change."""
+
+    def __init__(self):
+        self.queries = 0
+        self.summaries = SimpleNamespace(get_version=self.get_version)
+
+    async def get_version(self, owner_id=None):
+        return (2, 17)
+
+    async def get_aging(self, owner_id, as_of_date):
+        self.queries += 1
+        return []
+
+
+def test_only_reports_of_one_owner_are_cached(monkeypatch):
+    monkeypatch.setattr(payments_service, "AGING_CACHE", TTLCache(maxsize=4, ttl=60))
+    service = PaymentService(None)
+    service.repository = AgingRepository()
+
+    for owner_id in (5, 5, None, None):
+        asyncio.run(service.get_aging_report(owner_id=owner_id))
+    # Lease-less payments in the report of all owners have no summary
+    assert service.repository.queries == 3
@@ -0,0 +1,104 @@
+import io
+from datetime import date
+
+from api.src.reconciliation.matching import OpenPayment, match_lines, normalize_name
+from api.src.reconciliation.statements import (
+    StatementLine,
+    parse_amount,
+    parse_statement,
+)
+
+MT940 = """:20:STATEMENT1
+:25:DE89370400440532013000
+:28C:00001/001
+:60F:C260501EUR1000,00
+:61:2605030503CR1200,00NTRFNONREF
+:86:/EREF/NOTPROVIDED/NAME/Doe, John/REMI/Rent May payment 42
+:61:2605040504DR50,00NTRFNONREF
+:86:/NAME/Landlord Insurance/REMI/Premium
+:61:260505C1250,50NTRFNONREF
+:86:166?00GUTSCHRIFT?20Miete Mai?21Wohnung 3?32MUELLER?33ANNA
+:62F:C260505EUR3400,50
+"""
+
+CSV = """Booking date;Amount;Name;Reference
+03.05.2026;1.200,00;John Doe;Rent May
+04.05.2026;-50,00;Insurance;Premium
+05.05.2026;900,00;Jane Roe;
+"""
+
+
+def test_parse_amount_accepts_both_decimal_separators():
+    assert parse_amount("1.234,56") == 123456
+    assert parse_amount("1,234.56") == 123456
+    assert parse_amount("1200") == 120000
+    assert parse_amount("1200,5") == 120050
+
+
+def test_parse_mt940_yields_credits_with_counterparty_and_reference():
+    statement_format, lines = parse_statement(
+        io.BytesIO(MT940.encode()), "statement.sta"
+    )
+    lines = list(lines)
+
+    assert statement_format == "mt940"
+    assert [(line.booking_date, line.amount_cents) for line in lines] == [
+        (date(2026, 5, 3), 120000),
+        (date(2026, 5, 5), 125050),
+    ]
+    assert lines[0].counterparty == "Doe, John"
+    assert lines[0].reference == "Rent May payment 42"
+    assert lines[1].counterparty == "MUELLERANNA"
+    assert lines[1].reference == "Miete MaiWohnung 3"
+
+
+def test_parse_csv_detects_delimiter_and_skips_debits():
+    statement_format, lines = parse_statement(io.BytesIO(CSV.encode()), "export.csv")
+    lines = list(lines)
+
+    assert statement_format == "csv"
+    assert [
+        (line.line_number, line.amount_cents, line.counterparty) for line in lines
+    ] == [(2, 120000, "John Doe"), (4, 90000, "Jane Roe")]
+
+
+def test_normalize_name_ignores_case_accents_and_order():
+    assert normalize_name("DOE, JOHN") == normalize_name("John Doe")
+    assert normalize_name("José Núñez") == normalize_name("nunez jose")
+
+
+def test_match_lines_classifies_transfers():
+    payments = [
+        OpenPayment(1, 120000, "John Doe", date(2026, 5, 1)),
+        # Two open months for the same tenant and amount
+        OpenPayment(2, 90000, "Jane Roe", date(2026, 4, 1)),
+        OpenPayment(3, 90000, "Jane Roe", date(2026, 5, 1)),
+        # Referenced by ID in the transfer
+        OpenPayment(4, 50000, "Max Mustermann", date(2026, 3, 1)),
+        OpenPayment(5, 50000, "Max Mustermann", date(2026, 5, 1)),
+        # Both due close to the booking date
+        OpenPayment(6, 30000, "Ann Lee", date(2026, 5, 1)),
+        OpenPayment(7, 30000, "Ann Lee", date(2026, 5, 8)),
+    ]
+    lines = [
+        StatementLine(1, date(2026, 5, 3), 120000, "DOE JOHN", ""),
+        StatementLine(2, date(2026, 5, 3), 90000, "Jane Roe", "rent"),
+        StatementLine(3, date(2026, 5, 3), 50000, "Max Mustermann", "Payment 4"),
+        StatementLine(4, date(2026, 5, 3), 30000, "Ann Lee", ""),
+        StatementLine(5, date(2026, 5, 3), 120000, "John Doe", ""),
+        StatementLine(6, date(2026, 5, 3), 70000, "Unknown", ""),
+    ]
+
+    result = match_lines(lines, payments)
+
+    assert [(line.line_number, payment.id) for line, payment in result.matched] == [
+        (1, 1),
+        (2, 3),
+        (3, 4),
+    ]
+    assert [
+        (line.line_number, [payment.id for payment in candidates])
+        for line, candidates in result.ambiguous
+    ] == [(4, [6, 7])]
+    # Payment 1 was already matched by the first transfer
+    assert [line.line_number for line in result.unmatched] == [5, 6]
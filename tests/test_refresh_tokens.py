@@ -0,0 +1,153 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+import api.src.refresh_tokens.service as service_module
+import api.src.users.service as users_service_module
+from api.core.config import settings
+from api.src.enums import EnumUserRoles
+from api.src.refresh_tokens.service import RefreshTokenService, _digest
+from api.src.users.schemas import UserUpdate
+from api.src.users.service import UserService
+
+
+class FakeRepository:
+    def __init__(self):
+        self.tokens = {}
+        self.revoked = []
+        self.used = []
+
+    async def create(self, session_id, user_id, token_hash, expires_at):
+        self.tokens[token_hash] = SimpleNamespace(
+            id=len(self.tokens) + 1,
+            session_id=session_id,
+            user_id=user_id,
+            expires_at=expires_at,
+            used_at=None,
+            revoked_at=None,
+        )
+
+    async def get_for_update(self, token_hash):
+        return self.tokens.get(token_hash)
+
+    async def get_user_claims(self, user_id):
+        return SimpleNamespace(id=user_id, role=EnumUserRoles.TENANT, email="t@x.pl")
+
+    async def mark_used(self, token_id):
+        self.used.append(token_id)
+        for token in self.tokens.values():
+            if token.id == token_id:
+                token.used_at = datetime.now(timezone.utc)
+
+    async def revoke_session(self, session_id):
+        self.revoked.append(session_id)
+
+
+@pytest.fixture
+def service(monkeypatch, fake_session):
+    locally_revoked = []
+    monkeypatch.setattr(
+        service_module,
+        "revoked_sessions",
+        SimpleNamespace(add=locally_revoked.append),
+    )
+    service = RefreshTokenService(fake_session)
+    service.repository = FakeRepository()
+    service.locally_revoked = locally_revoked
+    return service
+
+
+def claims(access_token: str) -> dict:
+    return jwt.get_unverified_claims(access_token)
+
+
+def test_refresh_rotates_the_token_within_the_session(service):
+    token = asyncio.run(service.issue(7, EnumUserRoles.TENANT, "t@x.pl"))
+    session_id = claims(token.access_token)["sid"]
+    assert token.expires_in == settings.JWT_EXPIRATION * 60
+
+    rotated = asyncio.run(service.rotate(token.refresh_token))
+    assert rotated.refresh_token != token.refresh_token
+    assert claims(rotated.access_token)["sid"] == session_id
+    assert claims(rotated.access_token)["jti"] != claims(token.access_token)["jti"]
+    assert service.repository.used == [1]
+    assert service.session.commits == 2
+
+
+def test_reused_refresh_token_revokes_the_session(service):
+    token = asyncio.run(service.issue(7, EnumUserRoles.TENANT, "t@x.pl"))
+    asyncio.run(service.rotate(token.refresh_token))
+
+    # A concurrent refresh right after the rotation is only rejected
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(service.rotate(token.refresh_token))
+    assert error.value.status_code == 401
+    assert service.repository.revoked == []
+
+    stored = service.repository.tokens[_digest(token.refresh_token)]
+    stored.used_at -= timedelta(minutes=1)
+    with pytest.raises(HTTPException):
+        asyncio.run(service.rotate(token.refresh_token))
+    assert service.repository.revoked == [stored.session_id]
+    assert service.locally_revoked == [stored.session_id]
+
+
+def test_unknown_or_expired_refresh_token_is_rejected(service):
+    token = asyncio.run(service.issue(7, EnumUserRoles.TENANT, "t@x.pl"))
+    stored = service.repository.tokens[_digest(token.refresh_token)]
+    stored.expires_at = datetime.now(timezone.utc)
+
+    for refresh_token in ("unknown", token.refresh_token):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(service.rotate(refresh_token))
+        assert error.value.status_code == 401
+    assert service.repository.used == []
+
+
+class FakeUserRepository:
+    """Updates a user's role to ``role_after`` on any update."""
+
+    def __init__(self, role_before, role_after):
+        self.user = SimpleNamespace(id=7, role=role_before)
+        self.role_after = role_after
+
+    async def get_by_id(self, user_id):
+        return self.user
+
+    async def update(self, user_id, user_data):
+        self.user = SimpleNamespace(id=user_id, role=self.role_after)
+        return self.user
+
+
+@pytest.mark.parametrize(
+    ("role_after", "user_data", "revoked"),
+    [
+        (EnumUserRoles.OWNER, UserUpdate(first_name="Jan"), []),
+        (EnumUserRoles.OWNER, UserUpdate(is_active=False), [7]),
+        (EnumUserRoles.TENANT, UserUpdate(first_name="Jan"), [7]),
+    ],
+)
+def test_role_change_or_deactivation_revokes_the_sessions(
+    monkeypatch, fake_session, role_after, user_data, revoked
+):
+    revoked_users = []
+
+    class RecordingRefreshTokenService:
+        def __init__(self, session):
+            pass
+
+        async def revoke_user(self, user_id):
+            revoked_users.append(user_id)
+
+    monkeypatch.setattr(
+        users_service_module, "RefreshTokenService", RecordingRefreshTokenService
+    )
+    service = UserService(fake_session)
+    service.repository = FakeUserRepository(EnumUserRoles.OWNER, role_after)
+
+    asyncio.run(service.update_user(7, user_data))
+    assert revoked_users == revoked
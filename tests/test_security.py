@@ -0,0 +1,120 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+import api.core.security as security
+import api.src.refresh_tokens.revocation as revocation
+from api.core.security import Principal, create_access_token, get_current_user
+from api.src.enums import EnumUserRoles
+from api.src.refresh_tokens.revocation import RevokedSessions
+
+REVOKED_AT = datetime(2026, 10, 1, 12, tzinfo=timezone.utc)
+
+
+class FakeRepository:
+    """Answers revocation queries from a list of revoked sessions."""
+
+    revoked: list = []
+    calls: list = []
+
+    def __init__(self, session):
+        pass
+
+    async def get_revoked_sessions(self, since=None):
+        FakeRepository.calls.append(("load", since))
+        return [
+            row for row in self.revoked if since is None or row.revoked_at >= since
+        ]
+
+    async def is_session_revoked(self, session_id):
+        FakeRepository.calls.append(("check", session_id))
+        return any(row.session_id == session_id for row in self.revoked)
+
+
+@pytest.fixture
+def sessions(monkeypatch, fake_session, clock):
+    FakeRepository.revoked, FakeRepository.calls = [], []
+    monkeypatch.setattr(revocation, "async_session", lambda: fake_session)
+    monkeypatch.setattr(revocation, "RefreshTokenRepository", FakeRepository)
+    sessions = RevokedSessions(5, 3600, 0.001, timer=clock)
+    sessions.clock = clock
+    monkeypatch.setattr(security, "revoked_sessions", sessions)
+    return sessions
+
+
+def revoke(session_id: str, revoked_at: datetime = REVOKED_AT) -> None:
+    FakeRepository.revoked.append(
+        SimpleNamespace(session_id=session_id, revoked_at=revoked_at)
+    )
+
+
+def authenticate(**claims) -> Principal:
+    claims = {"sub": "5", "role": "owner", "email": "owner@example.com", **claims}
+    return asyncio.run(get_current_user(create_access_token(claims)))
+
+
+def test_principal_is_read_from_the_token(sessions):
+    principal = authenticate(sid="a1")
+    assert principal == Principal(5, EnumUserRoles.OWNER, "owner@example.com", "a1")
+
+    authenticate(sid="a1")
+    assert FakeRepository.calls == [("load", None)]
+
+
+def test_token_without_session_or_expired_is_unauthorized(sessions):
+    for claims in ({}, {"sid": "a1", "role": "landlord"}):
+        with pytest.raises(HTTPException) as error:
+            authenticate(**claims)
+        assert error.value.status_code == 401
+
+    expired = create_access_token(
+        {"sub": "5", "role": "owner", "email": "e", "sid": "a1"},
+        expires_delta=timedelta(seconds=-1),
+    )
+    with pytest.raises(HTTPException):
+        asyncio.run(get_current_user(expired))
+
+
+def test_revoked_session_is_rejected_after_the_next_refresh(sessions):
+    authenticate(sid="a1")
+    revoke("a1")
+
+    sessions.clock.now = 4
+    assert authenticate(sid="a1").session_id == "a1"
+    sessions.clock.now = 5
+    with pytest.raises(HTTPException):
+        authenticate(sid="a1")
+    assert FakeRepository.calls == [
+        ("load", None),
+        ("load", None),
+        ("check", "a1"),
+    ]
+
+
+def test_revocations_are_loaded_incrementally(sessions):
+    revoke("a1")
+    asyncio.run(sessions.refresh())
+    revoke("b2", REVOKED_AT + timedelta(minutes=5))
+
+    sessions.clock.now = 5
+    asyncio.run(sessions.refresh())
+    assert FakeRepository.calls[-1] == (
+        "load",
+        REVOKED_AT - revocation.REVOCATION_OVERLAP,
+    )
+    assert asyncio.run(sessions.is_revoked("b2"))
+
+    sessions.clock.now = 3600
+    asyncio.run(sessions.refresh())
+    assert FakeRepository.calls[-1] == ("load", None)
+
+
+def test_sessions_revoked_locally_are_rejected_immediately(sessions):
+    authenticate(sid="a1")
+    revoke("a1")
+    sessions.add("a1")
+    with pytest.raises(HTTPException):
+        authenticate(sid="a1")
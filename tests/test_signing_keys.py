@@ -0,0 +1,70 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import ecdsa
+import pytest
+from fastapi import HTTPException
+from jose import jwt
+
+from api.core.security import create_access_token, get_current_user
+from api.core.signing_keys import KID_TIME_FORMAT, KeyRing, generate_key
+
+CLAIMS = {"sub": "5", "role": "owner", "email": "owner@example.com", "sid": "a1"}
+
+
+def write_key(directory, created_at: datetime) -> str:
+    kid = f"{created_at:{KID_TIME_FORMAT}}-test"
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{kid}.pem").write_bytes(
+        ecdsa.SigningKey.generate(curve=ecdsa.NIST256p).to_pem()
+    )
+    return kid
+
+
+def test_tokens_carry_the_kid_and_verify_with_the_jwks(signing_keys):
+    token = create_access_token(CLAIMS)
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == "ES256"
+
+    jwks = signing_keys.jwks()
+    assert [key["kid"] for key in jwks["keys"]] == [header["kid"]]
+    assert jwt.decode(token, jwks, algorithms=["ES256"])["sid"] == "a1"
+
+
+def test_replaced_key_stays_valid_for_the_grace_window(tmp_path):
+    now = datetime.now(timezone.utc)
+    old = write_key(tmp_path, now - timedelta(minutes=200))
+    previous = write_key(tmp_path, now - timedelta(minutes=120))
+    current = write_key(tmp_path, now - timedelta(minutes=10))
+    keys = KeyRing(tmp_path, "ES256", timedelta(minutes=60), reload_seconds=60)
+
+    assert keys.current().kid == current
+    assert keys.get(old) is None
+    assert keys.get(previous).retires_at == (
+        keys.get(current).created_at + timedelta(minutes=60)
+    )
+    assert [key["kid"] for key in keys.jwks()["keys"]] == [previous, current]
+
+
+def test_key_rotated_by_another_process_is_picked_up(tmp_path, clock):
+    keys = KeyRing(tmp_path, "ES256", timedelta(minutes=60), 60, timer=clock)
+    first = generate_key("ES256", tmp_path).stem
+    assert keys.current().kid == first
+
+    rotated = write_key(tmp_path, datetime.now(timezone.utc) + timedelta(seconds=1))
+    assert keys.current().kid == first
+
+    clock.now = 1
+    assert keys.get(rotated).kid == rotated
+    assert keys.current().kid == rotated
+
+
+def test_token_with_unknown_key_is_unauthorized(signing_keys, tmp_path):
+    other = KeyRing(tmp_path / "other", "ES256", timedelta(minutes=60), 60)
+    key = other.current()
+    token = jwt.encode(
+        CLAIMS, key.private_key, algorithm="ES256", headers={"kid": key.kid}
+    )
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(get_current_user(token))
+    assert error.value.status_code == 401